@@ -1,6 +1,7 @@
 from importlib.metadata import version
 from .sequence import (
-    Sequence, Polypeptide,
+    Sequence, Polypeptide, PackedSequence, SequenceView, SequenceBuilder,
+    SequenceBatch,
     clean, write_report,
     complement, reverse_complement,
     random_seq, random_fasta,
@@ -9,23 +10,27 @@ from .sequence import (
     translate_nt
 )
 from .io import (
-    read, read_fasta, read_fasta_iter, read_fastq, read_fastq_iter
+    read, read_fasta, read_fasta_iter, read_fastq, read_fastq_iter,
+    read_fastq_batches, FastaIndex
 )
 from .analysis import (
     at, gc, find_consensus, find_motifs, find_orfs, get_formula,
-    kmer, find_palindrome, calc_mass, sliding_gc
+    kmer, kmer_collection, kmer_spectrum, kmer_histogram, kmer_fastq,
+    find_palindrome, calc_mass, sliding_gc
 )
 from .bio import (
-    AnalysisResult, IntervalResult, KmerResult, SeqCollections,
-    SeqEntry, SeqInterval
+    AnalysisResult, IntervalResult, KmerResult, KmerArrayResult,
+    KmerHistResult, SeqCollections,
+    SeqEntry, SeqInterval, FastqBatch, LazySeqCollections
 )
 from .viz import (
-    plot_kmer, plot_motifs, plot_orfs, plot_sliding_gc
+    plot_kmer, plot_motifs, plot_orfs, plot_sliding_gc, plot_kmer_hist
 )
 
 
 __all__ = [
-    "Sequence", "Polypeptide",
+    "Sequence", "Polypeptide", "PackedSequence", "SequenceView",
+    "SequenceBuilder", "SequenceBatch",
     "clean", "write_report",
     "complement", "reverse_complement",
     "random_seq", "random_fasta",
@@ -33,10 +38,15 @@ __all__ = [
     "transcribe", "reverse_transcribe",
     "translate_nt",
     "read", "read_fasta", "read_fasta_iter", "read_fastq", "read_fastq_iter",
+    "read_fastq_batches", "FastaIndex",
     "at", "gc", "find_consensus", "find_motifs", "find_orfs", "get_formula",
-    "kmer", "find_palindrome", "calc_mass", "sliding_gc",
-    "AnalysisResult", "IntervalResult", "KmerResult", "SeqCollections",
-    "SeqEntry", "SeqInterval",
-    "plot_kmer", "plot_motifs", "plot_orfs", "plot_sliding_gc"
+    "kmer", "kmer_collection", "kmer_spectrum", "kmer_histogram",
+    "kmer_fastq", "find_palindrome", "calc_mass",
+    "sliding_gc",
+    "AnalysisResult", "IntervalResult", "KmerResult", "KmerArrayResult",
+    "KmerHistResult", "SeqCollections",
+    "SeqEntry", "SeqInterval", "FastqBatch", "LazySeqCollections",
+    "plot_kmer", "plot_motifs", "plot_orfs", "plot_sliding_gc",
+    "plot_kmer_hist"
 ]
 __version__ = version("omibio")
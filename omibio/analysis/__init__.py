@@ -4,7 +4,16 @@ from omibio.analysis.sliding_gc import sliding_gc
 from omibio.analysis.find_orfs import find_orfs
 from omibio.analysis.consensus import find_consensus
 from omibio.analysis.find_motif import find_motifs
-from omibio.analysis.kmer import kmer
+from omibio.analysis.kmer import kmer, kmer_collection
+from omibio.analysis.kmer_partition import (
+    kmer_partitioned, iter_kmer_partitions
+)
+from omibio.analysis.kmer_sketch import (
+    kmer_approximate, CountMinSketch, SpaceSaving
+)
+from omibio.analysis.kmer_spectrum import kmer_spectrum, spectrum_labels
+from omibio.analysis.kmer_histogram import kmer_histogram
+from omibio.analysis.kmer_quality import kmer_fastq
 from omibio.analysis.protein_mass import calc_mass
 from omibio.analysis.palindrome import find_palindrome
 from omibio.analysis.get_formula import get_formula
@@ -17,6 +26,16 @@ __all__ = [
     "find_consensus",
     "find_motifs",
     "kmer",
+    "kmer_collection",
+    "kmer_partitioned",
+    "iter_kmer_partitions",
+    "kmer_approximate",
+    "CountMinSketch",
+    "SpaceSaving",
+    "kmer_spectrum",
+    "spectrum_labels",
+    "kmer_histogram",
+    "kmer_fastq",
     "calc_mass",
     "find_palindrome",
     "get_formula"
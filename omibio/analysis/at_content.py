@@ -1,23 +1,32 @@
+import numpy as np
 from omibio.sequence.sequence import Sequence
+from omibio.sequence.sequence_batch import SequenceBatch
 from omibio.utils import to_percentage
 
 
-def at(seq: Sequence | str, percent: bool = False) -> float | str:
+def at(
+    seq: Sequence | str | SequenceBatch, percent: bool = False
+) -> float | str | np.ndarray | list[str]:
     """Calculate the AT content of a sequence.
 
     Args:
-        seq (Sequence | str):
-            input sequence
+        seq (Sequence | str | SequenceBatch):
+            input sequence, or a batch of sequences
         percent (bool, optional):
             If True, return AT content as a percentage string.
             Defaults to False.
 
     Returns:
-        float | str: AT content as a float or percentage string.
+        float | str | np.ndarray | list[str]:
+            AT content as a float or percentage string, or an array
+            (list of strings) with one value per record for a batch.
     """
+    if isinstance(seq, SequenceBatch):
+        return seq.at_content(percent=percent)
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
-            "at() argument 'seq' must be Sequence or str, not "
+            "at() argument 'seq' must be Sequence, str or SequenceBatch, "
+            "not "
             + type(seq).__name__
         )
     if isinstance(seq, Sequence):
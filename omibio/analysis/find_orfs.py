@@ -4,9 +4,14 @@ from omibio.sequence.seq_utils.translate import translate_nt
 from omibio.viz.plot_orfs import plot_orfs
 from omibio.utils import within_range
 from typing import Iterable, Union
+import numpy as np
 
 STOP_CODONS = {"TAA", "TAG", "TGA"}
 
+# Byte complement table, the same pairs as Sequence.reverse_complement().
+_COMPLEMENT = np.arange(256, dtype=np.uint8)
+_COMPLEMENT[list(b"ATCGRYKMBVDHSWN")] = list(b"TAGCYRMKVBHDSWN")
+
 
 def find_orfs_in_frame(
     seq: str,
@@ -63,6 +68,114 @@ def find_orfs_in_frame(
     return orf_list
 
 
+def _codon_keys(codons: Iterable[str]) -> np.ndarray:
+    """Internal helper. Pack ASCII codons like _codon_keys_of() does."""
+    raw = [codon.encode() for codon in codons if codon.isascii()]
+    return np.array(
+        [(a << 16) | (b << 8) | c for a, b, c in raw], dtype=np.int32
+    )
+
+
+def _codon_keys_of(raw: np.ndarray) -> np.ndarray:
+    """Internal helper. Pack the codon starting at every position of a
+    uint8 sequence into one int32 key, for all three frames at once.
+    """
+    if len(raw) < 3:
+        return np.empty(0, dtype=np.int32)
+    wide = raw.astype(np.int32)
+    return (wide[:-2] << 16) | (wide[1:-1] << 8) | wide[2:]
+
+
+def _scan_frame(
+    keys: np.ndarray,
+    frame: int,
+    start_keys: np.ndarray,
+    stop_keys: np.ndarray,
+    min_length: int,
+    max_length: int,
+    overlap: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Internal helper. Vectorized find_orfs_in_frame() on codon keys.
+
+    Each start codon is paired with the next in-frame stop codon by
+    np.searchsorted; without overlap only the first start before each
+    stop is kept. Returns the ORF starts and ends in the order
+    find_orfs_in_frame() reports them.
+    """
+    in_frame = keys[frame::3]
+    is_stop = np.isin(in_frame, stop_keys)
+    stops = np.flatnonzero(is_stop)
+    starts = np.flatnonzero(np.isin(in_frame, start_keys) & ~is_stop)
+
+    next_stop = np.searchsorted(stops, starts)
+    keep = next_stop < len(stops)
+    if not overlap and len(starts):
+        keep[1:] &= next_stop[1:] != next_stop[:-1]
+    starts, next_stop = starts[keep], next_stop[keep]
+
+    begin = frame + 3 * starts
+    end = frame + 3 * stops[next_stop] + 3
+    length = end - begin
+    # Same bounds as within_range(): a zero bound is no bound.
+    keep = np.ones(len(begin), dtype=bool)
+    if min_length:
+        keep &= length >= min_length
+    if max_length:
+        keep &= length <= max_length
+    return begin[keep], end[keep]
+
+
+def _find_orfs_slow(
+    seq: Sequence,
+    min_length: int,
+    max_length: int,
+    overlap: bool,
+    include_reverse: bool,
+    translate: bool,
+    start_codons: set[str],
+    seq_id: str | None,
+    frames: set[int],
+    str_seq: bool
+) -> list[SeqInterval]:
+    """Internal helper. Scan all frames codon by codon with
+    find_orfs_in_frame(), for sequences that are not plain ASCII.
+    """
+    seq_length = len(seq)
+    results = []
+
+    for frame in frames:
+        results.extend(
+            find_orfs_in_frame(
+                seq.sequence, min_length=min_length, max_length=max_length,
+                overlap=overlap, strand='+', frame=frame, translate=translate,
+                start_codons=start_codons, seq_id=seq_id,
+                str_seq=str_seq
+            )
+        )
+
+    if include_reverse:
+        rev_seq = seq.reverse_complement()
+        for frame in frames:
+            rev_orfs = find_orfs_in_frame(
+                rev_seq.sequence, min_length=min_length, max_length=max_length,
+                overlap=overlap, strand='-', frame=frame, translate=translate,
+                start_codons=start_codons, seq_id=seq_id,
+                str_seq=str_seq
+                )
+            for orf in rev_orfs:
+                results.append(
+                    SeqInterval(
+                        start=seq_length - orf.end,
+                        end=seq_length - orf.start,
+                        nt_seq=orf.nt_seq, type='ORF',
+                        strand='-', frame=frame+1,
+                        aa_seq=orf.aa_seq, seq_id=seq_id
+                    )
+                )
+
+    return results
+
+
 def find_orfs(
     seq: Sequence | str,
     min_length: int = 100,
@@ -78,6 +191,10 @@ def find_orfs(
 ) -> IntervalResult:
     """Find ORFs in a given sequence.
 
+    The sequence is encoded once and the codons of all frames and both
+    strands are matched with NumPy; each start codon is paired with the
+    next in-frame stop codon by np.searchsorted.
+
     Args:
         seq (Sequence | str):
             Input sequence.
@@ -183,37 +300,49 @@ def find_orfs(
             )
 
     seq_length = len(seq)
-    results = []
-
-    for frame in frames:
-        results.extend(
-            find_orfs_in_frame(
-                seq.sequence, min_length=min_length, max_length=max_length,
-                overlap=overlap, strand='+', frame=frame, translate=translate,
-                start_codons=validated_start_codons, seq_id=seq_id,
-                str_seq=str_seq
-            )
+    seq_str = seq.sequence
+    if not seq_str.isascii():
+        results = _find_orfs_slow(
+            seq, min_length, max_length, overlap, include_reverse, translate,
+            validated_start_codons, seq_id, frames, str_seq
         )
+    else:
+        results = []
+        start_keys = _codon_keys(validated_start_codons)
+        stop_keys = _codon_keys(STOP_CODONS)
+        raw = np.frombuffer(seq_str.encode(), dtype=np.uint8)
+        strands = [("+", raw)]
+        if include_reverse:
+            strands.append(("-", _COMPLEMENT[raw][::-1]))
 
-    if include_reverse:
-        rev_seq = seq.reverse_complement()
-        for frame in frames:
-            rev_orfs = find_orfs_in_frame(
-                rev_seq.sequence, min_length=min_length, max_length=max_length,
-                overlap=overlap, strand='-', frame=frame, translate=translate,
-                start_codons=validated_start_codons, seq_id=seq_id,
-                str_seq=str_seq
+        for strand, strand_raw in strands:
+            keys = _codon_keys_of(strand_raw)
+            strand_str = seq_str
+            if strand == "-" and (translate or str_seq):
+                strand_str = strand_raw.tobytes().decode()
+            for frame in frames:
+                begins, ends = _scan_frame(
+                    keys, frame, start_keys, stop_keys, min_length,
+                    max_length, overlap
                 )
-            for orf in rev_orfs:
-                results.append(
-                    SeqInterval(
-                        start=seq_length - orf.end,
-                        end=seq_length - orf.start,
-                        nt_seq=orf.nt_seq, type='ORF',
-                        strand='-', frame=frame+1,
-                        aa_seq=orf.aa_seq, seq_id=seq_id
+                for begin, end in zip(begins.tolist(), ends.tolist()):
+                    nt_seq = (
+                        strand_str[begin: end]
+                        if translate or str_seq else None
+                    )
+                    aa_seq = (
+                        str(translate_nt(nt_seq, stop_symbol=False))
+                        if translate else None
+                    )
+                    if strand == "-":
+                        begin, end = seq_length - end, seq_length - begin
+                    results.append(
+                        SeqInterval(
+                            start=begin, end=end, nt_seq=nt_seq, type='ORF',
+                            strand=strand, frame=frame+1, aa_seq=aa_seq,
+                            seq_id=seq_id
+                        )
                     )
-                )
 
     if sort_by_length:
         results.sort(key=lambda orf: orf.length, reverse=True)
@@ -1,23 +1,32 @@
+import numpy as np
 from omibio.sequence.sequence import Sequence
+from omibio.sequence.sequence_batch import SequenceBatch
 from omibio.utils import to_percentage
 
 
-def gc(seq: Sequence | str, percent: bool = False) -> float | str:
+def gc(
+    seq: Sequence | str | SequenceBatch, percent: bool = False
+) -> float | str | np.ndarray | list[str]:
     """Calculate the GC content of a sequence.
 
     Args:
-        seq (Sequence | str):
-            input sequence
+        seq (Sequence | str | SequenceBatch):
+            input sequence, or a batch of sequences
         percent (bool, optional):
             If True, return GC content as a percentage string.
             Defaults to False.
 
     Returns:
-        float | str: GC content as a float or percentage string.
+        float | str | np.ndarray | list[str]:
+            GC content as a float or percentage string, or an array
+            (list of strings) with one value per record for a batch.
     """
+    if isinstance(seq, SequenceBatch):
+        return seq.gc_content(percent=percent)
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
-            "gc() argument 'seq' must be Sequence or str, not "
+            "gc() argument 'seq' must be Sequence, str or SequenceBatch, "
+            "not "
             + type(seq).__name__
         )
     if isinstance(seq, Sequence):
@@ -1,8 +1,149 @@
 from omibio.sequence.sequence import Sequence, Polypeptide
 from omibio.bio import KmerResult
-from collections import Counter
-from omibio.sequence.seq_utils.complement import reverse_complement
+from omibio.encoding import (
+    INVALID, MAX_CODE_K, as_bytes, encode_table,
+    kmer_codes, count_codes, decode_kmers
+)
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from omibio.viz import plot_kmer
+from typing import TYPE_CHECKING, Iterable, Iterator
+import numpy as np
+if TYPE_CHECKING:
+    from omibio.bio import SeqCollections, SeqEntry, LazySeqCollections
+
+_DNA_REV_COMP = str.maketrans("ATCGRYKMBVDHSWN", "TAGCYRMKVBHDSWN")
+_RNA_REV_COMP = str.maketrans("AUCGRYKMBVDHSWN", "UAGCYRMKVBHDSWN")
+
+
+def _canonical_str(kmer_seq: str) -> str:
+    """Return min(kmer_seq, reverse complement) without a Sequence."""
+    table = _RNA_REV_COMP if "U" in kmer_seq else _DNA_REV_COMP
+    return min(kmer_seq, kmer_seq.translate(table)[::-1])
+
+
+def _same_str(kmer_seq: str) -> str:
+    return kmer_seq
+
+
+def _encoded_counts(
+    seq_str: str, k: int, canonical: bool, offset: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, bool, dict[str, list[int]]]:
+    """Internal helper. Count the k-mers of one upper-case sequence.
+
+    Windows made only of ACGT (or ACGU) are counted as integer codes;
+    the few windows touching other characters (every window if
+    k > MAX_CODE_K) are sliced as strings.
+
+    Returns:
+        tuple:
+            Distinct codes, their counts and first window index (plus
+            offset), whether the codes spell U instead of T, and a dict
+            of {kmer: [first index, count]} for the string windows.
+    """
+    n_windows = len(seq_str) - k + 1
+    empty = np.empty(0, dtype=np.int64)
+    get_canonical = _canonical_str if canonical else _same_str
+    if k > MAX_CODE_K:
+        other: dict[str, list[int]] = {}
+        for i in range(max(n_windows, 0)):
+            key = get_canonical(seq_str[i: i + k])
+            if key in other:
+                other[key][1] += 1
+            else:
+                other[key] = [offset + i, 1]
+        return empty.astype(np.uint64), empty, empty, False, other
+
+    codes, rna = _two_bit(seq_str)
+    kcodes, valid = kmer_codes(codes, k, canonical=canonical)
+    uniq, counts, first, other = _window_counts(
+        seq_str, k, kcodes, valid, canonical, offset
+    )
+    return uniq, counts, first, rna, other
+
+
+def _two_bit(seq_str: str) -> tuple[np.ndarray, bool]:
+    """Internal helper. Encode an upper-case sequence into 2-bit codes.
+
+    Returns the codes and whether they spell U instead of T.
+    """
+    raw = as_bytes(seq_str)
+    rna = "U" in seq_str and "T" not in seq_str
+    # T and U share a 2-bit code; only one of them can round-trip.
+    codes = np.where(
+        raw == ord("T" if rna else "U"), INVALID, encode_table("2bit")[raw]
+    )
+    return codes, rna
+
+
+def _window_counts(
+    seq_str: str,
+    k: int,
+    kcodes: np.ndarray,
+    valid: np.ndarray,
+    canonical: bool,
+    offset: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, list[int]]]:
+    """Internal helper. Count the windows of a sequence given its k-mer
+    codes, see _encoded_counts().
+    """
+    pos = np.flatnonzero(valid)
+    uniq, counts, first = count_codes(kcodes[pos], k, first_index=True)
+    first = pos[first] + offset
+
+    other: dict[str, list[int]] = {}
+    if len(pos) < len(valid):
+        get_canonical = _canonical_str if canonical else _same_str
+        for i in np.flatnonzero(~valid).tolist():
+            key = get_canonical(seq_str[i: i + k])
+            if key in other:
+                other[key][1] += 1
+            else:
+                other[key] = [offset + i, 1]
+    return uniq, counts, first, other
+
+
+def _ordered_counter(
+    parts: list[tuple[list[int], list[str], list[int]]],
+    other: dict[str, list[int]]
+) -> Counter:
+    """Internal helper. Build a Counter in first-occurrence order from
+    (first, names, counts) parts and string-counted windows.
+    """
+    result: Counter = Counter()
+    if len(parts) == 1 and not other:
+        dict.update(result, zip(parts[0][1], parts[0][2]))
+        return result
+    merged = sorted(
+        [*(row for part in parts for row in zip(*part)),
+         *((i, key, c) for key, (i, c) in other.items())]
+    )
+    # k-mers without T or U get the same key from DNA and RNA parts.
+    for _, key, c in merged:
+        result[key] += c
+    return result
+
+
+def _count_encoded(
+    seq_str: str, k: int, canonical: bool, counted: tuple | None = None
+) -> Counter:
+    """Count k-mers with the vectorized 2-bit engine.
+
+    Keys come out in first-occurrence order, as with plain slicing.
+    Canonical keys are only decoded from their codes at the end.
+    counted may hold the _encoded_counts() output if already known.
+    """
+    if counted is None:
+        counted = _encoded_counts(seq_str, k, canonical)
+    uniq, counts, first, rna, other = counted
+    order = np.argsort(first)
+    first = first[order].tolist()
+    if canonical:
+        names = decode_kmers(uniq[order], k, rna=rna)
+    else:
+        # Slicing at the first occurrence is cheaper than decoding.
+        names = [seq_str[i: i + k] for i in first]
+    return _ordered_counter([(first, names, counts[order].tolist())], other)
 
 
 def kmer(
@@ -11,9 +152,23 @@ def kmer(
     seq_id: str | None = None,
     canonical: bool = False,
     min_count: int = 1,
+    approximate: bool = False,
+    top: int | None = None
 ) -> KmerResult:
     """Count k-mers in a given sequence.
 
+    For k <= 32, windows of ACGT (or ACGU) bases are counted as 2-bit
+    integer codes: with np.bincount into a dense 4**k array up to k = 12
+    and with sort-and-unique above. Windows that touch other characters
+    are still counted as strings, so the result is the same as slicing
+    every window. Canonical codes are the minimum of the forward and
+    reverse complement codes, rolled side by side; for RNA input the
+    canonical keys are spelled with U.
+
+    With approximate, only the top k-mers are estimated in constant
+    memory with a count-min sketch and a Space-Saving summary, see
+    kmer_approximate(); the error bounds are reported in the metadata.
+
     Args:
         seq (Sequence | str | Polypeptide):
             Input sequence to analyze.
@@ -27,6 +182,12 @@ def kmer(
         min_count (int, optional):
             Minimum count threshold for k-mers to include in the result.
             Defaults to 1.
+        approximate (bool, optional):
+            Whether to estimate the top k-mers in constant memory instead
+            of counting every k-mer exactly. Defaults to False.
+        top (int | None, optional):
+            Only keep this many most frequent k-mers, largest first.
+            Defaults to all, or 100 if approximate.
 
     Raises:
         TypeError:
@@ -40,26 +201,14 @@ def kmer(
             If k is not a positive integer.
         ValueError:
             If min_count is negative.
+        ValueError:
+            If top is not positive.
 
     Returns:
         KmerResult:
             An object containing k-mer counts.
     """
 
-    if canonical:
-        cache: dict[str, str] = {}
-
-        def get_canonical(kmer_seq):
-            if kmer_seq in cache:
-                return cache[kmer_seq]
-            rc = reverse_complement(kmer_seq, as_str=True)
-            canon = min(kmer_seq, rc)
-            cache[kmer_seq] = cache[rc] = canon
-            return canon
-    else:
-        def get_canonical(kmer_seq):
-            return kmer_seq
-
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
             "kmer() argument 'seq' must be Sequence or str, got "
@@ -83,6 +232,20 @@ def kmer(
             "kmer() argument 'min_count' must be a non-negative number, got "
             + str(min_count)
         )
+    if top is not None and not isinstance(top, int):
+        raise TypeError(
+            f"kmer() argument 'top' must be int, got {type(top).__name__}"
+        )
+    if top is not None and top < 1:
+        raise ValueError(
+            f"kmer() argument 'top' must be a positive number, got {top}"
+        )
+    if approximate:
+        from omibio.analysis.kmer_sketch import kmer_approximate
+        return kmer_approximate(
+            seq, k, seq_id=seq_id, canonical=canonical,
+            min_count=min_count, top=100 if top is None else top
+        )
 
     seq_str = str(seq).upper()
     n = len(seq_str)
@@ -99,14 +262,20 @@ def kmer(
 
     kmer_counter: dict = Counter()
 
-    for i in range(n - k + 1):
-        curr_kmer = seq_str[i: i+k]
-        kmer_counter[get_canonical(curr_kmer)] += 1
+    if k <= MAX_CODE_K:
+        kmer_counter = _count_encoded(seq_str, k, canonical)
+    else:
+        get_canonical = _canonical_str if canonical else _same_str
+        for i in range(n - k + 1):
+            curr_kmer = seq_str[i: i+k]
+            kmer_counter[get_canonical(curr_kmer)] += 1
 
     if min_count > 1:
         kmer_counter = Counter(
             {kmer: c for kmer, c in kmer_counter.items() if c >= min_count}
         )
+    if top is not None:
+        kmer_counter = Counter(dict(kmer_counter.most_common(top)))
     return KmerResult(
         k=k, counts=kmer_counter, seq_id=seq_id,
         type="kmer", plot_func=plot_kmer,
@@ -117,6 +286,248 @@ def kmer(
     )
 
 
+def _merge_codes(
+    parts: list[tuple[np.ndarray, np.ndarray, np.ndarray]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Internal helper. Sum (codes, counts, first) parts by code, keeping
+    the smallest first index.
+    """
+    parts = [part for part in parts if len(part[0])]
+    if not parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty.astype(np.uint64), empty, empty
+    if len(parts) == 1:
+        return parts[0]
+    uniq, inverse = np.unique(
+        np.concatenate([part[0] for part in parts]), return_inverse=True
+    )
+    counts = np.zeros(len(uniq), dtype=np.int64)
+    np.add.at(counts, inverse, np.concatenate([part[1] for part in parts]))
+    first = np.full(len(uniq), np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(
+        first, inverse, np.concatenate([part[2] for part in parts])
+    )
+    return uniq, counts, first
+
+
+def _count_chunk(
+    records: list[tuple[int, str]], k: int, canonical: bool
+) -> tuple[dict[bool, tuple], dict[str, list[int]]]:
+    """Internal helper. Count the k-mers of (offset, sequence) records,
+    possibly in a worker process.
+
+    The records are encoded into one buffer and counted with a single
+    count_codes() call per spelling; windows that would run across a
+    record boundary are masked out.
+
+    Returns the merged (codes, counts, first) arrays keyed by whether the
+    codes spell U, and the string-counted windows.
+    """
+    other: dict[str, list[int]] = {}
+    if k > MAX_CODE_K or not records:
+        parts: dict[bool, list] = {False: [], True: []}
+        for offset, seq_str in records:
+            uniq, counts, first, rna, rec_other = _encoded_counts(
+                seq_str, k, canonical, offset
+            )
+            parts[rna].append((uniq, counts, first))
+            for key, (i, c) in rec_other.items():
+                if key in other:
+                    other[key][1] += c
+                else:
+                    other[key] = [i, c]
+        return {rna: _merge_codes(p) for rna, p in parts.items()}, other
+
+    # Records are consecutive in the input, so buffer index plus the
+    # first offset is the input offset.
+    base = records[0][0]
+    seq_all = "".join(seq_str for _, seq_str in records)
+    lengths = np.array([len(seq_str) for _, seq_str in records])
+    rec_rna = np.array(
+        ["U" in seq_str and "T" not in seq_str for _, seq_str in records]
+    )
+    raw = as_bytes(seq_all)
+    rna_at = np.repeat(rec_rna, lengths)
+    # T and U share a 2-bit code; only one of them can round-trip.
+    codes = np.where(
+        np.where(rna_at, raw == ord("T"), raw == ord("U")),
+        INVALID, encode_table("2bit")[raw]
+    )
+    kcodes, valid = kmer_codes(codes, k, canonical=canonical)
+    n_windows = len(valid)
+    ends = np.repeat(np.cumsum(lengths), lengths)[:n_windows]
+    inside = np.arange(n_windows) + k <= ends
+
+    counted = {}
+    for rna in (False, True):
+        pos = np.flatnonzero(valid & inside & (rna_at[:n_windows] == rna))
+        uniq, counts, first = count_codes(kcodes[pos], k, first_index=True)
+        counted[rna] = (uniq, counts, pos[first] + base)
+
+    get_canonical = _canonical_str if canonical else _same_str
+    for i in np.flatnonzero(~valid & inside).tolist():
+        key = get_canonical(seq_all[i: i + k])
+        if key in other:
+            other[key][1] += 1
+        else:
+            other[key] = [base + i, 1]
+    return counted, other
+
+
+def _record_chunks(
+    seqs: Iterable, chunk_size: int, stats: list[int]
+) -> Iterator[list[tuple[int, str]]]:
+    """Internal helper. Group records into chunks of about chunk_size
+    bases, tagging each with its offset in the concatenated input.
+    stats collects [number of records, number of bases].
+    """
+    from omibio.bio import SeqEntry
+
+    chunk: list[tuple[int, str]] = []
+    chunk_bases = 0
+    for record in seqs:
+        seq = record.seq if isinstance(record, SeqEntry) else record
+        if not isinstance(seq, (Sequence, str)):
+            raise TypeError(
+                "kmer_collection() records must be SeqEntry, Sequence or "
+                f"str holding nucleotides, got {type(seq).__name__}"
+            )
+        seq_str = str(seq).upper()
+        chunk.append((stats[1], seq_str))
+        stats[0] += 1
+        stats[1] += len(seq_str)
+        chunk_bases += len(seq_str)
+        if chunk_bases >= chunk_size:
+            yield chunk
+            chunk, chunk_bases = [], 0
+    if chunk:
+        yield chunk
+
+
+def kmer_collection(
+    seqs: "SeqCollections | LazySeqCollections | "
+          "Iterable[SeqEntry | Sequence | str]",
+    k: int,
+    seq_id: str | None = None,
+    canonical: bool = False,
+    min_count: int = 1,
+    workers: int = 1,
+    chunk_size: int = 1 << 20
+) -> KmerResult:
+    """Count k-mers in total over many sequences.
+
+    Records are grouped into chunks of about chunk_size bases and counted
+    with the same engine as kmer(), in a process pool if workers > 1.
+    Every chunk comes back as compact arrays of distinct codes and counts,
+    which are reduced with vectorized addition. The result holds the same
+    counts as summing kmer() over every record.
+
+    Args:
+        seqs (SeqCollections | LazySeqCollections |
+            Iterable[SeqEntry | Sequence | str]):
+            Input sequences, e.g. read_fasta_iter() output.
+        k (int):
+            Length of the k-mers to count.
+        seq_id (str | None, optional):
+            An optional identifier for the result. Defaults to None.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum count threshold for k-mers to include in the result.
+            Defaults to 1.
+        workers (int, optional):
+            Number of worker processes. Defaults to 1.
+        chunk_size (int, optional):
+            Approximate number of bases per task. Defaults to 1 MiB.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If k, min_count, workers or chunk_size is out of range.
+
+    Returns:
+        KmerResult:
+            An object containing the total k-mer counts.
+    """
+    for name, value in (
+        ("k", k), ("min_count", min_count),
+        ("workers", workers), ("chunk_size", chunk_size)
+    ):
+        if not isinstance(value, int):
+            raise TypeError(
+                f"kmer_collection() argument '{name}' must be int, got "
+                + type(value).__name__
+            )
+        if value < (0 if name == "min_count" else 1):
+            raise ValueError(
+                f"kmer_collection() argument '{name}' is out of range, got "
+                + str(value)
+            )
+
+    stats = [0, 0]
+    chunks = _record_chunks(seqs, chunk_size, stats)
+    parts: dict[bool, list] = {False: [], True: []}
+    other: dict[str, list[int]] = {}
+
+    def add_result(result) -> None:
+        chunk_parts, chunk_other = result
+        for rna, part in chunk_parts.items():
+            acc = parts[rna]
+            acc.append(part)
+            # Merge once the pending parts outgrow the running total, so
+            # every code is re-merged O(log n) times.
+            if sum(len(p[0]) for p in acc[1:]) >= len(acc[0][0]):
+                parts[rna] = [_merge_codes(acc)]
+        for key, (i, c) in chunk_other.items():
+            if key in other:
+                other[key][1] += c
+            else:
+                other[key] = [i, c]
+
+    if workers == 1:
+        for chunk in chunks:
+            add_result(_count_chunk(chunk, k, canonical))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(_count_chunk, chunk, k, canonical)
+                )
+                if len(pending) >= workers * 2:
+                    add_result(pending.popleft().result())
+            while pending:
+                add_result(pending.popleft().result())
+
+    ordered = []
+    for rna, acc in parts.items():
+        uniq, counts, first = _merge_codes(acc)
+        if not len(uniq):
+            continue
+        order = np.argsort(first)
+        ordered.append((
+            first[order].tolist(),
+            decode_kmers(uniq[order], k, rna=rna),
+            counts[order].tolist()
+        ))
+    kmer_counter = _ordered_counter(ordered, other)
+    if min_count > 1:
+        kmer_counter = Counter(
+            {kmer: c for kmer, c in kmer_counter.items() if c >= min_count}
+        )
+
+    return KmerResult(
+        k=k, counts=kmer_counter, seq_id=seq_id,
+        type="kmer", plot_func=plot_kmer,
+        metadata={
+            "seq_length": stats[1],
+            "n_seqs": stats[0],
+            "canonical": canonical
+        }
+    )
+
+
 def main():
     from omibio.io import read_fasta
     seq = read_fasta(
@@ -0,0 +1,257 @@
+from omibio.bio import KmerResult, KmerArrayResult, KmerHistResult
+from omibio.viz import plot_kmer_hist
+from typing import Iterable
+import numpy as np
+
+# How far from twice or half the main peak a second peak may sit.
+_PEAK_TOLERANCE = 0.25
+# A second peak lower than this share of the main one is ignored.
+_MIN_PEAK_RATIO = 0.05
+# Rounds of the two-Poisson fit that splits heterozygous k-mers.
+_FIT_ROUNDS = 50
+
+
+def _side_peak(
+    smooth: np.ndarray, target: float, main: int, lowest: int
+) -> int | None:
+    """Internal helper. Return a local maximum of the smoothed histogram
+    near target, or None.
+
+    The bins next to the main peak are left out of the search, since
+    they only hold its own shoulders.
+    """
+    lo = max(int(target * (1 - _PEAK_TOLERANCE)), lowest, 1)
+    hi = min(int(np.ceil(target * (1 + _PEAK_TOLERANCE))), len(smooth) - 2)
+    if target < main:
+        hi = min(hi, main - 2)
+    else:
+        lo = max(lo, main + 2)
+    if lo > hi:
+        return None
+    idx = lo + int(np.argmax(smooth[lo: hi + 1]))
+    if smooth[idx] < _MIN_PEAK_RATIO * smooth[main]:
+        return None
+    if smooth[idx] <= smooth[idx - 1] or smooth[idx] < smooth[idx + 1]:
+        return None
+    return idx
+
+
+def _mean_around(hist: np.ndarray, center: int) -> float:
+    """Internal helper. Mean abundance of a symmetric window around the
+    peak, re-centered until it settles; steadier than the mode.
+    """
+    mean = float(center)
+    for _ in range(5):
+        center = round(mean)
+        half = max(1, round(center * _PEAK_TOLERANCE))
+        lo, hi = max(center - half, 1), min(center + half, len(hist) - 1)
+        window = hist[lo: hi + 1]
+        if not window.sum():
+            break
+        mean = float((np.arange(lo, hi + 1) * window).sum() / window.sum())
+        if round(mean) == center:
+            break
+    return mean
+
+
+def _het_mass(body: np.ndarray, cutoff: int, coverage: float) -> float:
+    """Internal helper. Weighted number of heterozygous k-mers.
+
+    The solid bins up to twice the coverage are fitted as a mixture of a
+    Poisson at the homozygous coverage and one at half of it, so the
+    tail of the homozygous peak that reaches below it is not taken for
+    heterozygous k-mers.
+    """
+    hi = min(2 * round(coverage) + 1, len(body))
+    abundance = np.arange(cutoff, hi, dtype=np.float64)
+    kmers = body[cutoff: hi]
+    lam, share = coverage, 0.5
+    for _ in range(_FIT_ROUNDS):
+        # Log-odds of the homozygous over the heterozygous Poisson; the
+        # factorials cancel out.
+        log_odds = (
+            np.log1p(-share) - np.log(share)
+            + abundance * np.log(2) - lam / 2
+        )
+        het = kmers / (1 + np.exp(np.minimum(log_odds, 700)))
+        n_het = float(het.sum())
+        n_hom = float(kmers.sum()) - n_het
+        if not n_het or not n_hom:
+            break
+        share = n_het / (n_het + n_hom)
+        lam = float((abundance * kmers).sum()) / (n_het / 2 + n_hom)
+    return float((abundance * het).sum())
+
+
+def _summarize(
+    hist: np.ndarray, k: int | None
+) -> tuple[int | None, int | None, float | None, dict]:
+    """Internal helper. Find the error cutoff and peaks of a histogram and
+    estimate the genome size and heterozygosity.
+    """
+    max_count = len(hist) - 1
+    # The overflow bin is not a real abundance.
+    body = hist[:max_count].astype(np.float64)
+    rising = np.flatnonzero(body[2:] > body[1:-1]) + 1
+    if not len(rising):
+        return None, None, None, {"error_cutoff": None}
+    cutoff = int(rising[0])
+    peak = cutoff + int(np.argmax(body[cutoff:]))
+    if body[peak] == 0:
+        return None, None, None, {"error_cutoff": cutoff}
+
+    smooth = np.convolve(body, np.ones(3) / 3, mode="same")
+    het = hom = None
+    if (double := _side_peak(smooth, 2 * peak, peak, cutoff)) is not None:
+        het, hom = peak, double
+    elif (half := _side_peak(smooth, peak / 2, peak, cutoff)) is not None:
+        het, hom = half, peak
+    coverage = _mean_around(body, hom if hom is not None else peak)
+
+    weighted = np.arange(len(hist), dtype=np.float64) * hist
+    solid = float(weighted[cutoff:].sum())
+    genome_size = round(solid / coverage)
+    metadata = {
+        "error_cutoff": cutoff,
+        "coverage": round(coverage, 2),
+        "het_peak": het,
+        "solid_kmers": int(solid),
+    }
+
+    heterozygosity = None
+    if het is not None and genome_size:
+        # A pair of heterozygous k-mers adds up to one haploid position.
+        het_fraction = _het_mass(body, cutoff, coverage) / solid
+        metadata["het_kmer_fraction"] = het_fraction
+        if k is not None:
+            # Each heterozygous site is covered by k k-mers.
+            heterozygosity = 1 - (1 - het_fraction) ** (1 / k)
+    return peak, genome_size, heterozygosity, metadata
+
+
+def kmer_histogram(
+    counts: "KmerResult | np.ndarray | list[int] | "
+            "Iterable[np.ndarray | tuple[np.ndarray, np.ndarray]]",
+    k: int | None = None,
+    max_count: int = 10_000,
+    seq_id: str | None = None
+) -> KmerHistResult:
+    """Build a k-mer abundance histogram and summarize it.
+
+    The histogram is computed with np.bincount straight from integer
+    counts, so no k-mer string is ever built. Counts may come at once
+    (a KmerResult, an array or a list) or as a stream of arrays, e.g.
+    the (codes, counts) pairs yielded by iter_kmer_partitions().
+
+    The summary follows the usual k-mer spectrum reading: the first
+    trough ends the low-abundance error k-mers, the tallest bin after it
+    is the main peak, and a peak at half or twice its abundance marks
+    the heterozygous k-mers of a diploid genome. The genome size is the
+    number of solid k-mers divided by the homozygous coverage, and the
+    heterozygosity is the per-site rate that gives the observed share of
+    heterozygous k-mers, 1 - (1 - share) ** (1 / k). That share comes
+    from a two-Poisson fit of the two peaks, so the low tail of the
+    homozygous peak is not counted as heterozygous.
+
+    Args:
+        counts (KmerResult | np.ndarray | list[int] |
+            Iterable[np.ndarray | tuple[np.ndarray, np.ndarray]]):
+            k-mer counts, or an iterable of count arrays or
+            (codes, counts) pairs. A list is taken as one array.
+        k (int | None, optional):
+            Length of the k-mers, needed for the heterozygosity. Taken
+            from a KmerResult if not given. Defaults to None.
+        max_count (int, optional):
+            Last bin of the histogram, which also holds every higher
+            count. Defaults to 10000.
+        seq_id (str | None, optional):
+            An optional identifier for the result. Defaults to None.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If max_count is below 3, or a count is negative.
+
+    Returns:
+        KmerHistResult:
+            The histogram with its peak, genome size and heterozygosity;
+            the metadata holds the error cutoff, the homozygous coverage,
+            the heterozygous peak and the number of solid k-mers.
+    """
+    if not isinstance(max_count, int):
+        raise TypeError(
+            "kmer_histogram() argument 'max_count' must be int, got "
+            + type(max_count).__name__
+        )
+    if max_count < 3:
+        raise ValueError(
+            "kmer_histogram() argument 'max_count' must be at least 3, got "
+            + str(max_count)
+        )
+    if k is not None and not isinstance(k, int):
+        raise TypeError(
+            f"kmer_histogram() argument 'k' must be int, got "
+            f"{type(k).__name__}"
+        )
+
+    if isinstance(counts, KmerArrayResult):
+        k = counts.k if k is None else k
+        chunks: Iterable = [counts.code_counts]
+    elif isinstance(counts, KmerResult):
+        k = (counts.k or None) if k is None else k
+        chunks = [np.fromiter(counts.values(), dtype=np.int64)]
+    elif isinstance(counts, (np.ndarray, list)):
+        chunks = [counts]
+    elif isinstance(counts, Iterable) and not isinstance(counts, str):
+        chunks = counts
+    else:
+        raise TypeError(
+            "kmer_histogram() argument 'counts' must be KmerResult, "
+            f"np.ndarray or an iterable of arrays, got "
+            f"{type(counts).__name__}"
+        )
+
+    hist = np.zeros(max_count + 1, dtype=np.int64)
+    for chunk in chunks:
+        if isinstance(chunk, tuple):
+            chunk = chunk[-1]
+        chunk = np.asarray(chunk)
+        if not chunk.size:
+            continue
+        if not np.issubdtype(chunk.dtype, np.integer):
+            raise TypeError(
+                "kmer_histogram() counts must be integers, got "
+                + str(chunk.dtype)
+            )
+        if chunk.min() < 0:
+            raise ValueError("kmer_histogram() counts must not be negative")
+        hist += np.bincount(
+            np.minimum(chunk.ravel(), max_count).astype(np.intp),
+            minlength=max_count + 1
+        )
+
+    peak, genome_size, heterozygosity, metadata = _summarize(hist, k)
+    return KmerHistResult(
+        k=k, histogram=hist, peak=peak, genome_size=genome_size,
+        heterozygosity=heterozygosity, seq_id=seq_id, type="kmer_hist",
+        plot_func=plot_kmer_hist, metadata=metadata
+    )
+
+
+def main():
+    rng = np.random.default_rng(0)
+    # Errors, heterozygous k-mers at 15x and homozygous k-mers at 30x.
+    counts = np.concatenate([
+        rng.geometric(0.7, 200_000),
+        rng.poisson(15, 20_000),
+        rng.poisson(30, 480_000),
+    ])
+    result = kmer_histogram(counts, k=21, max_count=100)
+    print(repr(result))
+    print(result.metadata)
+    result.plot(show=True)
+
+
+if __name__ == "__main__":
+    main()
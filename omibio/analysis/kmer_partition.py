@@ -0,0 +1,402 @@
+from omibio.bio import KmerArrayResult
+from omibio.encoding import encode_table, kmer_codes, decode_kmers
+from omibio.analysis.kmer import _record_chunks
+from omibio.utils import check_if_exist
+from omibio.viz import plot_kmer
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from os import PathLike
+from typing import TYPE_CHECKING, Iterable, Iterator
+import tempfile
+import csv
+import numpy as np
+if TYPE_CHECKING:
+    from omibio.bio import SeqCollections, SeqEntry, LazySeqCollections
+    from omibio.sequence import Sequence
+
+# Fibonacci hashing spreads neighbouring codes over the partitions.
+_HASH_MULT = np.uint64(0x9E3779B97F4A7C15)
+_MAX_DEPTH = 3
+# Every split level takes its own hash bits, 3 * 16 <= 64.
+_MAX_PARTITIONS = 1 << 16
+_CODE_BYTES = 8
+# Sorting a partition needs the codes plus about three working copies.
+_SORT_FACTOR = 4
+
+
+def _track_spelling(seqs: Iterable, flags: list[bool]) -> Iterator:
+    """Internal helper. Pass records through, recording in flags whether
+    they hold T and U. Partitions are only yielded once every record is
+    spilled, so the flags are final by the time codes are decoded.
+    """
+    from omibio.bio import SeqEntry
+
+    for record in seqs:
+        seq = record.seq if isinstance(record, SeqEntry) else record
+        text = str(seq)
+        flags[0] = flags[0] or "T" in text or "t" in text
+        flags[1] = flags[1] or "U" in text or "u" in text
+        yield record
+
+
+def _partition_ids(
+    codes: np.ndarray, n_bits: int, depth: int
+) -> np.ndarray:
+    """Internal helper. Take bits [depth * n_bits, (depth+1) * n_bits)
+    from the top of the hashed codes.
+    """
+    hashed = codes * _HASH_MULT
+    shift = np.uint64(64 - n_bits * (depth + 1))
+    return ((hashed >> shift) & np.uint64((1 << n_bits) - 1)).astype(
+        np.intp
+    )
+
+
+class _Spiller:
+    """Internal helper. Append codes to partition files on disk, keeping at
+    most buffer_codes codes in memory.
+    """
+
+    def __init__(
+        self, paths: list[Path], n_bits: int, depth: int, buffer_codes: int
+    ):
+        self.paths = paths
+        self.n_bits = n_bits
+        self.depth = depth
+        self.buffer_codes = max(buffer_codes, 1)
+        self.buffers: list[list[np.ndarray]] = [[] for _ in paths]
+        self.buffered = 0
+
+    def add(self, codes: np.ndarray) -> None:
+        if not len(codes):
+            return
+        ids = _partition_ids(codes, self.n_bits, self.depth)
+        order = np.argsort(ids, kind="stable")
+        bounds = np.searchsorted(
+            ids[order], np.arange(len(self.paths) + 1)
+        )
+        codes = codes[order]
+        for i in np.flatnonzero(np.diff(bounds)).tolist():
+            self.buffers[i].append(codes[bounds[i]: bounds[i + 1]])
+        self.buffered += len(codes)
+        if self.buffered >= self.buffer_codes:
+            self.flush()
+
+    def flush(self) -> None:
+        for path, buffer in zip(self.paths, self.buffers):
+            if buffer:
+                with open(path, "ab") as f:
+                    for block in buffer:
+                        block.tofile(f)
+                buffer.clear()
+        self.buffered = 0
+
+
+def _count_file(
+    path: Path,
+    n_bits: int,
+    depth: int,
+    max_codes: int,
+    min_count: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Internal helper. Count one partition file and delete it, possibly
+    in a worker process, splitting it again if it does not fit in
+    max_codes.
+    """
+    try:
+        return _count_codes_file(path, n_bits, depth, max_codes, min_count)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _count_codes_file(
+    path: Path,
+    n_bits: int,
+    depth: int,
+    max_codes: int,
+    min_count: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    n_codes = path.stat().st_size // _CODE_BYTES
+    if n_codes <= max_codes:
+        uniq, counts = np.unique(
+            np.fromfile(path, dtype=np.uint64), return_counts=True
+        )
+        keep = counts >= min_count
+        return [(uniq[keep], counts[keep].astype(np.int64))]
+
+    if depth + 1 < _MAX_DEPTH:
+        sub_paths = [
+            path.with_name(f"{path.name}.{i}") for i in range(1 << n_bits)
+        ]
+        spiller = _Spiller(sub_paths, n_bits, depth + 1, max_codes)
+        for block in _read_blocks(path, max_codes):
+            spiller.add(block)
+        spiller.flush()
+        path.unlink()
+        results = []
+        for sub_path in sub_paths:
+            if sub_path.exists():
+                results.extend(_count_file(
+                    sub_path, n_bits, depth + 1, max_codes, min_count
+                ))
+        return results
+
+    # Few distinct but very frequent k-mers (e.g. poly-A) cannot be split
+    # by hashing; count block by block and merge the small tables.
+    uniq = np.empty(0, dtype=np.uint64)
+    counts = np.empty(0, dtype=np.int64)
+    for block in _read_blocks(path, max_codes):
+        block_uniq, block_counts = np.unique(block, return_counts=True)
+        uniq, inverse = np.unique(
+            np.concatenate((uniq, block_uniq)), return_inverse=True
+        )
+        merged = np.zeros(len(uniq), dtype=np.int64)
+        np.add.at(merged, inverse, np.concatenate((counts, block_counts)))
+        counts = merged
+    keep = counts >= min_count
+    return [(uniq[keep], counts[keep])]
+
+
+def _read_blocks(path: Path, n_codes: int) -> Iterator[np.ndarray]:
+    with open(path, "rb") as f:
+        while True:
+            block = np.fromfile(f, dtype=np.uint64, count=n_codes)
+            if not len(block):
+                return
+            yield block
+
+
+def iter_kmer_partitions(
+    seqs: "SeqCollections | LazySeqCollections | "
+          "Iterable[SeqEntry | Sequence | str]",
+    k: int,
+    canonical: bool = False,
+    min_count: int = 1,
+    max_memory: int = 1 << 30,
+    n_partitions: int = 64,
+    workers: int = 1,
+    tmp_dir: str | PathLike | None = None
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Count k-mers out of core and yield the counts one partition at a time.
+
+    k-mer codes are hashed into n_partitions spill files in a temporary
+    directory. Each file is then counted on its own, in a process pool if
+    workers > 1, and split again by further hash bits when it would not
+    fit in the memory budget. Every distinct k-mer belongs to exactly one
+    partition, so the yielded tables never overlap.
+
+    Only windows made of A, C, G and T (or U, counted as T) are counted.
+
+    Args:
+        seqs (SeqCollections | LazySeqCollections |
+            Iterable[SeqEntry | Sequence | str]):
+            Input sequences, e.g. read_fasta_iter() output.
+        k (int):
+            Length of the k-mers, at most 32.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum count threshold for k-mers to yield. Defaults to 1.
+        max_memory (int, optional):
+            Approximate peak memory budget in bytes for buffers and
+            counting, shared by the workers. Defaults to 1 GiB.
+        n_partitions (int, optional):
+            Number of spill files, rounded up to a power of two.
+            Defaults to 64.
+        workers (int, optional):
+            Number of worker processes counting partitions. Defaults to 1.
+        tmp_dir (str | PathLike | None, optional):
+            Where to create the spill directory. Defaults to the system
+            temporary directory.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If an argument is out of range.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]:
+            uint64 k-mer codes (see omibio.encoding.kmer_codes) and their
+            int64 counts, sorted by code within each partition.
+    """
+    for name, value in (
+        ("k", k), ("min_count", min_count), ("max_memory", max_memory),
+        ("n_partitions", n_partitions), ("workers", workers)
+    ):
+        if not isinstance(value, int):
+            raise TypeError(
+                f"iter_kmer_partitions() argument '{name}' must be int, got "
+                + type(value).__name__
+            )
+    if not 0 < k <= 32:
+        raise ValueError(
+            f"iter_kmer_partitions() argument 'k' must be 1 to 32, got {k}"
+        )
+    if min_count < 0 or max_memory <= 0 or workers < 1:
+        raise ValueError(
+            "iter_kmer_partitions() arguments 'min_count', 'max_memory' "
+            "and 'workers' must be positive"
+        )
+    if not 1 <= n_partitions <= _MAX_PARTITIONS:
+        raise ValueError(
+            "iter_kmer_partitions() argument 'n_partitions' must be 1 to "
+            f"{_MAX_PARTITIONS}, got {n_partitions}"
+        )
+
+    n_bits = max(1, (n_partitions - 1).bit_length())
+    # Half of the budget buffers spilled codes; while counting, each
+    # worker gets an equal share of the whole budget.
+    buffer_codes = max_memory // 2 // _CODE_BYTES
+    max_codes = max(1, max_memory // workers // _CODE_BYTES // _SORT_FACTOR)
+    table = encode_table("2bit")
+
+    with tempfile.TemporaryDirectory(
+        prefix="omibio_kmer_", dir=tmp_dir
+    ) as tmp:
+        paths = [Path(tmp, f"part_{i:05d}") for i in range(1 << n_bits)]
+        spiller = _Spiller(paths, n_bits, 0, buffer_codes)
+        # Long records are encoded in overlapping pieces so that the
+        # window arrays stay within the buffer budget.
+        piece = max(1, min(buffer_codes // _SORT_FACTOR, 1 << 24))
+        for chunk in _record_chunks(seqs, 1, [0, 0]):
+            for _, seq_str in chunk:
+                for start in range(0, len(seq_str) - k + 1, piece):
+                    raw = np.frombuffer(
+                        seq_str[start: start + piece + k - 1].encode(),
+                        dtype=np.uint8
+                    )
+                    codes, valid = kmer_codes(table[raw], k, canonical)
+                    spiller.add(codes[valid])
+        spiller.flush()
+        paths = [path for path in paths if path.exists()]
+
+        if workers == 1:
+            for path in paths:
+                yield from _count_file(path, n_bits, 0, max_codes, min_count)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            todo = iter(paths)
+            for path in todo:
+                pending.append(executor.submit(
+                    _count_file, path, n_bits, 0, max_codes, min_count
+                ))
+                if len(pending) >= workers:
+                    break
+            while pending:
+                results = pending.popleft().result()
+                for path in todo:
+                    pending.append(executor.submit(
+                        _count_file, path, n_bits, 0, max_codes, min_count
+                    ))
+                    break
+                yield from results
+
+
+def kmer_partitioned(
+    seqs: "SeqCollections | LazySeqCollections | "
+          "Iterable[SeqEntry | Sequence | str]",
+    k: int,
+    seq_id: str | None = None,
+    canonical: bool = False,
+    min_count: int = 1,
+    max_memory: int = 1 << 30,
+    n_partitions: int = 64,
+    workers: int = 1,
+    tmp_dir: str | PathLike | None = None,
+    output: str | PathLike | None = None,
+    sep: str = "\t"
+) -> KmerArrayResult | None:
+    """Count k-mers in total over many sequences with disk partitioning.
+
+    See iter_kmer_partitions() for the counting. Unlike kmer_collection(),
+    only windows made of A, C, G and T (or U, counted as T) are counted;
+    windows with N or other IUPAC codes are skipped. Keys are spelled
+    with U if the input holds U but no T. Without output, the counts are
+    collected into a KmerArrayResult, sorted by k-mer; with output, they
+    are streamed to a table in the KmerResult.to_csv() format instead,
+    so peak memory stays within max_memory however many distinct k-mers
+    there are, grouped by partition.
+
+    Args:
+        seqs (SeqCollections | LazySeqCollections |
+            Iterable[SeqEntry | Sequence | str]):
+            Input sequences, e.g. read_fasta_iter() output.
+        k (int):
+            Length of the k-mers, at most 32.
+        seq_id (str | None, optional):
+            An optional identifier for the result. Defaults to None.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum count threshold for k-mers. Defaults to 1.
+        max_memory (int, optional):
+            Approximate peak memory budget in bytes. Defaults to 1 GiB.
+        n_partitions (int, optional):
+            Number of spill files. Defaults to 64.
+        workers (int, optional):
+            Number of worker processes. Defaults to 1.
+        tmp_dir (str | PathLike | None, optional):
+            Where to create the spill directory. Defaults to None.
+        output (str | PathLike | None, optional):
+            Path of a table to stream the counts to. Defaults to None.
+        sep (str, optional):
+            Separator of the output table. Defaults to "\\t".
+
+    Returns:
+        KmerArrayResult | None:
+            The counts, or None if they were written to output.
+    """
+    flags = [False, False]
+    parts = iter_kmer_partitions(
+        _track_spelling(seqs, flags), k, canonical=canonical,
+        min_count=min_count, max_memory=max_memory,
+        n_partitions=n_partitions, workers=workers, tmp_dir=tmp_dir
+    )
+    if output is None:
+        code_parts, count_parts = [], []
+        for codes, part_counts in parts:
+            code_parts.append(codes)
+            count_parts.append(part_counts)
+        empty = np.empty(0, dtype=np.int64)
+        return KmerArrayResult(
+            k,
+            np.concatenate([empty.astype(np.uint64), *code_parts]),
+            np.concatenate([empty, *count_parts]),
+            seq_id=seq_id, type="kmer", plot_func=plot_kmer,
+            metadata={
+                "canonical": canonical,
+                "partitioned": True
+            },
+            rna=flags[1] and not flags[0]
+        )
+
+    name = check_if_exist(seq_id)
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter=sep)
+        writer.writerow(["seq_id", "k", "kmer", "count"])
+        for codes, part_counts in parts:
+            writer.writerows(
+                (name, k, km, c) for km, c in zip(
+                    decode_kmers(codes, k, rna=flags[1] and not flags[0]),
+                    part_counts.tolist()
+                )
+            )
+    return None
+
+
+def main():
+    from omibio.io import read_fasta_iter
+
+    result = kmer_partitioned(
+        read_fasta_iter(r"./examples/data/example_short_seqs.fasta"),
+        k=5, max_memory=1 << 16, n_partitions=8
+    )
+    print(len(result), sum(result.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+from omibio.bio import KmerArrayResult, FastqBatch, SeqEntry
+from omibio.encoding import INVALID, encode_table, kmer_codes, count_codes
+from omibio.viz import plot_kmer
+from os import PathLike
+from typing import Iterable, Iterator
+import numpy as np
+
+# Records are counted in slices of about this many bases, to bound the
+# size of the uint64 window arrays.
+_SLICE_BASES = 1 << 22
+# SeqEntry input is grouped into batches of this many reads.
+_ENTRY_BATCH = 10_000
+
+
+def _batches(
+    reads: "FastqBatch | Iterable[FastqBatch | SeqEntry] | str | PathLike"
+) -> Iterator[FastqBatch]:
+    """Internal helper. Turn the supported inputs into FastqBatch objects."""
+    if isinstance(reads, FastqBatch):
+        yield reads
+        return
+    if isinstance(reads, (str, PathLike)):
+        from omibio.io import read_fastq_batches
+        yield from read_fastq_batches(reads)
+        return
+
+    pending: list[SeqEntry] = []
+    for item in reads:
+        if isinstance(item, FastqBatch):
+            if pending:
+                yield FastqBatch.from_entries(pending)
+                pending = []
+            yield item
+        elif isinstance(item, SeqEntry):
+            pending.append(item)
+            if len(pending) >= _ENTRY_BATCH:
+                yield FastqBatch.from_entries(pending)
+                pending = []
+        else:
+            raise TypeError(
+                "kmer_fastq() reads must be FastqBatch or SeqEntry with a "
+                f"quality string, got {type(item).__name__}"
+            )
+    if pending:
+        yield FastqBatch.from_entries(pending)
+
+
+def _trusted_windows(
+    seqs: np.ndarray,
+    quals: np.ndarray,
+    offsets: np.ndarray,
+    k: int,
+    min_qual: int = 20,
+    phred_offset: int = 33,
+    canonical: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Internal helper. Compute the k-mer codes of a FastqBatch slice and
+    the mask of windows whose bases all pass the quality threshold.
+
+    Works on the contiguous buffers of a FastqBatch: bases below
+    min_qual are masked like non-ACGT characters, and windows that would
+    run across a record boundary are dropped, all with array operations.
+
+    Args:
+        seqs (np.ndarray):
+            uint8 buffer of upper-case sequences.
+        quals (np.ndarray):
+            uint8 buffer of quality strings, aligned with seqs.
+        offsets (np.ndarray):
+            Record boundaries, len(records) + 1 items.
+        k (int):
+            Length of the k-mers, at most 32.
+        min_qual (int, optional):
+            Lowest Phred score a base may have. Defaults to 20.
+        phred_offset (int, optional):
+            ASCII offset of the quality strings. Defaults to 33.
+        canonical (bool, optional):
+            Whether to compute canonical codes. Defaults to False.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            The kmer_codes() codes of every window start in seqs and a
+            mask of the trusted windows.
+    """
+    codes = encode_table("2bit")[seqs]
+    low = quals < min_qual + phred_offset
+    codes = np.where(low, INVALID, codes)
+    kcodes, valid = kmer_codes(codes, k, canonical)
+    if len(valid):
+        # A window is inside its record if it ends before the record end.
+        lengths = np.diff(offsets)
+        ends = np.repeat(offsets[1:], lengths)[: len(valid)]
+        valid &= np.arange(len(valid)) + k <= ends
+    return kcodes, valid
+
+
+def kmer_fastq(
+    reads: "FastqBatch | Iterable[FastqBatch | SeqEntry] | str | PathLike",
+    k: int,
+    min_qual: int = 20,
+    seq_id: str | None = None,
+    canonical: bool = False,
+    min_count: int = 1,
+    phred_offset: int = 33
+) -> KmerArrayResult:
+    """Count the trusted k-mers of FASTQ reads.
+
+    A k-mer is counted only if all of its bases have a Phred score of at
+    least min_qual and are A, C, G or T (U is counted as T), so the
+    error k-mers brought in by low-quality bases never reach the table.
+    Reads are processed as FastqBatch buffers: quality masking, window
+    codes and counting are vectorized over a whole batch, and the
+    per-batch counts are merged as sorted arrays.
+
+    Args:
+        reads (FastqBatch | Iterable[FastqBatch | SeqEntry] |
+            str | PathLike):
+            A FastqBatch, read_fastq_batches() or read_fastq_iter()
+            output, or the path of a FASTQ file.
+        k (int):
+            Length of the k-mers, at most 32.
+        min_qual (int, optional):
+            Lowest Phred score a base of a counted k-mer may have.
+            Defaults to 20.
+        seq_id (str | None, optional):
+            An optional identifier for the result. Defaults to None.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum count threshold for k-mers to include in the result.
+            Defaults to 1.
+        phred_offset (int, optional):
+            ASCII offset of the quality strings. Defaults to 33.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If an argument is out of range, or a SeqEntry has no quality
+            string.
+
+    Returns:
+        KmerArrayResult:
+            The counts, sorted by k-mer. The metadata holds the number of
+            reads and bases, the low-quality bases and the windows that
+            were dropped.
+    """
+    for name, value in (
+        ("k", k), ("min_qual", min_qual), ("min_count", min_count),
+        ("phred_offset", phred_offset)
+    ):
+        if not isinstance(value, int):
+            raise TypeError(
+                f"kmer_fastq() argument '{name}' must be int, got "
+                + type(value).__name__
+            )
+        if value < 0:
+            raise ValueError(
+                f"kmer_fastq() argument '{name}' must be non-negative, got "
+                + str(value)
+            )
+    if not 0 < k <= 32:
+        raise ValueError(
+            f"kmer_fastq() argument 'k' must be 1 to 32, got {k}"
+        )
+
+    stats = {"n_reads": 0, "bases": 0, "low_quality_bases": 0,
+             "windows": 0, "trusted_windows": 0}
+    acc = KmerArrayResult(
+        k, np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+    )
+    pending: list[KmerArrayResult] = []
+
+    for batch in _batches(reads):
+        offsets = batch.offsets
+        stats["n_reads"] += len(batch)
+        stats["bases"] += len(batch.seqs)
+        stats["low_quality_bases"] += int(
+            (batch.quals < min_qual + phred_offset).sum()
+        )
+        stats["windows"] += int(np.maximum(np.diff(offsets) - k + 1, 0).sum())
+
+        # Cut the batch into slices of whole records.
+        cuts = np.unique(np.concatenate((
+            np.searchsorted(
+                offsets, np.arange(0, offsets[-1], _SLICE_BASES),
+                side="right"
+            ) - 1,
+            [len(offsets) - 1]
+        )))
+        for lo, hi in zip(cuts[:-1].tolist(), cuts[1:].tolist()):
+            start, end = int(offsets[lo]), int(offsets[hi])
+            kcodes, valid = _trusted_windows(
+                batch.seqs[start: end], batch.quals[start: end],
+                offsets[lo: hi + 1] - start, k, min_qual, phred_offset,
+                canonical
+            )
+            stats["trusted_windows"] += int(valid.sum())
+            uniq, counts = count_codes(kcodes[valid], k)
+            pending.append(KmerArrayResult(k, uniq, counts))
+
+        # Merge once the pending parts outgrow the running total, so
+        # every code is re-merged O(log n) times.
+        if pending and sum(len(p) for p in pending) >= len(acc):
+            acc, pending = acc.merge(*pending), []
+
+    if pending:
+        acc = acc.merge(*pending)
+    codes, counts = acc.to_numpy()
+    if min_count > 1:
+        keep = counts >= min_count
+        codes, counts = codes[keep], counts[keep]
+
+    return KmerArrayResult(
+        k, codes, counts, seq_id=seq_id, type="kmer", plot_func=plot_kmer,
+        metadata={
+            "canonical": canonical,
+            "min_qual": min_qual,
+            **stats
+        }
+    )
+
+
+def main():
+    result = kmer_fastq(
+        r"./examples/data/example_fastq.fastq", k=5, min_qual=30
+    )
+    print(result, result.metadata)
+
+
+if __name__ == "__main__":
+    main()
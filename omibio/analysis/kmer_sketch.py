@@ -0,0 +1,441 @@
+from omibio.sequence.sequence import Sequence
+from omibio.bio import KmerResult
+from omibio.encoding import encode_table, kmer_codes, decode_kmers
+from omibio.analysis.kmer import _record_chunks
+from omibio.viz import plot_kmer
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator
+import math
+import numpy as np
+if TYPE_CHECKING:
+    from omibio.bio import SeqCollections, SeqEntry, LazySeqCollections
+
+_SEED_MULT = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULT = np.uint64(0xBF58476D1CE4E5B9)
+# Records are cut into overlapping pieces of at most this many windows,
+# so the memory of a task does not grow with the record length.
+_PIECE = 1 << 22
+
+
+class CountMinSketch:
+    """Fixed-size table of approximate counts for uint64 keys.
+
+    Every key is hashed into one counter per row, and its estimate is the
+    smallest of those counters. Estimates never undercount; with
+    probability at least 1 - delta they overcount by at most
+    epsilon * total, where epsilon = e / width and delta = e ** -depth.
+
+    Args:
+        width (int, optional):
+            Counters per row, rounded up to a power of two.
+            Defaults to 2 ** 20.
+        depth (int, optional):
+            Number of rows, i.e. independent hashes. Defaults to 4.
+        seed (int, optional):
+            Seed of the hash functions. Sketches can only be merged if
+            they share it. Defaults to 0.
+
+    Raises:
+        TypeError:
+            If an argument is not an int.
+        ValueError:
+            If width or depth is not positive.
+    """
+
+    def __init__(self, width: int = 1 << 20, depth: int = 4, seed: int = 0):
+        for name, value in (("width", width), ("depth", depth),
+                            ("seed", seed)):
+            if not isinstance(value, int):
+                raise TypeError(
+                    f"CountMinSketch argument '{name}' must be int, got "
+                    + type(value).__name__
+                )
+        if width < 1 or depth < 1:
+            raise ValueError(
+                "CountMinSketch arguments 'width' and 'depth' must be "
+                f"positive, got {width} and {depth}"
+            )
+        self.bits = max(1, (width - 1).bit_length())
+        self.width = 1 << self.bits
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self.table = np.zeros((depth, self.width), dtype=np.int64)
+        with np.errstate(over="ignore"):
+            salts = np.arange(
+                1, depth + 1, dtype=np.uint64
+            ) * _SEED_MULT + np.uint64(seed & (2 ** 64 - 1))
+        self._salts = salts
+
+    @property
+    def epsilon(self) -> float:
+        """Relative overcount bound, e / width."""
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        """Probability of exceeding the bound, e ** -depth."""
+        return math.exp(-self.depth)
+
+    @property
+    def max_error(self) -> int:
+        """Overcount bound on the current total, epsilon * total."""
+        return math.ceil(self.epsilon * self.total)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the counters."""
+        return self.table.nbytes
+
+    def _index(self, keys: np.ndarray, row: int) -> np.ndarray:
+        """Internal helper. Hash keys into the columns of one row."""
+        with np.errstate(over="ignore"):
+            mixed = (keys ^ self._salts[row]) * _MIX_MULT
+            mixed ^= mixed >> np.uint64(31)
+            mixed *= _SEED_MULT
+        return (mixed >> np.uint64(64 - self.bits)).astype(np.intp)
+
+    def add(
+        self, keys: np.ndarray, counts: np.ndarray | None = None
+    ) -> None:
+        """Add keys to the sketch.
+
+        Args:
+            keys (np.ndarray):
+                uint64 keys, e.g. k-mer codes.
+            counts (np.ndarray | None, optional):
+                How many times to add every key. Defaults to once each.
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        if counts is None:
+            counts = np.ones(len(keys), dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        for row in range(self.depth):
+            np.add.at(self.table[row], self._index(keys, row), counts)
+        self.total += int(counts.sum())
+
+    def query(self, keys: np.ndarray) -> np.ndarray:
+        """Return the estimated count of every key as an int64 array."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        estimate = self.table[0][self._index(keys, 0)]
+        for row in range(1, self.depth):
+            np.minimum(
+                estimate, self.table[row][self._index(keys, row)],
+                out=estimate
+            )
+        return estimate
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Add the counts of another sketch with the same shape and seed.
+
+        Raises:
+            ValueError:
+                If the sketches are not compatible.
+        """
+        if (other.width, other.depth, other.seed) != (
+            self.width, self.depth, self.seed
+        ):
+            raise ValueError(
+                "CountMinSketch.merge() needs sketches with the same "
+                "width, depth and seed"
+            )
+        self.table += other.table
+        self.total += other.total
+
+    def __repr__(self) -> str:
+        return (
+            f"CountMinSketch(width={self.width}, depth={self.depth}, "
+            f"seed={self.seed}, total={self.total})"
+        )
+
+
+class SpaceSaving:
+    """Space-Saving summary of the most frequent uint64 keys.
+
+    At most capacity keys are monitored. A key that is not monitored
+    takes over the smallest count, which is remembered as its error, so
+    every monitored count c with error e satisfies c - e <= true <= c,
+    and any key with more than total / capacity occurrences is
+    monitored. Updates come in batches of distinct keys and are merged
+    with vectorized operations.
+
+    Args:
+        capacity (int):
+            Maximum number of monitored keys.
+
+    Raises:
+        TypeError:
+            If capacity is not an int.
+        ValueError:
+            If capacity is not positive.
+    """
+
+    def __init__(self, capacity: int):
+        if not isinstance(capacity, int):
+            raise TypeError(
+                "SpaceSaving argument 'capacity' must be int, got "
+                + type(capacity).__name__
+            )
+        if capacity < 1:
+            raise ValueError(
+                "SpaceSaving argument 'capacity' must be positive, got "
+                + str(capacity)
+            )
+        self.capacity = capacity
+        self.total = 0
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.errors = np.empty(0, dtype=np.int64)
+
+    def update(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        """Add a batch of distinct keys with their counts."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if not len(keys):
+            return
+        self.total += int(counts.sum())
+        # Unmonitored keys may have been seen up to the smallest count,
+        # but only once the summary is full.
+        floor = (
+            int(self.counts.min())
+            if len(self.keys) >= self.capacity else 0
+        )
+        n_old = len(self.keys)
+        union, inverse = np.unique(
+            np.concatenate([self.keys, keys]), return_inverse=True
+        )
+        estimate = np.full(len(union), floor, dtype=np.int64)
+        errors = np.full(len(union), floor, dtype=np.int64)
+        estimate[inverse[:n_old]] = self.counts
+        errors[inverse[:n_old]] = self.errors
+        estimate[inverse[n_old:]] += counts
+
+        if len(union) > self.capacity:
+            keep = np.sort(np.argpartition(
+                -estimate, self.capacity - 1
+            )[:self.capacity])
+            union, estimate, errors = (
+                union[keep], estimate[keep], errors[keep]
+            )
+        self.keys, self.counts, self.errors = union, estimate, errors
+
+    def top(self, n: int | None = None) -> tuple[np.ndarray, ...]:
+        """Return the n largest (keys, counts, errors), largest first."""
+        order = np.argsort(-self.counts, kind="stable")[:n]
+        return self.keys[order], self.counts[order], self.errors[order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return (
+            f"SpaceSaving(capacity={self.capacity}, "
+            f"monitored={len(self.keys)}, total={self.total})"
+        )
+
+
+def _sketch_chunk(
+    pieces: list[str], k: int, canonical: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Internal helper. Count the ACGT/U k-mers of sequence pieces,
+    possibly in a worker process.
+
+    Returns the distinct codes and their counts.
+    """
+    table = encode_table("2bit")
+    parts = []
+    for piece in pieces:
+        raw = np.frombuffer(piece.encode(), dtype=np.uint8)
+        codes, valid = kmer_codes(table[raw], k, canonical)
+        parts.append(codes[valid])
+    if not parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty.astype(np.uint64), empty
+    uniq, counts = np.unique(np.concatenate(parts), return_counts=True)
+    return uniq, counts.astype(np.int64)
+
+
+def _sketch_tasks(
+    seqs: Iterable, k: int, chunk_size: int, stats: list[int],
+    flags: list[bool]
+) -> Iterator[list[str]]:
+    """Internal helper. Cut records into pieces of at most _PIECE windows
+    and group them into tasks of about chunk_size bases, so a task never
+    grows with the length of a record. flags collects whether the
+    records hold T and U.
+    """
+    task: list[str] = []
+    task_bases = 0
+    for chunk in _record_chunks(seqs, chunk_size, stats):
+        for _, seq_str in chunk:
+            flags[0] = flags[0] or "T" in seq_str
+            flags[1] = flags[1] or "U" in seq_str
+            for start in range(0, len(seq_str) - k + 1, _PIECE):
+                piece = seq_str[start: start + _PIECE + k - 1]
+                task.append(piece)
+                task_bases += len(piece)
+                if task_bases >= chunk_size:
+                    yield task
+                    task, task_bases = [], 0
+    if task:
+        yield task
+
+
+def kmer_approximate(
+    seqs: "Sequence | str | SeqCollections | LazySeqCollections | "
+          "Iterable[SeqEntry | Sequence | str]",
+    k: int,
+    seq_id: str | None = None,
+    canonical: bool = False,
+    min_count: int = 1,
+    top: int = 100,
+    width: int = 1 << 20,
+    depth: int = 4,
+    capacity: int | None = None,
+    workers: int = 1,
+    chunk_size: int = 1 << 20
+) -> KmerResult:
+    """Estimate the most frequent k-mers in constant memory.
+
+    Every chunk of records is counted with the 2-bit engine and folded
+    into a CountMinSketch, for abundance estimates of any k-mer, and a
+    SpaceSaving summary, which keeps the candidates for the top k-mers.
+    Memory use depends on width, depth and capacity, not on the number
+    of distinct k-mers. A reported count is the smaller of the two
+    estimates, so it never undercounts.
+
+    Only windows made of A, C, G and T (or U, counted as T) are counted.
+    Keys are spelled with U if the input holds U but no T.
+
+    The metadata holds the error bounds: "epsilon" and "delta" of the
+    sketch, "max_error" (epsilon * "total_kmers", exceeded with
+    probability at most delta), "errors", the guaranteed overcount bound
+    of every reported k-mer, and the "sketch" itself, which can be
+    queried with codes from omibio.encoding.kmer_codes().
+
+    Args:
+        seqs (Sequence | str | SeqCollections | LazySeqCollections |
+            Iterable[SeqEntry | Sequence | str]):
+            One sequence, or many, e.g. read_fasta_iter() output.
+        k (int):
+            Length of the k-mers, at most 32.
+        seq_id (str | None, optional):
+            An optional identifier for the result. Defaults to None.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum estimated count for k-mers to report. Defaults to 1.
+        top (int, optional):
+            Number of most frequent k-mers to report. Defaults to 100.
+        width (int, optional):
+            Counters per row of the sketch. Defaults to 2 ** 20.
+        depth (int, optional):
+            Rows of the sketch. Defaults to 4.
+        capacity (int | None, optional):
+            Keys monitored by the SpaceSaving summary. Defaults to
+            max(10 * top, 1000).
+        workers (int, optional):
+            Number of worker processes counting chunks. Defaults to 1.
+        chunk_size (int, optional):
+            Approximate number of bases per chunk. Defaults to 1 MiB.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If an argument is out of range.
+
+    Returns:
+        KmerResult:
+            The top k-mers with their estimated counts, largest first.
+    """
+    if capacity is None:
+        capacity = max(10 * top, 1000) if isinstance(top, int) else 0
+    for name, value in (
+        ("k", k), ("min_count", min_count), ("top", top),
+        ("width", width), ("depth", depth), ("capacity", capacity),
+        ("workers", workers), ("chunk_size", chunk_size)
+    ):
+        if not isinstance(value, int):
+            raise TypeError(
+                f"kmer_approximate() argument '{name}' must be int, got "
+                + type(value).__name__
+            )
+        if value < (0 if name == "min_count" else 1):
+            raise ValueError(
+                f"kmer_approximate() argument '{name}' is out of range, "
+                f"got {value}"
+            )
+    if k > 32:
+        raise ValueError(
+            f"kmer_approximate() argument 'k' must be 1 to 32, got {k}"
+        )
+
+    if isinstance(seqs, (Sequence, str)):
+        seqs = [seqs]
+    sketch = CountMinSketch(width, depth)
+    heavy = SpaceSaving(max(capacity, top))
+    stats = [0, 0]
+    flags = [False, False]
+
+    def add_result(result) -> None:
+        codes, counts = result
+        sketch.add(codes, counts)
+        heavy.update(codes, counts)
+
+    chunks = _sketch_tasks(seqs, k, chunk_size, stats, flags)
+    if workers == 1:
+        for chunk in chunks:
+            add_result(_sketch_chunk(chunk, k, canonical))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(_sketch_chunk, chunk, k, canonical)
+                )
+                if len(pending) >= workers * 2:
+                    add_result(pending.popleft().result())
+            while pending:
+                add_result(pending.popleft().result())
+
+    codes, counts, errors = heavy.top()
+    estimate = np.minimum(counts, sketch.query(codes))
+    # The SpaceSaving lower bound still holds for the smaller estimate.
+    errors = np.maximum(estimate - (counts - errors), 0)
+    order = np.argsort(-estimate, kind="stable")[:top]
+    order = order[estimate[order] >= min_count]
+    names = decode_kmers(codes[order], k, rna=flags[1] and not flags[0])
+
+    return KmerResult(
+        k=k, counts=Counter(dict(zip(names, estimate[order].tolist()))),
+        seq_id=seq_id, type="kmer", plot_func=plot_kmer,
+        metadata={
+            "seq_length": stats[1],
+            "n_seqs": stats[0],
+            "canonical": canonical,
+            "approximate": True,
+            "total_kmers": sketch.total,
+            "epsilon": sketch.epsilon,
+            "delta": sketch.delta,
+            "max_error": sketch.max_error,
+            "errors": dict(zip(names, errors[order].tolist())),
+            "sketch": sketch
+        }
+    )
+
+
+def main():
+    from omibio.io import read_fasta_iter
+
+    result = kmer_approximate(
+        read_fasta_iter(r"./examples/data/example_short_seqs.fasta"),
+        k=8, top=10, width=1 << 12
+    )
+    print(result)
+    print(result.metadata["max_error"], result.metadata["errors"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+from omibio.sequence.sequence import Sequence
+from omibio.bio import KmerResult
+from omibio.encoding import (
+    MAX_CODE_K, DENSE_MAX_K, encode, iter_kmer_codes, decode_kmers
+)
+from omibio.analysis.kmer import (
+    kmer, _two_bit, _window_counts, _count_encoded
+)
+from omibio.viz import plot_kmer
+from collections import Counter
+from typing import Iterable
+import numpy as np
+
+
+def _check_ks(ks: Iterable[int], func: str) -> list[int]:
+    """Internal helper. Validate ks and return them sorted and distinct."""
+    try:
+        ks = list(ks)
+    except TypeError:
+        raise TypeError(
+            f"{func}() argument 'ks' must be an iterable of int, got "
+            + type(ks).__name__
+        ) from None
+    for k in ks:
+        if not isinstance(k, int):
+            raise TypeError(
+                f"{func}() argument 'ks' must hold int, got "
+                + type(k).__name__
+            )
+        if k <= 0:
+            raise ValueError(
+                f"{func}() argument 'ks' must hold positive numbers, got {k}"
+            )
+    if not ks:
+        raise ValueError(f"{func}() argument 'ks' must not be empty")
+    return sorted(set(ks))
+
+
+def spectrum_labels(
+    ks: Iterable[int] = range(1, 9), rna: bool = False
+) -> list[str]:
+    """Return the k-mer of every position of a kmer_spectrum() vector.
+
+    Args:
+        ks (Iterable[int], optional):
+            k-mer lengths, as passed to kmer_spectrum().
+            Defaults to range(1, 9).
+        rna (bool, optional):
+            Whether to spell the k-mers with U. Defaults to False.
+
+    Raises:
+        TypeError:
+            If ks does not hold int.
+        ValueError:
+            If a k is not positive or above DENSE_MAX_K.
+
+    Returns:
+        list[str]: ACGT k-mers in lexicographic order, k by k.
+    """
+    ks = _check_ks(ks, "spectrum_labels")
+    if ks[-1] > DENSE_MAX_K:
+        raise ValueError(
+            f"spectrum_labels() argument 'ks' must be at most {DENSE_MAX_K}"
+            f", got {ks[-1]}"
+        )
+    labels: list[str] = []
+    for k in ks:
+        labels += decode_kmers(np.arange(4 ** k), k, rna=rna)
+    return labels
+
+
+def kmer_spectrum(
+    seq: Sequence | str,
+    ks: Iterable[int] = range(1, 9),
+    seq_id: str | None = None,
+    canonical: bool = False,
+    min_count: int = 1,
+    as_vector: bool = False,
+    normalize: bool = False
+) -> dict[int, KmerResult] | np.ndarray:
+    """Count the k-mers of a sequence for several k in one pass.
+
+    The sequence is encoded once, and the codes of each k are rolled
+    forward from those of k - 1 (see omibio.encoding.iter_kmer_codes),
+    so the whole spectrum costs about as much as the largest k alone.
+    Each KmerResult is the same as kmer(seq, k) would return.
+
+    With as_vector, the counts are laid out as one feature vector
+    instead: for each k in increasing order, 4**k counts of the ACGT
+    k-mers in lexicographic order (U is counted as T, and windows with
+    other characters are skipped). With canonical, the slots of
+    non-canonical k-mers stay 0. spectrum_labels() names the positions.
+
+    Args:
+        seq (Sequence | str):
+            Input sequence to analyze.
+        ks (Iterable[int], optional):
+            k-mer lengths. Defaults to range(1, 9).
+        seq_id (str | None, optional):
+            An optional identifier for the sequence. Defaults to None.
+        canonical (bool, optional):
+            Whether to count canonical k-mers. Defaults to False.
+        min_count (int, optional):
+            Minimum count threshold for k-mers to include in the results.
+            Ignored with as_vector. Defaults to 1.
+        as_vector (bool, optional):
+            Whether to return a single feature vector. Defaults to False.
+        normalize (bool, optional):
+            Whether to turn the counts of every k in the vector into
+            frequencies. Defaults to False.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If a k is not positive, or above DENSE_MAX_K with as_vector.
+        ValueError:
+            If min_count is negative.
+
+    Returns:
+        dict[int, KmerResult] | np.ndarray:
+            A KmerResult for every k, or the int64 (float64 if
+            normalize) feature vector.
+    """
+    if not isinstance(seq, (Sequence, str)):
+        raise TypeError(
+            "kmer_spectrum() argument 'seq' must be Sequence or str, got "
+            + type(seq).__name__
+        )
+    if not isinstance(min_count, int):
+        raise TypeError(
+            "kmer_spectrum() argument 'min_count' must be int, got "
+            + type(min_count).__name__
+        )
+    if min_count < 0:
+        raise ValueError(
+            "kmer_spectrum() argument 'min_count' must be a non-negative "
+            f"number, got {min_count}"
+        )
+    ks = _check_ks(ks, "kmer_spectrum")
+    seq_str = str(seq).upper()
+
+    if as_vector:
+        if ks[-1] > DENSE_MAX_K:
+            raise ValueError(
+                "kmer_spectrum() argument 'ks' must be at most "
+                f"{DENSE_MAX_K} with as_vector, got {ks[-1]}"
+            )
+        blocks = []
+        for k, kcodes, valid in iter_kmer_codes(
+            encode(seq_str, "2bit"), ks, canonical
+        ):
+            block = np.bincount(
+                kcodes[valid].astype(np.intp), minlength=4 ** k
+            )
+            if normalize:
+                total = block.sum()
+                block = block / total if total else block.astype(float)
+            blocks.append(block)
+        return np.concatenate(blocks)
+
+    codes, rna = _two_bit(seq_str)
+    results: dict[int, KmerResult] = {}
+    for k, kcodes, valid in iter_kmer_codes(
+        codes, [k for k in ks if k <= MAX_CODE_K], canonical
+    ):
+        uniq, counts, first, other = _window_counts(
+            seq_str, k, kcodes, valid, canonical
+        )
+        counter = _count_encoded(
+            seq_str, k, canonical, (uniq, counts, first, rna, other)
+        )
+        if min_count > 1:
+            counter = Counter(
+                {km: c for km, c in counter.items() if c >= min_count}
+            )
+        results[k] = KmerResult(
+            k=k, counts=counter, seq_id=seq_id,
+            type="kmer", plot_func=plot_kmer,
+            metadata={
+                "seq_length": len(seq_str),
+                "canonical": canonical
+            }
+        )
+    for k in ks:
+        if k > MAX_CODE_K:
+            results[k] = kmer(
+                seq_str, k, seq_id=seq_id, canonical=canonical,
+                min_count=min_count
+            )
+    return results
+
+
+def main():
+    from omibio.io import read_fasta
+    seq = read_fasta(
+        r"./examples/data/example_single_long_seq.fasta"
+    )["example"]
+    spectrum = kmer_spectrum(seq, range(1, 4))
+    for k, result in spectrum.items():
+        print(k, result)
+    vector = kmer_spectrum(seq, range(1, 4), as_vector=True, normalize=True)
+    print(dict(zip(spectrum_labels(range(1, 4)), vector.round(3).tolist())))
+
+
+if __name__ == "__main__":
+    main()
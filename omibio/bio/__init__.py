@@ -1,8 +1,12 @@
 from omibio.bio.seq_interval import SeqInterval
 from omibio.bio.seq_entry import SeqEntry
 from omibio.bio.seq_collections import SeqCollections
+from omibio.bio.lazy_seq_collections import LazySeqCollections
+from omibio.bio.fastq_batch import FastqBatch
 from omibio.bio.analysis_result import AnalysisResult
 from omibio.bio.kmer_result import KmerResult
+from omibio.bio.kmer_array_result import KmerArrayResult
+from omibio.bio.kmer_hist_result import KmerHistResult
 from omibio.bio.interval_result import IntervalResult
 
 __all__ = [
@@ -10,6 +14,10 @@ __all__ = [
     "AnalysisResult",
     "SeqEntry",
     "SeqCollections",
+    "LazySeqCollections",
+    "FastqBatch",
     "KmerResult",
+    "KmerArrayResult",
+    "KmerHistResult",
     "IntervalResult"
 ]
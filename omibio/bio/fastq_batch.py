@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from omibio.bio.seq_entry import SeqEntry
+from omibio.sequence import Sequence
+from typing import Iterable, Iterator
+import numpy as np
+
+
+@dataclass()
+class FastqBatch:
+    """Columnar batch of FASTQ records, returned by read_fastq_batches().
+
+    Sequences and quality strings of all records are stored back to back
+    in two contiguous uint8 buffers. Record i occupies
+    buffer[offsets[i]: offsets[i+1]] in both of them.
+
+    Args:
+        ids (list[str]):
+            Record IDs, in file order.
+        seqs (np.ndarray):
+            uint8 buffer holding the upper-cased sequences.
+        quals (np.ndarray):
+            uint8 buffer holding the raw quality strings.
+        offsets (np.ndarray):
+            int64 array of len(ids) + 1 record boundaries.
+        source (str | None):
+            Source information for the batch.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If the buffers and offsets do not describe the same records.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    seqs: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.uint8)
+    )
+    quals: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.uint8)
+    )
+    offsets: np.ndarray = field(
+        default_factory=lambda: np.zeros(1, dtype=np.int64)
+    )
+    source: str | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.ids, list):
+            raise TypeError(
+                "FastqBatch argument 'ids' must be list, got "
+                + type(self.ids).__name__
+            )
+        for name in ("seqs", "quals", "offsets"):
+            if not isinstance(getattr(self, name), np.ndarray):
+                raise TypeError(
+                    f"FastqBatch argument '{name}' must be np.ndarray, got "
+                    + type(getattr(self, name)).__name__
+                )
+        if len(self.offsets) != len(self.ids) + 1:
+            raise ValueError(
+                "FastqBatch argument 'offsets' must have len(ids) + 1 "
+                f"items, got {len(self.offsets)} for {len(self.ids)} ids"
+            )
+        if not (len(self.seqs) == len(self.quals) == self.offsets[-1]):
+            raise ValueError(
+                "FastqBatch sequence / quality buffer length mismatch: "
+                f"({len(self.seqs)} vs {len(self.quals)})"
+            )
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[SeqEntry], source: str | None = None
+    ) -> "FastqBatch":
+        """Build a batch from SeqEntry objects carrying quality strings."""
+        ids: list[str] = []
+        seqs: list[str] = []
+        quals: list[str] = []
+        for entry in entries:
+            if entry.qual is None:
+                raise ValueError(
+                    f"SeqEntry {entry.seq_id!r} has no quality string"
+                )
+            ids.append(entry.seq_id)
+            seqs.append(str(entry.seq))
+            quals.append(entry.qual)
+
+        lengths = np.fromiter(map(len, seqs), dtype=np.int64, count=len(ids))
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        return cls(
+            ids=ids,
+            seqs=np.frombuffer("".join(seqs).encode(), dtype=np.uint8),
+            quals=np.frombuffer("".join(quals).encode(), dtype=np.uint8),
+            offsets=offsets,
+            source=source
+        )
+
+    def lengths(self) -> np.ndarray:
+        """Return the length of every record."""
+        return np.diff(self.offsets)
+
+    def phred(self, offset: int = 33) -> np.ndarray:
+        """Return the quality buffer decoded to Phred scores."""
+        return self.quals.astype(np.int16) - offset
+
+    def get_id(self, idx: int) -> str:
+        """Return the ID of the record at the given index."""
+        return self.ids[idx]
+
+    def get_seq(self, idx: int) -> str:
+        """Return the sequence of the record at the given index."""
+        start, end = self._bounds(idx)
+        return self.seqs[start: end].tobytes().decode()
+
+    def get_qual(self, idx: int) -> str:
+        """Return the quality string of the record at the given index."""
+        start, end = self._bounds(idx)
+        return self.quals[start: end].tobytes().decode()
+
+    def get_entry(self, idx: int) -> SeqEntry:
+        """Return the record at the given index as a SeqEntry."""
+        return SeqEntry(
+            seq=Sequence._trusted(self.get_seq(idx)), seq_id=self.ids[idx],
+            qual=self.get_qual(idx), source=self.source
+        )
+
+    def entry_list(self) -> list[SeqEntry]:
+        """Return a list of SeqEntry objects in the batch."""
+        return list(self)
+
+    def _bounds(self, idx: int) -> tuple[int, int]:
+        if idx < 0:
+            idx += len(self.ids)
+        if not 0 <= idx < len(self.ids):
+            raise IndexError("FastqBatch index out of range")
+        return int(self.offsets[idx]), int(self.offsets[idx + 1])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[SeqEntry]:
+        for i in range(len(self.ids)):
+            yield self.get_entry(i)
+
+    def __getitem__(self, idx: int) -> SeqEntry:
+        return self.get_entry(idx)
+
+    def __repr__(self) -> str:
+        return (
+            f"FastqBatch({len(self.ids)} records, "
+            f"{len(self.seqs)} bases, source={self.source!r})"
+        )
+
+
+def main():
+    batch = FastqBatch.from_entries(
+        [
+            SeqEntry(Sequence("ACTG"), seq_id="r1", qual="IIII"),
+            SeqEntry(Sequence("GGA"), seq_id="r2", qual="!!I"),
+        ]
+    )
+    print(repr(batch))
+    print(batch.lengths(), batch.phred())
+    print(batch[1])
+
+
+if __name__ == "__main__":
+    main()
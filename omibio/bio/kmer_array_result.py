@@ -0,0 +1,393 @@
+from omibio.bio.analysis_result import AnalysisResult
+from omibio.bio.kmer_result import KmerResult
+from omibio.encoding import INVALID, MAX_CODE_K, encode, decode_kmers
+from omibio.utils import check_if_exist
+from collections import Counter
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+from pathlib import Path
+import csv
+import io
+import numpy as np
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Number of k-mers decoded at a time when iterating or writing.
+_CHUNK = 1 << 16
+
+
+class KmerArrayResult(KmerResult):
+    """KmerResult backed by NumPy arrays instead of a dict.
+
+    k-mers are stored as sorted, distinct 2-bit codes (see
+    omibio.encoding.kmer_codes) with a parallel array of counts, and are
+    only decoded into strings when they are read. Construction checks
+    the arrays as a whole instead of every key, merging two results is a
+    linear merge of sorted arrays, and to_csv() writes in chunks. The
+    counts attribute still gives a dict, built on first access.
+
+    Args:
+        k (int):
+            The length of the kmers, at most 32.
+        codes (np.ndarray):
+            k-mer codes. Unsorted or repeated codes are sorted and their
+            counts summed.
+        code_counts (np.ndarray):
+            Count of every code.
+        seq_id (str | None, optional):
+            The sequence ID. Defaults to None.
+        type (str | None, optional):
+            The type of the result. Defaults to "kmer".
+        plot_func (Callable | None, optional):
+            Plotting function. Defaults to None.
+        metadata (dict[str, Any] | None, optional):
+            Additional metadata. Defaults to None.
+        rna (bool, optional):
+            Whether to spell the k-mers with U instead of T.
+            Defaults to False.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If k is out of range, the arrays differ in length, or a code
+            is too large for k.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        codes: np.ndarray,
+        code_counts: np.ndarray,
+        seq_id: str | None = None,
+        type: str | None = "kmer",
+        plot_func: Callable | None = None,
+        metadata: dict[str, Any] | None = None,
+        rna: bool = False
+    ):
+        self.type = type
+        self.seq_id = seq_id
+        self.plot_func = plot_func
+        self.metadata = {} if metadata is None else metadata
+        AnalysisResult.__post_init__(self)
+
+        if not isinstance(k, int):
+            raise TypeError(
+                f"KmerArrayResult argument 'k' must be int, got "
+                f"{k.__class__.__name__}"
+            )
+        if not 0 < k <= MAX_CODE_K:
+            raise ValueError(
+                "KmerArrayResult argument 'k' must be between 1 and "
+                f"{MAX_CODE_K}, got {k}"
+            )
+        for name, value in (("codes", codes), ("code_counts", code_counts)):
+            if not isinstance(value, np.ndarray) or value.ndim != 1:
+                raise TypeError(
+                    f"KmerArrayResult argument '{name}' must be a 1-D "
+                    f"np.ndarray, got {value.__class__.__name__}"
+                )
+        if len(codes) != len(code_counts):
+            raise ValueError(
+                "KmerArrayResult arguments 'codes' and 'code_counts' must "
+                f"have the same length, got {len(codes)} and "
+                f"{len(code_counts)}"
+            )
+        codes = codes.astype(np.uint64, copy=False)
+        code_counts = code_counts.astype(np.int64, copy=False)
+        if len(codes) and int(codes.max()) >= 4 ** k:
+            raise ValueError(
+                f"KmerArrayResult argument 'codes' has codes too large for "
+                f"k={k}"
+            )
+        if len(codes) > 1 and not np.all(codes[1:] > codes[:-1]):
+            codes, code_counts = _sum_sorted(
+                *_stable_sort(codes, code_counts)
+            )
+
+        self.k = k
+        self.codes = codes
+        self.code_counts = code_counts
+        self.rna = rna
+        self._counts: Counter | None = None
+
+    @classmethod
+    def from_result(cls, result: KmerResult) -> "KmerArrayResult":
+        """Convert a KmerResult whose k-mers are made of ACGT (or ACGU).
+
+        Raises:
+            TypeError:
+                If result is not a KmerResult.
+            ValueError:
+                If a k-mer holds other characters.
+        """
+        if isinstance(result, KmerArrayResult):
+            return result
+        if not isinstance(result, KmerResult):
+            raise TypeError(
+                "KmerArrayResult.from_result() argument 'result' must be "
+                f"KmerResult, got {result.__class__.__name__}"
+            )
+        kmers = "".join(result.keys()).upper()
+        letters = encode(kmers, "2bit").reshape(len(result), result.k)
+        if (letters == INVALID).any():
+            raise ValueError(
+                "KmerArrayResult.from_result() only supports k-mers made "
+                "of ACGT or ACGU"
+            )
+        codes = np.zeros(len(result), dtype=np.uint64)
+        for j in range(result.k):
+            codes <<= np.uint64(2)
+            codes |= letters[:, j].astype(np.uint64)
+        return cls(
+            result.k, codes,
+            np.fromiter(result.values(), dtype=np.int64, count=len(result)),
+            seq_id=result.seq_id, type=result.type,
+            plot_func=result.plot_func, metadata=dict(result.metadata),
+            rna="U" in kmers
+        )
+
+    @property
+    def counts(self) -> Counter:
+        """The counts as a dict of {kmer: count}, in code order."""
+        if self._counts is None:
+            self._counts = Counter(dict(self.items()))
+        return self._counts
+
+    def _decoded(self) -> Iterator[list[str]]:
+        """Internal helper. Decode the k-mers a chunk at a time."""
+        for start in range(0, len(self.codes), _CHUNK):
+            yield decode_kmers(
+                self.codes[start: start + _CHUNK], self.k, rna=self.rna
+            )
+
+    def _code_of(self, kmer: str) -> int:
+        """Internal helper. Return the index of a k-mer, or -1."""
+        if not isinstance(kmer, str) or len(kmer) != self.k:
+            return -1
+        letters = encode(kmer, "2bit")
+        if (letters == INVALID).any():
+            return -1
+        code = 0
+        for c in letters.tolist():
+            code = code << 2 | c
+        idx = int(np.searchsorted(self.codes, np.uint64(code)))
+        if idx < len(self.codes) and int(self.codes[idx]) == code:
+            return idx
+        return -1
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Return an iterator over the (kmer, count) pairs."""
+        for start, names in zip(range(0, len(self.codes), _CHUNK),
+                                self._decoded()):
+            yield from zip(
+                names, self.code_counts[start: start + _CHUNK].tolist()
+            )
+
+    def keys(self) -> Iterator[str]:
+        """Return an iterator over the kmers."""
+        for names in self._decoded():
+            yield from names
+
+    def values(self) -> Iterator[int]:
+        """Return an iterator over the counts."""
+        for start in range(0, len(self.code_counts), _CHUNK):
+            yield from self.code_counts[start: start + _CHUNK].tolist()
+
+    def top(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Return the n most frequent (kmer, count) pairs, largest first.
+
+        Ties are broken by k-mer order. Only the selected codes are
+        sorted and decoded.
+        """
+        if n is None or n >= len(self.codes):
+            idx = np.arange(len(self.codes))
+        elif n <= 0:
+            return []
+        else:
+            idx = np.argpartition(-self.code_counts, n - 1)[:n]
+            # Codes tied with the n-th count may be cut arbitrarily.
+            cut = self.code_counts[idx].min()
+            idx = np.union1d(
+                idx[self.code_counts[idx] > cut],
+                np.flatnonzero(self.code_counts == cut)
+            )
+        order = idx[np.lexsort((self.codes[idx], -self.code_counts[idx]))]
+        order = order[:n]
+        return list(zip(
+            decode_kmers(self.codes[order], self.k, rna=self.rna),
+            self.code_counts[order].tolist()
+        ))
+
+    def merge(self, *others: KmerResult) -> "KmerArrayResult":
+        """Return the sum of this result and others.
+
+        The sorted code arrays are merged with a stable sort, which runs
+        in linear time on presorted runs, and equal codes are summed.
+
+        Raises:
+            TypeError:
+                If another result is not a KmerResult.
+            ValueError:
+                If the results differ in k or in canonical.
+        """
+        results = [self] + [self.from_result(other) for other in others]
+        canonical = {
+            r.metadata["canonical"] for r in results
+            if "canonical" in r.metadata
+        }
+        if len({r.k for r in results}) > 1 or len(canonical) > 1:
+            raise ValueError(
+                "KmerArrayResult.merge() needs results with the same k "
+                "and canonical setting"
+            )
+        codes, code_counts = _sum_sorted(*_stable_sort(
+            np.concatenate([r.codes for r in results]),
+            np.concatenate([r.code_counts for r in results])
+        ))
+        # An empty result has no k-mer to tell its spelling from.
+        spelled = [r.rna for r in results if len(r.codes)]
+        return KmerArrayResult(
+            self.k, codes, code_counts, seq_id=self.seq_id, type=self.type,
+            plot_func=self.plot_func,
+            metadata={"canonical": canonical.pop()} if canonical else {},
+            rna=all(spelled) if spelled else self.rna
+        )
+
+    def to_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (codes, counts) arrays without copying them."""
+        return self.codes, self.code_counts
+
+    def to_dataframe(self, decode: bool = True) -> "pd.DataFrame":
+        """Return the counts as a DataFrame with kmer and count columns.
+
+        With decode=False, the kmer column is replaced by a code column
+        and no strings are built.
+        """
+        import pandas as pd
+
+        first = (
+            ("kmer", list(self.keys())) if decode else ("code", self.codes)
+        )
+        return pd.DataFrame(
+            {first[0]: first[1], "count": self.code_counts}, copy=False
+        )
+
+    def to_csv(self, path: Path | str, sep: str = "\t") -> None:
+        """Write kmer counts to a csv file, a chunk at a time.
+
+        Args:
+            path (Path | str):
+                The path to the output csv file.
+            sep (str, optional):
+                The separator to use in the csv file. Defaults to "\\t".
+        """
+        seq_id = check_if_exist(self.seq_id)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=sep)
+            writer.writerow(["seq_id", "k", "kmer", "count"])
+            # k-mers and counts never need quoting, so only the shared
+            # first columns go through the csv module.
+            prefix = io.StringIO()
+            csv.writer(prefix, delimiter=sep, lineterminator="").writerow(
+                [seq_id, self.k, ""]
+            )
+            lead = prefix.getvalue()
+            end = writer.dialect.lineterminator
+            for start, names in zip(range(0, len(self.codes), _CHUNK),
+                                    self._decoded()):
+                counts = self.code_counts[start: start + _CHUNK].tolist()
+                f.write("".join([
+                    f"{lead}{kmer}{sep}{count}{end}"
+                    for kmer, count in zip(names, counts)
+                ]))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._code_of(key) >= 0
+
+    def __getitem__(self, key: str) -> int:
+        idx = self._code_of(key)
+        if idx < 0:
+            raise KeyError(key)
+        return int(self.code_counts[idx])
+
+    def __add__(self, other: KmerResult) -> "KmerArrayResult":
+        if not isinstance(other, KmerResult):
+            return NotImplemented
+        return self.merge(other)
+
+    def __radd__(self, other: Any) -> "KmerArrayResult":
+        # Lets sum() start from 0.
+        if isinstance(other, int) and other == 0:
+            return self
+        if not isinstance(other, KmerResult):
+            return NotImplemented
+        return self.from_result(other).merge(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, KmerResult):
+            return NotImplemented
+        if not isinstance(other, KmerArrayResult):
+            # A plain KmerResult is equal if it holds the same counts.
+            return (
+                self.k == other.k and len(self) == len(other)
+                and dict(self.items()) == dict(other.counts)
+            )
+        return (
+            self.k == other.k
+            and np.array_equal(self.codes, other.codes)
+            and np.array_equal(self.code_counts, other.code_counts)
+            and (self.type, self.seq_id, self.rna)
+            == (other.type, other.seq_id, other.rna)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"KmerArrayResult(k={self.k}, n_kmers={len(self)}, "
+            f"seq_id={self.seq_id!r}, type={self.type!r})"
+        )
+
+    def __str__(self) -> str:
+        shown = ", ".join(f"{km!r}: {c}" for km, c in self.top(5))
+        more = ", ..." if len(self) > 5 else ""
+        return f"{{{shown}{more}}}"
+
+
+def _stable_sort(
+    codes: np.ndarray, code_counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Internal helper. Sort codes with their counts; the stable sort
+    merges presorted runs in linear time.
+    """
+    order = np.argsort(codes, kind="stable")
+    return codes[order], code_counts[order]
+
+
+def _sum_sorted(
+    codes: np.ndarray, code_counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Internal helper. Sum the counts of equal neighbouring codes."""
+    if not len(codes):
+        return codes, code_counts
+    starts = np.flatnonzero(
+        np.concatenate(([True], codes[1:] != codes[:-1]))
+    )
+    return codes[starts], np.add.reduceat(code_counts, starts)
+
+
+def main():
+    from omibio.encoding import kmer_codes, count_codes
+
+    codes, valid = kmer_codes(encode("ACGTACGTTT", "2bit"), 3)
+    result = KmerArrayResult(3, *count_codes(codes[valid], 3))
+    print(result, result.top(2))
+    print((result + result).to_dataframe())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field
+from omibio.bio.analysis_result import AnalysisResult
+from omibio.utils import check_if_exist
+from typing import Iterator
+from pathlib import Path
+import csv
+import numpy as np
+
+
+@dataclass(eq=False)
+class KmerHistResult(AnalysisResult):
+    """Class to hold a k-mer abundance histogram, is a subclass of
+    AnalysisResult.
+
+    histogram[i] is the number of distinct k-mers seen exactly i times;
+    the last bin also holds every k-mer seen more often.
+
+    Args:
+        k (int | None):
+            The length of the kmers, if known.
+        histogram (np.ndarray):
+            Number of distinct k-mers per abundance, from abundance 0.
+        peak (int | None):
+            Abundance of the main peak, i.e. the k-mer coverage.
+        genome_size (int | None):
+            Estimated haploid genome size.
+        heterozygosity (float | None):
+            Estimated rate of heterozygous sites, if a diploid pair of
+            peaks was found.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+    """
+
+    type = "kmer_hist"
+    k: int | None = None
+    histogram: np.ndarray = field(
+        default_factory=lambda: np.zeros(1, dtype=np.int64)
+    )
+    peak: int | None = None
+    genome_size: int | None = None
+    heterozygosity: float | None = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        if not isinstance(self.histogram, np.ndarray) or (
+            self.histogram.ndim != 1
+        ):
+            raise TypeError(
+                "KmerHistResult argument 'histogram' must be a 1-D "
+                f"np.ndarray, got {type(self.histogram).__name__}"
+            )
+        if self.k is not None and not isinstance(self.k, int):
+            raise TypeError(
+                "KmerHistResult argument 'k' must be int, got "
+                + type(self.k).__name__
+            )
+
+    @property
+    def max_count(self) -> int:
+        """Abundance of the last bin."""
+        return len(self.histogram) - 1
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct k-mers."""
+        return int(self.histogram[1:].sum())
+
+    @property
+    def total(self) -> int:
+        """Number of k-mers, with the last bin counted at its abundance."""
+        return int(
+            (np.arange(len(self.histogram)) * self.histogram).sum()
+        )
+
+    def info(self) -> None:
+        func = self.plot_func.__name__ if self.plot_func else "N/A"
+
+        message = f"""
+{type(self)}
+    Type: {check_if_exist(self.type)!r}
+    {self.distinct} distinct kmers, k={check_if_exist(self.k)}
+    Peak: {check_if_exist(self.peak)}
+    Genome size: {check_if_exist(self.genome_size)}
+    Heterozygosity: {check_if_exist(self.heterozygosity)}
+    Seq id: {check_if_exist(self.seq_id)!r}
+    Plot function: {func}
+    Available metadata: {list(self.metadata.keys())!r}
+        """
+
+        print(message)
+
+    def to_csv(self, path: Path | str, sep: str = "\t") -> None:
+        """Write the non-empty bins as abundance and count columns.
+
+        Args:
+            path (Path | str):
+                The path to the output csv file.
+            sep (str, optional):
+                The separator to use in the csv file. Defaults to "\\t".
+        """
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=sep)
+            writer.writerow(["abundance", "count"])
+            writer.writerows(self.items())
+
+    def items(self) -> Iterator[tuple[int, int]]:
+        """Return an iterator over the non-empty (abundance, count) bins."""
+        nonzero = np.flatnonzero(self.histogram[1:]) + 1
+        return zip(nonzero.tolist(), self.histogram[nonzero].tolist())
+
+    def __len__(self) -> int:
+        return len(self.histogram)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.histogram.tolist())
+
+    def __getitem__(self, abundance: int) -> int:
+        return int(self.histogram[abundance])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, KmerHistResult):
+            return NotImplemented
+        return (
+            np.array_equal(self.histogram, other.histogram)
+            and (self.k, self.peak, self.genome_size, self.heterozygosity,
+                 self.seq_id)
+            == (other.k, other.peak, other.genome_size,
+                other.heterozygosity, other.seq_id)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"KmerHistResult(k={self.k!r}, peak={self.peak!r}, "
+            f"genome_size={self.genome_size!r}, "
+            f"heterozygosity={self.heterozygosity!r}, "
+            f"seq_id={self.seq_id!r})"
+        )
+
+    def __str__(self) -> str:
+        return str(dict(self.items()))
+
+
+def main():
+    hist = np.array([0, 50, 10, 4, 8, 20, 8, 2], dtype=np.int64)
+    result = KmerHistResult(k=3, histogram=hist, peak=5, genome_size=32)
+    print(result)
+    result.info()
+
+
+if __name__ == "__main__":
+    main()
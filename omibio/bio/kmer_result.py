@@ -1,9 +1,13 @@
 from dataclasses import dataclass, field
 from omibio.bio.analysis_result import AnalysisResult
-from typing import Iterator, Iterable
+from typing import Iterator, Iterable, TYPE_CHECKING
 from omibio.utils import check_if_exist
 from pathlib import Path
+import heapq
 import csv
+if TYPE_CHECKING:
+    import pandas as pd
+    from omibio.bio.kmer_array_result import KmerArrayResult
 
 
 @dataclass()
@@ -43,7 +47,7 @@ class KmerResult(AnalysisResult):
         message = f"""
 {type(self)}
     Type: {check_if_exist(self.type)!r}
-    {len(self.counts)} kmers, k={self.k}
+    {len(self)} kmers, k={self.k}
     Seq id: {check_if_exist(self.seq_id)!r}
     Plot function: {func}
     Available metadata: {list(self.metadata.keys())!r}
@@ -61,14 +65,36 @@ class KmerResult(AnalysisResult):
                 The separator to use in the csv file. Defaults to "\\t".
         """
 
-        rows: list[list[str | int]] = [["seq_id", "k", "kmer", "count"]]
         seq_id = check_if_exist(self.seq_id)
-        for kmer, count in self.counts.items():
-            rows.append([seq_id, self.k, kmer, count])
-
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f, delimiter=sep)
-            writer.writerows(rows)
+            writer.writerow(["seq_id", "k", "kmer", "count"])
+            writer.writerows(
+                (seq_id, self.k, kmer, count) for kmer, count in self.items()
+            )
+
+    def top(self, n: int | None = None) -> list[tuple[str, int]]:
+        """Return the n most frequent (kmer, count) pairs, largest first.
+
+        Uses a heap of size n, so the counts are not sorted in full.
+        """
+        if n is None:
+            return sorted(self.items(), key=lambda kv: kv[1], reverse=True)
+        return heapq.nlargest(n, self.items(), key=lambda kv: kv[1])
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Return the counts as a DataFrame with kmer and count columns."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {"kmer": list(self.keys()), "count": list(self.values())}
+        )
+
+    def to_array_result(self) -> "KmerArrayResult":
+        """Convert to a KmerArrayResult, see KmerArrayResult.from_result()."""
+        from omibio.bio.kmer_array_result import KmerArrayResult
+
+        return KmerArrayResult.from_result(self)
 
     def items(self) -> Iterable[tuple[str, int]]:
         """Return an iterator over the (kmer, count) pairs."""
@@ -0,0 +1,190 @@
+from omibio.bio.seq_entry import SeqEntry
+from omibio.sequence import Sequence, Polypeptide
+from collections import OrderedDict
+from os import PathLike
+from typing import Iterable, Iterator
+
+
+class LazySeqCollections:
+    """Read-only SeqCollections backed by an indexed FASTA file on disk.
+
+    The file is memory-mapped and indexed with a .fai sidecar, and a
+    record is only decoded when it is accessed. Recently decoded
+    sequences are kept in a bounded LRU cache, so memory use stays
+    proportional to cache_size instead of the file size.
+
+    Sequence IDs follow the .fai convention: the first word of the header.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        cache_size: int = 16,
+        strict: bool = False,
+        rebuild_index: bool = False
+    ):
+        """Initialization for LazySeqCollections.
+
+        Args:
+            path (str | PathLike):
+                Path to the uncompressed FASTA file.
+            cache_size (int, optional):
+                Maximum number of decoded sequences kept in memory.
+                Defaults to 16.
+            strict (bool, optional):
+                Whether to decode sequences in strict mode.
+                Defaults to False.
+            rebuild_index (bool, optional):
+                Whether to rebuild the .fai index even if it exists.
+                Defaults to False.
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+            ValueError:
+                If cache_size is negative.
+            FileNotFoundError:
+                If the FASTA file is not found.
+        """
+        from omibio.io.fasta_index import FastaIndex
+
+        if not isinstance(cache_size, int):
+            raise TypeError(
+                "LazySeqCollections argument 'cache_size' must be int, got "
+                + type(cache_size).__name__
+            )
+        if cache_size < 0:
+            raise ValueError(
+                "LazySeqCollections argument 'cache_size' must be "
+                f"non-negative, got {cache_size}"
+            )
+
+        self._index = FastaIndex(
+            path, rebuild=rebuild_index, use_mmap=True
+        )
+        self._source = str(self._index.path)
+        self._strict = strict
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, Sequence | Polypeptide] = OrderedDict()
+
+    @property
+    def source(self):
+        """Return the source information."""
+        return self._source
+
+    @property
+    def index(self):
+        """Return the underlying FastaIndex."""
+        return self._index
+
+    @property
+    def cache_size(self) -> int:
+        """Return the maximum number of cached sequences."""
+        return self._cache_size
+
+    def get_entry(self, seq_id: str) -> SeqEntry:
+        """Return the SeqEntry for the given seq_id."""
+        return SeqEntry(seq=self[seq_id], seq_id=seq_id, source=self._source)
+
+    def get_seq(self, seq_id: str) -> Sequence | Polypeptide:
+        """Return the Sequence or Polypeptide for the given seq_id."""
+        return self[seq_id]
+
+    def fetch(
+        self, seq_id: str, start: int = 0, end: int | None = None
+    ) -> Sequence | Polypeptide:
+        """Decode only the region [start, end) of a sequence, uncached."""
+        return self._index.fetch(seq_id, start, end, strict=self._strict)
+
+    def seq_len(self, seq_id: str) -> int:
+        """Return the length of a sequence without decoding it."""
+        return self._index.length(seq_id)
+
+    def seq_ids(self) -> list[str]:
+        """Return a list of sequence IDs in the collection."""
+        return self._index.seq_ids()
+
+    def seqs(self) -> list[Sequence | Polypeptide]:
+        """Return a list of all sequences, decoding every record."""
+        return [self[seq_id] for seq_id in self._index]
+
+    def entry_list(self) -> list[SeqEntry]:
+        """Return a list of all SeqEntry objects, decoding every record."""
+        return list(self)
+
+    def seq_dict(self) -> dict[str, Sequence | Polypeptide]:
+        """Return a dictionary of seq_id to Sequence or Polypeptide."""
+        return {seq_id: self[seq_id] for seq_id in self._index}
+
+    def items(self) -> Iterator[tuple[str, SeqEntry]]:
+        """Iterate over (seq_id, SeqEntry) pairs, decoding one at a time."""
+        for seq_id in self._index:
+            yield seq_id, self.get_entry(seq_id)
+
+    def keys(self) -> Iterable[str]:
+        """Return the sequence IDs."""
+        return self._index.records.keys()
+
+    def values(self) -> Iterator[SeqEntry]:
+        """Iterate over SeqEntry objects, decoding one at a time."""
+        return iter(self)
+
+    def clear_cache(self) -> None:
+        """Drop every cached sequence."""
+        self._cache.clear()
+
+    def close(self) -> None:
+        """Drop the cache and release the memory map."""
+        self._cache.clear()
+        self._index.close()
+
+    def __enter__(self) -> "LazySeqCollections":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[SeqEntry]:
+        for seq_id in self._index:
+            yield self.get_entry(seq_id)
+
+    def __getitem__(self, seq_id: str) -> Sequence | Polypeptide:
+        cache = self._cache
+        if seq_id in cache:
+            cache.move_to_end(seq_id)
+            return cache[seq_id]
+
+        seq = self._index.fetch(seq_id, strict=self._strict)
+        if self._cache_size:
+            cache[seq_id] = seq
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return seq
+
+    def __contains__(self, seq_id: str) -> bool:
+        return seq_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazySeqCollections('{self._source}', {len(self)} records, "
+            f"cache_size={self._cache_size})"
+        )
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+def main():
+    from omibio.analysis import find_orfs
+
+    input_path = r"./examples/data/example_long_seqs.fasta"
+    with LazySeqCollections(input_path, cache_size=4) as seqs:
+        print(repr(seqs))
+        print(find_orfs(seqs["random_seq_1"], min_length=100))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from omibio.sequence.sequence import Sequence
 from omibio.sequence.polypeptide import Polypeptide
+from omibio.sequence.sequence_view import SequenceView
 from typing import Sequence as typing_Sequence, Any
 
 
@@ -77,6 +78,24 @@ class SeqInterval:
                 "Cannot create Sequence: nt_seq is not set. "
             )
 
+    def view(self, parent: Sequence) -> SequenceView:
+        """Return the interval as a zero-copy view on its parent sequence.
+
+        start and end are positions in parent; a "-" strand interval
+        reads the reverse complement.
+        """
+        if not isinstance(parent, Sequence):
+            raise TypeError(
+                "view() argument 'parent' must be Sequence, got "
+                + type(parent).__name__
+            )
+        if self.end > len(parent):
+            raise ValueError(
+                f"Interval end ({self.end}) exceeds parent length "
+                f"({len(parent)})"
+            )
+        return SequenceView(parent, self.start, self.end, self.strand)
+
     def to_polypeptide(self, strict: bool = False) -> Polypeptide:
         """Returns the amino acid sequence as a Polypeptide object."""
 
@@ -2,7 +2,7 @@ import click
 from omibio.sequence import shuffle_seq
 import random
 from omibio.cli.fasta_cli import fasta_group
-from omibio.io import read_fasta, write_fasta
+from omibio.io import read_fasta_iter, FastaWriter
 from typing import TextIO
 
 
@@ -34,18 +34,15 @@ def shuffle(
     and output them to the specified file.
     """
 
-    res = {}
     rng = random.Random(seed)
 
-    seqs = read_fasta(source).seq_dict()
+    def shuffled():
+        for entry in read_fasta_iter(source):
+            seq_seed = rng.randint(0, 2**32 - 1)
+            yield entry.seq_id, shuffle_seq(
+                entry.seq, seed=seq_seed, as_str=True
+            )
 
-    for name, seq in seqs.items():
-        seq_seed = rng.randint(0, 2**32 - 1)
-        shuffled = shuffle_seq(seq, seed=seq_seed, as_str=True)
-        res[name] = shuffled
-
-    if output is not None:
-        write_fasta(file_name=output, seqs=res)
-    else:
-        for line in write_fasta(seqs=res):
-            click.echo(line)
+    target = output if output is not None else click.get_text_stream("stdout")
+    with FastaWriter(target) as writer:
+        writer.write_many(shuffled())
@@ -1,6 +1,6 @@
 import click
 from omibio.cli.fastq_cli import fastq_group
-from omibio.io import read_fastq_iter, write_fasta
+from omibio.io import read_fastq_iter, FastaWriter
 from typing import TextIO
 
 
@@ -40,17 +40,14 @@ def to_fasta(
     result = read_fastq_iter(source)
 
     if prefix is not None:
-        count = 1
-        seqs = {}
-        for e in result:
-            seqs[f"{prefix}_{count}"] = e.seq
-            count += 1
+        records = (
+            (f"{prefix}_{i}", e.seq) for i, e in enumerate(result, start=1)
+        )
     else:
-        seqs = {e.seq_id: e.seq for e in result}
+        records = ((e.seq_id, e.seq) for e in result)
 
+    target = output if output is not None else click.get_text_stream("stdout")
+    with FastaWriter(target, line_len=int(line_len)) as writer:
+        writer.write_many(records)
     if output is not None:
-        write_fasta(seqs=seqs, file_name=output, line_len=int(line_len))
         click.echo(f"Written to {output}")
-    else:
-        for line in write_fasta(seqs=seqs, line_len=int(line_len)):
-            click.echo(line)
@@ -10,9 +10,13 @@ def kmer_group():
 def register_commands():
     from .kmer_count import count
     from .kmer_total import total
+    from .kmer_spectrum import spectrum
+    from .kmer_hist import hist
 
     kmer_group.add_command(count)
     kmer_group.add_command(total)
+    kmer_group.add_command(spectrum)
+    kmer_group.add_command(hist)
 
 
 register_commands()
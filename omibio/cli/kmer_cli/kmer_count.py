@@ -1,7 +1,7 @@
 import click
 from omibio.cli.kmer_cli import kmer_group
 from omibio.io import read_fasta_iter
-from omibio.analysis import kmer
+from omibio.analysis import kmer, kmer_approximate
 from typing import TextIO
 import csv
 
@@ -46,6 +46,26 @@ import csv
     is_flag=True,
     help="Whether nto to sort k-mer results in a decreasing order."
 )
+@click.option(
+    "--approx",
+    is_flag=True,
+    help=(
+        "Estimate the top k-mers (--top, default 100) of each sequence "
+        "in constant memory with a count-min sketch."
+    )
+)
+@click.option(
+    "--sketch-width",
+    type=click.IntRange(min=1),
+    default=1 << 20,
+    help="Counters per row of the sketch used with --approx."
+)
+@click.option(
+    "--sketch-depth",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Rows of the sketch used with --approx. Defaults to 4."
+)
 def count(
     source: TextIO,
     k: int,
@@ -53,7 +73,10 @@ def count(
     canonical: bool,
     output: str | None,
     top: int | None,
-    no_sort: bool
+    no_sort: bool,
+    approx: bool,
+    sketch_width: int,
+    sketch_depth: int
 ):
     """Count k-mers for each sequence in a FASTA file."""
 
@@ -62,9 +85,19 @@ def count(
     results: list[list[str | int]] = []
 
     for entry in entries:
-        counts = kmer(
-            entry.seq, k=k, canonical=canonical, min_count=min_count
-        )
+        if approx:
+            # With more than e counters per window the overcount bound is
+            # below 1, so a short record gets a sketch sized to it.
+            width = min(sketch_width, 4 * max(len(entry.seq), 1))
+            counts = kmer_approximate(
+                entry.seq, k, canonical=canonical, min_count=min_count,
+                top=100 if top is None else top, width=width,
+                depth=sketch_depth
+            )
+        else:
+            counts = kmer(
+                entry.seq, k=k, canonical=canonical, min_count=min_count
+            )
         for km, c in counts.items():
             results.append([entry.seq_id, k, km, c])
 
@@ -0,0 +1,110 @@
+import click
+from omibio.cli.kmer_cli import kmer_group
+from omibio.io import read_fasta_iter, read_fastq_iter
+from omibio.analysis import iter_kmer_partitions, kmer_histogram
+from typing import TextIO
+
+
+@kmer_group.command()
+@click.argument(
+    "source",
+    type=click.File("r"),
+    required=False,
+    default="-"
+)
+@click.option(
+    "-k",
+    type=click.IntRange(1, 32),
+    default=21,
+    help="Length of the k-mers to count. Defaults to 21."
+)
+@click.option(
+    "--canonical", "-c",
+    is_flag=True,
+    help="Whether to count canonical k-mers, as usual for reads."
+)
+@click.option(
+    "--fastq", "-q",
+    is_flag=True,
+    help="Whether the input is FASTQ instead of FASTA."
+)
+@click.option(
+    "--max-count",
+    type=click.IntRange(min=3),
+    default=10_000,
+    help="Last bin of the histogram, holding all higher counts."
+)
+@click.option(
+    "--summary", "-s",
+    is_flag=True,
+    help="Whether to print the peak and estimates instead of the bins."
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    default=None,
+    help="Write the histogram to a file in csv format."
+)
+@click.option(
+    "--threads", "-t",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes. Defaults to 1."
+)
+@click.option(
+    "--max-memory",
+    type=click.IntRange(min=1),
+    default=1024,
+    help="Memory budget in MiB for counting. Defaults to 1024."
+)
+@click.option(
+    "--tmp-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for the partition files used while counting."
+)
+def hist(
+    source: TextIO,
+    k: int,
+    canonical: bool,
+    fastq: bool,
+    max_count: int,
+    summary: bool,
+    output: str | None,
+    threads: int,
+    max_memory: int,
+    tmp_dir: str | None
+):
+    """Compute the k-mer abundance histogram of all sequences in a file.
+
+    Records are streamed and counted out of core, and only the counts
+    reach the histogram, so memory stays within --max-memory.
+    """
+
+    entries = read_fastq_iter(source) if fastq else read_fasta_iter(source)
+    parts = iter_kmer_partitions(
+        entries, k, canonical=canonical, max_memory=max_memory << 20,
+        workers=threads, tmp_dir=tmp_dir
+    )
+    result = kmer_histogram(parts, k=k, max_count=max_count)
+
+    if summary:
+        meta = result.metadata
+        het = result.heterozygosity
+        click.echo(f"k = {k}")
+        click.echo(f"Distinct:\t{result.distinct}")
+        click.echo(f"Total:\t{result.total}")
+        click.echo(f"Error cutoff:\t{meta['error_cutoff']}")
+        click.echo(f"Peak:\t{result.peak}")
+        click.echo(f"Coverage:\t{meta.get('coverage')}")
+        click.echo(f"Genome size:\t{result.genome_size}")
+        click.echo(
+            f"Heterozygosity:\t{'N/A' if het is None else f'{het:.4%}'}"
+        )
+    elif output is not None:
+        result.to_csv(output)
+        click.echo(f"Written to {output}")
+    else:
+        click.echo("abundance\tcount")
+        for abundance, count in result.items():
+            click.echo(f"{abundance}\t{count}")
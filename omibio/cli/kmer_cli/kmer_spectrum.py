@@ -0,0 +1,120 @@
+import click
+from omibio.cli.kmer_cli import kmer_group
+from omibio.io import read_fasta_iter
+from omibio.analysis import kmer_spectrum, spectrum_labels
+from omibio.encoding import DENSE_MAX_K
+from typing import TextIO
+import csv
+
+
+def _parse_ks(ctx, param, value: str) -> list[int]:
+    """Parse k-mer lengths such as "1-8" or "2,4,6-8"."""
+    ks: list[int] = []
+    for part in value.split(","):
+        start, _, stop = part.partition("-")
+        try:
+            first, last = int(start), int(stop or start)
+        except ValueError:
+            raise click.BadParameter(
+                f"expected a list such as '1-8' or '2,4,6', got {value!r}"
+            )
+        if last < first:
+            raise click.BadParameter(f"range {part!r} is empty")
+        ks.extend(range(first, last + 1))
+    if min(ks) < 1:
+        raise click.BadParameter(f"k must be positive, got {value!r}")
+    return ks
+
+
+@kmer_group.command()
+@click.argument(
+    "source",
+    type=click.File("r"),
+    required=False,
+    default="-"
+)
+@click.option(
+    "--ks", "-k",
+    default="1-8",
+    callback=_parse_ks,
+    help="k-mer lengths, e.g. '1-8' or '2,4,6'. Defaults to 1-8."
+)
+@click.option(
+    "--min-count", "-min",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Minimum count threshold for k-mers. Defaults to 1."
+)
+@click.option(
+    "--canonical", "-c",
+    is_flag=True,
+    help="Whether to count canonical k-mers."
+)
+@click.option(
+    "--vector", "-v",
+    is_flag=True,
+    help=(
+        "Write one row of ACGT k-mer counts per sequence, with one "
+        "column per k-mer, instead of one row per k-mer."
+    )
+)
+@click.option(
+    "--normalize", "-n",
+    is_flag=True,
+    help="Write frequencies per k instead of counts with --vector."
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    default=None,
+    help="Write details to a file in csv format"
+)
+def spectrum(
+    source: TextIO,
+    ks: list[int],
+    min_count: int,
+    canonical: bool,
+    vector: bool,
+    normalize: bool,
+    output: str | None
+):
+    """Count k-mers of several lengths for each sequence in a FASTA file."""
+
+    if vector and max(ks) > DENSE_MAX_K:
+        raise click.BadParameter(
+            f"k must be at most {DENSE_MAX_K} with --vector, got {max(ks)}",
+            param_hint="'--ks'"
+        )
+
+    entries = read_fasta_iter(source)
+
+    if vector:
+        header = ["seq_id"] + spectrum_labels(ks)
+        rows = (
+            [entry.seq_id] + kmer_spectrum(
+                entry.seq, ks, canonical=canonical, as_vector=True,
+                normalize=normalize
+            ).tolist()
+            for entry in entries
+        )
+    else:
+        header = ["seq_id", "k", "kmer", "count"]
+        rows = (
+            [entry.seq_id, k, km, c]
+            for entry in entries
+            for k, result in kmer_spectrum(
+                entry.seq, ks, canonical=canonical, min_count=min_count
+            ).items()
+            for km, c in result.items()
+        )
+
+    if output is not None:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter="\t")
+            writer.writerow(header)
+            writer.writerows(rows)
+        click.echo(f"Written to {output}")
+    else:
+        click.echo("\t".join(header))
+        for row in rows:
+            click.echo("\t".join(map(str, row)))
@@ -1,9 +1,13 @@
 import click
 from omibio.cli.kmer_cli import kmer_group
 from omibio.io import read_fasta_iter
-from omibio.analysis import kmer
-from collections import Counter
-from typing import TextIO
+from omibio.analysis import (
+    kmer_collection, iter_kmer_partitions, kmer_approximate
+)
+from omibio.analysis.kmer_partition import _track_spelling
+from omibio.encoding import decode_kmers
+from typing import Iterable, Iterator, TextIO
+import heapq
 import csv
 
 
@@ -52,6 +56,49 @@ import csv
     is_flag=True,
     help="Whether nto to sort k-mer results in a decreasing order."
 )
+@click.option(
+    "--threads", "-t",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes. Defaults to 1."
+)
+@click.option(
+    "--max-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Count out of core with disk partitions, using about this many "
+        "MiB. Only k-mers made of ACGT (or ACGU) are counted; windows "
+        "with N or other IUPAC codes are skipped. Results are streamed "
+        "unsorted unless --top is given."
+    )
+)
+@click.option(
+    "--tmp-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Directory for partition files used with --max-memory."
+)
+@click.option(
+    "--approx",
+    is_flag=True,
+    help=(
+        "Estimate the top k-mers (--top, default 100) in constant memory "
+        "with a count-min sketch."
+    )
+)
+@click.option(
+    "--sketch-width",
+    type=click.IntRange(min=1),
+    default=1 << 20,
+    help="Counters per row of the sketch used with --approx."
+)
+@click.option(
+    "--sketch-depth",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Rows of the sketch used with --approx. Defaults to 4."
+)
 def total(
     source: TextIO,
     k: int,
@@ -60,21 +107,57 @@ def total(
     summary: bool,
     output: str | None,
     no_sort: bool,
-    min_count: int
+    min_count: int,
+    threads: int,
+    max_memory: int | None,
+    tmp_dir: str | None,
+    approx: bool,
+    sketch_width: int,
+    sketch_depth: int
 ):
     """Count k-mers in total for all sequence in a FASTA file."""
 
-    entries = read_fasta_iter(source)
-    total_counts: dict[str, int] = Counter()
-    total = 0
+    if approx and (max_memory is not None or tmp_dir is not None):
+        raise click.UsageError(
+            "--approx cannot be combined with --max-memory or --tmp-dir"
+        )
 
-    for entry in entries:
-        counts = kmer(
-            entry.seq, k=k, canonical=canonical
+    entries = read_fasta_iter(source)
+    if approx:
+        result = kmer_approximate(
+            entries, k, seq_id="total", canonical=canonical,
+            min_count=min_count, top=100 if top is None else top,
+            width=sketch_width, depth=sketch_depth, workers=threads
+        )
+        if summary:
+            meta = result.metadata
+            click.echo(f"k = {k}")
+            click.echo(f"Total:\t{meta['total_kmers']}")
+            click.echo(
+                f"Max error:\t{meta['max_error']} "
+                f"(probability {meta['delta']:.3g})\n"
+            )
+            for km, c in result.items():
+                click.echo(f"{km}:\t{c}")
+        elif output is not None:
+            result.to_csv(output)
+            click.echo(f"Written to {output}")
+        else:
+            click.echo("\t".join(["seq_id", "k", "kmer", "count"]))
+            for km, c in result.items():
+                click.echo(f"total\t{k}\t{km}\t{c}")
+        return
+    if max_memory is not None:
+        _total_partitioned(
+            entries, k, canonical, top, summary, output, min_count,
+            threads, max_memory, tmp_dir
         )
-        for km, c in counts.items():
-            total_counts[km] += c
-            total += c
+        return
+
+    total_counts = kmer_collection(
+        entries, k=k, canonical=canonical, workers=threads
+    ).counts
+    total = sum(total_counts.values())
 
     tops = [
         key for key in total_counts.keys()
@@ -85,7 +168,7 @@ def total(
 
     if summary:
         click.echo(f"k = {k}")
-        click.echo(f"Total:\t{k}")
+        click.echo(f"Total:\t{total}")
         click.echo(f"Unique:\t{len(total_counts)}\n")
         for top_kmer in tops[:top]:
             click.echo(f"{top_kmer}:\t{total_counts[top_kmer]}")
@@ -107,3 +190,66 @@ def total(
         else:
             for row in rows:
                 click.echo("\t".join(map(str, row)))
+
+
+def _total_partitioned(
+    entries: Iterator,
+    k: int,
+    canonical: bool,
+    top: int | None,
+    summary: bool,
+    output: str | None,
+    min_count: int,
+    threads: int,
+    max_memory: int,
+    tmp_dir: str | None
+) -> None:
+    """Out-of-core variant of total: only --top k-mers are held in memory."""
+    flags = [False, False]
+    parts = iter_kmer_partitions(
+        _track_spelling(entries, flags), k, canonical=canonical,
+        max_memory=max_memory << 20, workers=threads, tmp_dir=tmp_dir
+    )
+    stats = [0, 0]
+
+    def rows() -> Iterator[list]:
+        for codes, counts in parts:
+            stats[0] += int(counts.sum())
+            stats[1] += len(codes)
+            keep = counts >= min_count
+            codes, counts = codes[keep], counts[keep]
+            yield from (
+                ["total", k, km, c] for km, c in zip(
+                    decode_kmers(codes, k, rna=flags[1] and not flags[0]),
+                    counts.tolist()
+                )
+            )
+
+    results: Iterable[list] = rows()
+    if top is not None:
+        results = heapq.nlargest(top, results, key=lambda row: row[3])
+
+    if summary:
+        if top is None:
+            # Drain the partitions for the totals; nothing is listed.
+            for _ in results:
+                pass
+            results = []
+        click.echo(f"k = {k}")
+        click.echo(f"Total:\t{stats[0]}")
+        click.echo(f"Unique:\t{stats[1]}\n")
+        for row in results:
+            click.echo(f"{row[2]}:\t{row[3]}")
+        return
+
+    header = ["seq_id", "k", "kmer", "count"]
+    if output is not None:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter="\t")
+            writer.writerow(header)
+            writer.writerows(results)
+        click.echo(f"Written to {output}")
+    else:
+        click.echo("\t".join(header))
+        for row in results:
+            click.echo("\t".join(map(str, row)))
@@ -0,0 +1,18 @@
+from omibio.encoding.alphabets import (
+    INVALID, ALPHABETS, encode_table, decode_table, complement_table
+)
+from omibio.encoding.codec import (
+    as_bytes, encode, decode, complement, reverse_complement
+)
+from omibio.encoding.kmers import (
+    MAX_CODE_K, DENSE_MAX_K, kmer_codes, iter_kmer_codes, count_codes,
+    decode_kmers
+)
+
+__all__ = [
+    "INVALID", "ALPHABETS",
+    "encode_table", "decode_table", "complement_table",
+    "as_bytes", "encode", "decode", "complement", "reverse_complement",
+    "MAX_CODE_K", "DENSE_MAX_K", "kmer_codes", "iter_kmer_codes",
+    "count_codes", "decode_kmers",
+]
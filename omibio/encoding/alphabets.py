@@ -0,0 +1,126 @@
+from functools import lru_cache
+import numpy as np
+
+INVALID = 255
+"""Code given to bytes that are not part of an alphabet."""
+
+# Symbols in code order: the code of a symbol is its index.
+_SYMBOLS = {
+    "nt": "ACGTNRYSWKMBDHV-",
+    "2bit": "ACGT",
+    "protein": "ACDEFGHIKLMNPQRSTVWY*X",
+}
+
+# 4-bit IUPAC codes are bit masks of the bases they stand for, so that
+# ambiguity codes compose with bitwise operators.
+_IUPAC_BITS = {"A": 1, "C": 2, "G": 4, "T": 8}
+_IUPAC_MEANING = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT", "-": "",
+}
+
+ALPHABETS = ("nt", "2bit", "iupac4", "protein")
+
+
+def _check_alphabet(alphabet: str) -> None:
+    if alphabet not in ALPHABETS:
+        raise ValueError(
+            f"Unknown alphabet {alphabet!r}, expected one of {ALPHABETS}"
+        )
+
+
+def _symbol_codes(alphabet: str) -> dict[str, int]:
+    if alphabet == "iupac4":
+        return {
+            sym: sum(_IUPAC_BITS[b] for b in bases)
+            for sym, bases in _IUPAC_MEANING.items()
+        }
+    return {sym: code for code, sym in enumerate(_SYMBOLS[alphabet])}
+
+
+@lru_cache(maxsize=None)
+def encode_table(alphabet: str = "nt") -> np.ndarray:
+    """Return the 256-entry byte to code lookup table of an alphabet.
+
+    Lower-case letters share the code of their upper-case form, U shares
+    the code of T in the nucleotide alphabets and every other byte maps
+    to INVALID. The table is built once and returned read-only.
+
+    Args:
+        alphabet (str, optional):
+            "nt" (16 nucleotide and IUPAC codes, A=0 C=1 G=2 T/U=3),
+            "2bit" (A=0 C=1 G=2 T/U=3 only), "iupac4" (4-bit IUPAC bit
+            masks, A=1 C=2 G=4 T/U=8) or "protein" (20 amino acids,
+            '*' and 'X'). Defaults to "nt".
+
+    Raises:
+        ValueError:
+            If the alphabet is unknown.
+
+    Returns:
+        np.ndarray:
+            uint8 lookup table of length 256.
+    """
+    _check_alphabet(alphabet)
+    table = np.full(256, INVALID, dtype=np.uint8)
+    for sym, code in _symbol_codes(alphabet).items():
+        table[ord(sym)] = table[ord(sym.lower())] = code
+    if alphabet != "protein":
+        table[ord("U")] = table[ord("u")] = table[ord("T")]
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def decode_table(alphabet: str = "nt", rna: bool = False) -> np.ndarray:
+    """Return the code to upper-case byte lookup table of an alphabet.
+
+    Codes without a symbol decode to 'N' for nucleotide alphabets and
+    'X' for protein. If rna is True, T is decoded as U.
+
+    Raises:
+        ValueError:
+            If the alphabet is unknown.
+    """
+    _check_alphabet(alphabet)
+    table = np.full(256, ord("X" if alphabet == "protein" else "N"),
+                    dtype=np.uint8)
+    for sym, code in _symbol_codes(alphabet).items():
+        if rna and sym == "T":
+            sym = "U"
+        table[code] = ord(sym)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def complement_table(alphabet: str = "nt") -> np.ndarray:
+    """Return the code to complement code lookup table of an alphabet.
+
+    INVALID is kept as INVALID.
+
+    Raises:
+        ValueError:
+            If the alphabet has no complement (e.g. "protein").
+    """
+    if alphabet == "protein":
+        raise ValueError("Alphabet 'protein' has no complement")
+    _check_alphabet(alphabet)
+    pairs = str.maketrans("ACGTRYKMBVDH", "TGCAYRMKVBHD")
+    table = np.full(256, INVALID, dtype=np.uint8)
+    for sym, code in _symbol_codes(alphabet).items():
+        table[code] = _symbol_codes(alphabet)[sym.translate(pairs)]
+    table.setflags(write=False)
+    return table
+
+
+def main():
+    print(encode_table("nt")[[ord(c) for c in "ACGTUN"]])
+    print(encode_table("iupac4")[[ord(c) for c in "ACGTRN"]])
+    print(decode_table("2bit", rna=True)[:4].tobytes())
+    print(complement_table("2bit")[:4])
+
+
+if __name__ == "__main__":
+    main()
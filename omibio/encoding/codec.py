@@ -0,0 +1,128 @@
+from omibio.encoding.alphabets import (
+    INVALID, encode_table, decode_table, complement_table
+)
+from typing import TYPE_CHECKING, Union
+import numpy as np
+if TYPE_CHECKING:
+    from omibio.sequence import Sequence, Polypeptide, SequenceView
+
+
+def as_bytes(
+    seq: Union["Sequence", "Polypeptide", "SequenceView", str, bytes]
+) -> np.ndarray:
+    """Return the ASCII bytes of a sequence as a uint8 array.
+
+    Bytes-like input is wrapped without copying. Characters outside
+    ASCII become '?', which no alphabet encodes.
+
+    Raises:
+        TypeError:
+            If the input type is not supported.
+    """
+    from omibio.sequence import Sequence, Polypeptide, SequenceView
+
+    if isinstance(seq, (bytes, bytearray, memoryview)):
+        return np.frombuffer(seq, dtype=np.uint8)
+    if isinstance(seq, (Sequence, Polypeptide, SequenceView)):
+        seq = str(seq)
+    elif not isinstance(seq, str):
+        raise TypeError(
+            "as_bytes() argument 'seq' must be Sequence, Polypeptide, "
+            f"SequenceView, str or bytes, not {type(seq).__name__}"
+        )
+    return np.frombuffer(
+        seq.encode("ascii", errors="replace"), dtype=np.uint8
+    )
+
+
+def encode(
+    seq: Union["Sequence", "Polypeptide", "SequenceView", str, bytes],
+    alphabet: str = "nt",
+    strict: bool = False
+) -> np.ndarray:
+    """Encode a sequence into an array of alphabet codes.
+
+    Args:
+        seq (Sequence | Polypeptide | SequenceView | str | bytes):
+            Input sequence. Case is ignored.
+        alphabet (str, optional):
+            "nt", "2bit", "iupac4" or "protein", see encode_table().
+            Defaults to "nt".
+        strict (bool, optional):
+            Whether to raise on characters outside the alphabet instead
+            of encoding them as INVALID. Defaults to False.
+
+    Raises:
+        TypeError:
+            If the input type is not supported.
+        ValueError:
+            If the alphabet is unknown, or strict is True and the sequence
+            has characters outside the alphabet.
+
+    Returns:
+        np.ndarray:
+            uint8 array of codes, one per character.
+    """
+    codes = encode_table(alphabet)[as_bytes(seq)]
+    if strict and (bad := np.flatnonzero(codes == INVALID)).size:
+        raw = as_bytes(seq)
+        invalid = {chr(c) for c in np.unique(raw[bad])}
+        raise ValueError(
+            f"(Strict Mode) Invalid character(s) for alphabet "
+            f"{alphabet!r} found: {invalid}"
+        )
+    return codes
+
+
+def decode(
+    codes: np.ndarray, alphabet: str = "nt", rna: bool = False
+) -> str:
+    """Decode an array of alphabet codes back into an upper-case str.
+
+    Args:
+        codes (np.ndarray):
+            Integer array of codes.
+        alphabet (str, optional):
+            Alphabet the codes belong to. Defaults to "nt".
+        rna (bool, optional):
+            Whether to decode T as U. Defaults to False.
+
+    Raises:
+        TypeError:
+            If codes is not a np.ndarray.
+        ValueError:
+            If the alphabet is unknown.
+
+    Returns:
+        str: Decoded sequence. INVALID decodes to 'N' (or 'X').
+    """
+    if not isinstance(codes, np.ndarray):
+        raise TypeError(
+            "decode() argument 'codes' must be np.ndarray, not "
+            + type(codes).__name__
+        )
+    table = decode_table(alphabet, rna)
+    return table[codes.astype(np.uint8, copy=False)].tobytes().decode()
+
+
+def complement(codes: np.ndarray, alphabet: str = "nt") -> np.ndarray:
+    """Return the complement of an array of nucleotide codes."""
+    return complement_table(alphabet)[codes]
+
+
+def reverse_complement(
+    codes: np.ndarray, alphabet: str = "nt"
+) -> np.ndarray:
+    """Return the reverse complement of an array of nucleotide codes."""
+    return complement_table(alphabet)[codes[::-1]]
+
+
+def main():
+    codes = encode("ACGTRYNacgt")
+    print(codes)
+    print(decode(reverse_complement(codes)))
+    print(encode("ACGU", "iupac4"), encode("MKV*", "protein"))
+
+
+if __name__ == "__main__":
+    main()
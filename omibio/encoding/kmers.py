@@ -0,0 +1,241 @@
+from omibio.encoding.alphabets import INVALID
+from typing import Iterable, Iterator
+import numpy as np
+
+MAX_CODE_K = 32
+"""Largest k whose 2-bit codes fit in a uint64."""
+
+DENSE_MAX_K = 12
+"""Largest k counted with np.bincount into a dense 4**k array."""
+
+# The dense count is used only when the windows fill at least 1 / this
+# share of the 4**k slots; below that, sorting the windows is cheaper.
+_DENSE_MIN_FILL = 2
+
+_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+_RNA_BASES = np.frombuffer(b"ACGU", dtype=np.uint8)
+
+
+def _check_k(k: int) -> None:
+    if not isinstance(k, int):
+        raise TypeError(f"argument 'k' must be int, got {type(k).__name__}")
+    if not 0 < k <= MAX_CODE_K:
+        raise ValueError(
+            f"argument 'k' must be between 1 and {MAX_CODE_K}, got {k}"
+        )
+
+
+def kmer_codes(
+    codes: np.ndarray, k: int, canonical: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the integer code of every k-mer window of a 2-bit sequence.
+
+    Window i gets the code sum(codes[i+j] << 2*(k-1-j)), so numeric order
+    matches the lexicographic order of the ACGT strings. With canonical,
+    the reverse complement codes are rolled alongside and each window
+    gets the smaller of the two, i.e. the code of min(kmer, rev_comp).
+    Windows that contain an INVALID code are flagged in the mask and
+    their code is meaningless.
+
+    Args:
+        codes (np.ndarray):
+            2-bit codes from encode(seq, "2bit").
+        k (int):
+            Length of the k-mers, at most MAX_CODE_K.
+        canonical (bool, optional):
+            Whether to return canonical codes. Defaults to False.
+
+    Raises:
+        TypeError:
+            If k is not an int.
+        ValueError:
+            If k is out of range.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            uint64 codes and a bool mask of windows made only of ACGT,
+            both of length max(len(codes) - k + 1, 0).
+    """
+    _check_k(k)
+    n_windows = len(codes) - k + 1
+    if n_windows <= 0:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=bool)
+
+    bad = codes == INVALID
+    bad_before = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(bad, out=bad_before[1:])
+    valid = bad_before[k:] == bad_before[:-k]
+
+    base = np.where(bad, 0, codes).astype(np.uint64)
+    fwd = np.zeros(n_windows, dtype=np.uint64)
+    for j in range(k):
+        fwd <<= np.uint64(2)
+        fwd |= base[j: j + n_windows]
+    if not canonical:
+        return fwd, valid
+
+    # The complement of a 2-bit code c is 3 - c, and the reverse
+    # complement reads the window backwards.
+    comp = np.uint64(3) - base
+    rev = np.zeros(n_windows, dtype=np.uint64)
+    for j in range(k):
+        rev |= comp[j: j + n_windows] << np.uint64(2 * j)
+    np.minimum(fwd, rev, out=fwd)
+    return fwd, valid
+
+
+def iter_kmer_codes(
+    codes: np.ndarray, ks: Iterable[int], canonical: bool = False
+) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """Compute the k-mer codes for several k from one pass over a sequence.
+
+    The codes of length k are built from those of length k - 1 with one
+    shift and one OR per window, instead of k of them, so all of
+    k = 1..K cost about as much as kmer_codes() for k = K alone.
+
+    Args:
+        codes (np.ndarray):
+            2-bit codes from encode(seq, "2bit").
+        ks (Iterable[int]):
+            k-mer lengths, each at most MAX_CODE_K.
+        canonical (bool, optional):
+            Whether to return canonical codes. Defaults to False.
+
+    Raises:
+        TypeError:
+            If a k is not an int.
+        ValueError:
+            If a k is out of range.
+
+    Yields:
+        tuple[int, np.ndarray, np.ndarray]:
+            k with the codes and mask of kmer_codes(codes, k, canonical),
+            in increasing order of k.
+    """
+    ks = sorted(set(ks))
+    for k in ks:
+        _check_k(k)
+    if not ks:
+        return
+
+    bad = codes == INVALID
+    bad_before = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(bad, out=bad_before[1:])
+    base = np.where(bad, 0, codes).astype(np.uint64)
+    comp = np.uint64(3) - base
+    fwd = np.zeros(len(codes), dtype=np.uint64)
+    rev = np.zeros(len(codes), dtype=np.uint64)
+
+    wanted = set(ks)
+    for k in range(1, ks[-1] + 1):
+        n_windows = len(codes) - k + 1
+        if n_windows <= 0:
+            for longer in ks:
+                if longer >= k:
+                    yield (
+                        longer, np.empty(0, dtype=np.uint64),
+                        np.empty(0, dtype=bool)
+                    )
+            return
+        # Drop the last window and append the next base to the rest.
+        fwd = fwd[:n_windows]
+        fwd <<= np.uint64(2)
+        fwd |= base[k - 1:]
+        if canonical:
+            rev = rev[:n_windows]
+            rev |= comp[k - 1:] << np.uint64(2 * (k - 1))
+        if k in wanted:
+            valid = bad_before[k:] == bad_before[:-k]
+            if canonical:
+                yield k, np.minimum(fwd, rev), valid
+            else:
+                yield k, fwd.copy(), valid
+
+
+def count_codes(
+    kcodes: np.ndarray, k: int, first_index: bool = False
+) -> tuple[np.ndarray, ...]:
+    """Count k-mer codes.
+
+    For k <= DENSE_MAX_K and at least 4**k / 2 codes, they are counted
+    with np.bincount into a dense 4**k array; otherwise, e.g. for a short
+    sequence, they are counted by sort-and-unique, so the work and memory
+    follow len(kcodes) rather than 4**k.
+
+    Args:
+        kcodes (np.ndarray):
+            uint64 k-mer codes, e.g. the valid windows of kmer_codes().
+        k (int):
+            Length of the k-mers.
+        first_index (bool, optional):
+            Whether to also return the index of the first occurrence of
+            every code in kcodes. Defaults to False.
+
+    Returns:
+        tuple[np.ndarray, ...]:
+            Sorted distinct codes (uint64) and their counts (int64), plus
+            the first indices (int64) if requested.
+    """
+    _check_k(k)
+    if k <= DENSE_MAX_K and len(kcodes) * _DENSE_MIN_FILL >= 4 ** k:
+        dense = np.bincount(kcodes.astype(np.intp), minlength=4 ** k)
+        uniq = np.flatnonzero(dense)
+        counts = dense[uniq].astype(np.int64)
+        uniq = uniq.astype(np.uint64)
+        if not first_index:
+            return uniq, counts
+        # At this fill the scratch array is at most twice kcodes.
+        first = np.full(4 ** k, len(kcodes), dtype=np.int64)
+        np.minimum.at(
+            first, kcodes.astype(np.intp), np.arange(len(kcodes))
+        )
+        return uniq, counts, first[uniq.astype(np.intp)]
+
+    if not first_index:
+        uniq, counts = np.unique(kcodes, return_counts=True)
+        return uniq, counts.astype(np.int64)
+    uniq, first, counts = np.unique(
+        kcodes, return_index=True, return_counts=True
+    )
+    return uniq, counts.astype(np.int64), first.astype(np.int64)
+
+
+def decode_kmers(
+    kcodes: np.ndarray, k: int, rna: bool = False
+) -> list[str]:
+    """Decode k-mer codes back into strings, all at once.
+
+    Args:
+        kcodes (np.ndarray):
+            k-mer codes from kmer_codes().
+        k (int):
+            Length of the k-mers.
+        rna (bool, optional):
+            Whether to decode code 3 as U instead of T. Defaults to False.
+
+    Returns:
+        list[str]: One k-mer string per code.
+    """
+    _check_k(k)
+    kcodes = np.asarray(kcodes, dtype=np.uint64)
+    bases = _RNA_BASES if rna else _BASES
+    letters = np.empty((len(kcodes), k), dtype=np.uint8)
+    for j in range(k):
+        shift = np.uint64(2 * (k - 1 - j))
+        digit = (kcodes >> shift) & np.uint64(3)
+        letters[:, j] = bases[digit.astype(np.intp)]
+    text = letters.tobytes().decode()
+    return [text[i: i + k] for i in range(0, len(text), k)]
+
+
+def main():
+    from omibio.encoding import encode
+
+    codes = encode("ACGTNACGTT", "2bit")
+    kcodes, valid = kmer_codes(codes, 3)
+    uniq, counts = count_codes(kcodes[valid], 3)
+    print(dict(zip(decode_kmers(uniq, 3), counts.tolist())))
+
+
+if __name__ == "__main__":
+    main()
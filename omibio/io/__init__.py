@@ -1,13 +1,19 @@
 from omibio.io.read_fasta import read_fasta, read_fasta_iter
-from omibio.io.write_fasta import write_fasta
-from omibio.io.read_fastq import read_fastq, read_fastq_iter
-from omibio.io.write_fastq import write_fastq
+from omibio.io.write_fasta import write_fasta, FastaWriter
+from omibio.io.read_fastq import (
+    read_fastq, read_fastq_iter, read_fastq_batches
+)
+from omibio.io.write_fastq import write_fastq, FastqWriter
 from omibio.io.read import read
+from omibio.io.fasta_index import (
+    FastaIndex, FaiRecord, build_fai, read_fai
+)
 
 __all__ = [
     "read_fasta", "read_fasta_iter",
-    "write_fasta",
-    "read_fastq", "read_fastq_iter",
-    "write_fastq",
+    "write_fasta", "FastaWriter",
+    "read_fastq", "read_fastq_iter", "read_fastq_batches",
+    "write_fastq", "FastqWriter",
     "read",
+    "FastaIndex", "FaiRecord", "build_fai", "read_fai",
 ]
@@ -0,0 +1,276 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from os import PathLike
+from pathlib import Path
+from typing import IO
+import threading
+import os
+import queue
+import gzip
+import zlib
+import io
+
+
+COMPRESSION_SUFFIXES = {".gz", ".bgz", ".bgzf"}
+
+# zlib window bits that accept a gzip header and trailer.
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def split_compression_suffix(path: str | PathLike) -> tuple[str, bool]:
+    """Return the format suffix of a path and whether it is compressed.
+
+    Args:
+        path (str | PathLike):
+            The file path, e.g. "reads.fastq.gz".
+
+    Returns:
+        tuple[str, bool]:
+            The lower-cased format suffix with its leading dot (".fastq")
+            and whether a gzip/BGZF suffix was stripped to find it.
+    """
+    p = Path(path)
+    suffix = p.suffix.lower()
+    if suffix in COMPRESSION_SUFFIXES:
+        return Path(p.stem).suffix.lower(), True
+    return suffix, False
+
+
+class ThreadedGzipReader(io.RawIOBase):
+    """Read a gzip or BGZF file, decompressing on a background thread.
+
+    BGZF files are regular multi-member gzip files, so both are handled
+    the same way. A worker thread inflates fixed-size chunks of compressed
+    input with zlib and feeds the output through a bounded queue while the
+    consumer parses the previous ones. zlib releases the GIL while it
+    inflates, so decompression and parsing overlap on separate cores.
+
+    Args:
+        path (str | PathLike):
+            Path to the compressed file.
+        chunk_size (int, optional):
+            Number of compressed bytes inflated per step. Defaults to 1 MiB.
+        max_chunks (int, optional):
+            Maximum number of chunks waiting in the queue. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        chunk_size: int = 1 << 20,
+        max_chunks: int = 8
+    ):
+        super().__init__()
+        self._path = path
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        self._chunk = b""
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._decompress, daemon=True)
+        self._thread.start()
+
+    def _decompress(self) -> None:
+        try:
+            with open(self._path, "rb") as raw:
+                decomp = zlib.decompressobj(_GZIP_WBITS)
+                fed = False
+                while not self._stop.is_set():
+                    data = raw.read(self._chunk_size)
+                    if not data:
+                        break
+                    while data:
+                        fed = True
+                        chunk = decomp.decompress(data)
+                        if chunk:
+                            self._put(chunk)
+                        if not decomp.eof:
+                            break
+                        # Start of the next gzip member (BGZF block).
+                        data = decomp.unused_data
+                        decomp = zlib.decompressobj(_GZIP_WBITS)
+                        fed = False
+                if fed and not self._stop.is_set():
+                    raise EOFError(
+                        "Compressed file ended before the end-of-stream "
+                        "marker was reached"
+                    )
+            self._put(b"")
+        except BaseException as e:
+            self._put(e)
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._pos >= len(self._chunk):
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._chunk = item
+            self._pos = 0
+
+        n = min(len(buffer), len(self._chunk) - self._pos)
+        buffer[:n] = self._chunk[self._pos: self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+        super().close()
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """Write a gzip file, compressing independent blocks on a thread pool.
+
+    Output is cut into blocks of block_size bytes and every block is
+    compressed into its own gzip member, the same layout BGZF uses. The
+    result is a valid multi-member gzip file that gzip, zcat and
+    open_source() read back as one stream. zlib releases the GIL while it
+    compresses, so several blocks are deflated at once while the caller
+    keeps producing data.
+
+    Args:
+        path (str | PathLike):
+            Path to the output file.
+        block_size (int, optional):
+            Number of uncompressed bytes per gzip member.
+            Defaults to 1 MiB.
+        compresslevel (int, optional):
+            zlib compression level from 0 to 9. Defaults to 6.
+        threads (int | None, optional):
+            Number of compression threads. Defaults to the CPU count,
+            capped at 8.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        block_size: int = 1 << 20,
+        compresslevel: int = 6,
+        threads: int | None = None
+    ):
+        super().__init__()
+        if threads is None:
+            threads = min(os.cpu_count() or 1, 8)
+        self._block_size = block_size
+        self._level = compresslevel
+        self._max_pending = threads * 2
+        self._buffer = bytearray()
+        self._pending: deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._raw = open(path, "wb")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        self._buffer += data
+        size = self._block_size
+        if len(self._buffer) >= size:
+            view = memoryview(self._buffer)
+            cut = len(view) - len(view) % size
+            for i in range(0, cut, size):
+                self._submit(bytes(view[i: i + size]))
+            view.release()
+            del self._buffer[:cut]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        # Bound the number of blocks in flight, writing them in order.
+        while len(self._pending) >= self._max_pending:
+            self._raw.write(self._pending.popleft().result())
+        self._pending.append(
+            self._executor.submit(gzip.compress, block, self._level, mtime=0)
+        )
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._raw.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._raw.close()
+            super().close()
+
+
+def open_source(
+    path: str | PathLike,
+    mode: str = "r",
+    threaded: bool = True
+) -> IO:
+    """Open a possibly compressed input file for reading.
+
+    Args:
+        path (str | PathLike):
+            Path to the input file. Files ending in .gz, .bgz or .bgzf are
+            decompressed transparently.
+        mode (str, optional):
+            "r" for text or "rb" for bytes. Defaults to "r".
+        threaded (bool, optional):
+            Whether to decompress on a background thread. Defaults to True.
+
+    Raises:
+        ValueError:
+            If the mode is not "r" or "rb".
+
+    Returns:
+        IO:
+            A readable text or binary file object.
+    """
+    if mode not in {"r", "rb"}:
+        raise ValueError(
+            f"open_source() argument 'mode' must be 'r' or 'rb', got {mode!r}"
+        )
+
+    _, compressed = split_compression_suffix(path)
+    if not compressed:
+        return open(path, mode)
+
+    raw: IO[bytes]
+    if threaded:
+        raw = io.BufferedReader(ThreadedGzipReader(path), 1 << 16)
+    else:
+        raw = gzip.open(path, "rb")
+    return raw if mode == "rb" else io.TextIOWrapper(raw)
+
+
+def main():
+    input_path = r"./examples/data/example_short_seqs.fasta"
+    output_path = r"./examples/output/compression_output.fasta.gz"
+    print(split_compression_suffix(input_path + ".gz"))
+    with open_source(input_path) as f:
+        print(f.readline().rstrip())
+
+    with open(input_path, "rb") as src, ParallelGzipWriter(output_path) as f:
+        f.write(src.read())
+    with open_source(output_path) as f:
+        print(f.readline().rstrip())
+
+
+if __name__ == "__main__":
+    main()
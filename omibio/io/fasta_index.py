@@ -0,0 +1,440 @@
+from dataclasses import dataclass
+from omibio.sequence import Sequence, Polypeptide
+from omibio.utils import ensure_path
+from omibio.io.read_fasta import FastaFormatError
+from omibio.io.compression import split_compression_suffix
+from os import PathLike
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+import warnings
+import mmap
+
+
+@dataclass(frozen=True)
+class FaiRecord:
+    """One line of a samtools-compatible .fai index.
+
+    Args:
+        name (str):
+            Sequence name, the first word of the header line.
+        length (int):
+            Total number of bases in the sequence.
+        offset (int):
+            Byte offset of the first base in the FASTA file.
+        line_bases (int):
+            Number of bases on each full line.
+        line_width (int):
+            Number of bytes on each full line, including the line break.
+    """
+
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+    def byte_offset(self, pos: int) -> int:
+        """Return the file offset of the base at 0-based position pos."""
+        if not self.line_bases:
+            return self.offset
+        line, col = divmod(pos, self.line_bases)
+        return self.offset + line * self.line_width + col
+
+    def to_line(self) -> str:
+        return (
+            f"{self.name}\t{self.length}\t{self.offset}\t"
+            f"{self.line_bases}\t{self.line_width}"
+        )
+
+
+def _check_fasta_path(path: str | PathLike) -> Path:
+    file_path = ensure_path(path)
+    suffix, compressed = split_compression_suffix(file_path)
+    if compressed:
+        raise FastaFormatError(
+            f"Cannot index compressed file '{file_path}', decompress it first"
+        )
+    if suffix not in {".faa", ".fa", ".fasta", ".fna"}:
+        raise FastaFormatError(f"Invalid format to index: {suffix}")
+    return file_path
+
+
+def build_fai(
+    path: str | PathLike,
+    fai_path: str | PathLike | None = None,
+    write: bool = True
+) -> list[FaiRecord]:
+    """Index a FASTA file and write a samtools-compatible .fai sidecar.
+
+    Every line of a record except the last must have the same length,
+    which is what makes byte offsets computable.
+
+    Args:
+        path (str | PathLike):
+            Path to the uncompressed FASTA file.
+        fai_path (str | PathLike | None, optional):
+            Path of the index to write. Defaults to path + ".fai".
+        write (bool, optional):
+            Whether to write the index file. Defaults to True.
+
+    Raises:
+        FileNotFoundError:
+            If the FASTA file is not found.
+        FastaFormatError:
+            If the file is compressed, not a FASTA file, has a record with
+            inconsistent line lengths, a missing or duplicate name, or
+            data before the first header.
+
+    Returns:
+        list[FaiRecord]:
+            The index records, in file order.
+    """
+
+    file_path = _check_fasta_path(path)
+    records: list[FaiRecord] = []
+
+    if file_path.stat().st_size:
+        with open(file_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            records = _scan(mm, str(file_path))
+
+    if write:
+        _write_fai(
+            records,
+            Path(fai_path) if fai_path is not None else _fai_path(file_path)
+        )
+
+    return records
+
+
+def _fai_path(file_path: Path) -> Path:
+    return file_path.with_name(file_path.name + ".fai")
+
+
+def _write_fai(records: list[FaiRecord], path: Path) -> None:
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(rec.to_line() + "\n" for rec in records)
+
+
+def _scan(mm: mmap.mmap, file_name: str) -> list[FaiRecord]:
+    """Internal helper. Locate every record of a memory-mapped FASTA."""
+    n = len(mm)
+    records: list[FaiRecord] = []
+    seen: set[str] = set()
+
+    pos = 0
+    while pos < n and mm[pos: pos + 1] != b">":
+        eol = mm.find(b"\n", pos)
+        eol = n if eol == -1 else eol
+        if mm[pos: eol].strip():
+            raise FastaFormatError(
+                f"{file_name}: data found before the first header"
+            )
+        pos = eol + 1
+
+    while pos < n:
+        header_end = mm.find(b"\n", pos)
+        header_end = n if header_end == -1 else header_end
+        words = mm[pos + 1: header_end].decode().split()
+        if not words:
+            raise FastaFormatError(
+                f"{file_name}: sequence name missing at byte {pos}"
+            )
+        name = words[0]
+        if name in seen:
+            raise FastaFormatError(f"{file_name}: duplicate name '{name}'")
+        seen.add(name)
+
+        seq_start = min(header_end + 1, n)
+        nxt = mm.find(b"\n>", header_end)
+        seq_end = n if nxt == -1 else nxt + 1
+
+        # Copy one record at a time so no buffer export outlives the map.
+        region = np.frombuffer(mm[seq_start: seq_end], dtype=np.uint8)
+        length, line_bases, line_width = _measure(region, name, file_name)
+        records.append(
+            FaiRecord(name, length, seq_start, line_bases, line_width)
+        )
+        pos = seq_end
+
+    return records
+
+
+def _measure(
+    region: np.ndarray, name: str, file_name: str
+) -> tuple[int, int, int]:
+    """Internal helper. Return (length, line_bases, line_width)."""
+    if not len(region):
+        return 0, 0, 0
+    ends = np.flatnonzero(region == 10) + 1
+    if region[-1] != 10:
+        ends = np.append(ends, len(region))
+    starts = np.concatenate(([0], ends[:-1]))
+    widths = ends - starts
+
+    # Line breaks are "\n" or "\r\n"; count them out of each line.
+    has_lf = region[ends - 1] == 10
+    has_cr = np.zeros(len(ends), dtype=bool)
+    two = widths >= 2
+    has_cr[two] = has_lf[two] & (region[ends[two] - 2] == 13)
+    bases = widths - has_lf - has_cr
+
+    # Blank lines are only allowed at the end of a record.
+    nonblank = np.flatnonzero(bases)
+    if not len(nonblank):
+        return 0, 0, 0
+    last = nonblank[-1]
+    bases, widths = bases[: last + 1], widths[: last + 1]
+
+    line_bases = int(bases[0])
+    line_width = int(widths[0])
+    if (
+        (bases[:-1] != line_bases).any()
+        or (widths[:-1] != line_width).any()
+        or bases[-1] > line_bases
+    ):
+        raise FastaFormatError(
+            f"{file_name}: different line length in sequence '{name}'"
+        )
+    if len(bases) == 1 and not has_lf[0]:
+        # A lone line without a line break, count one like samtools.
+        line_width += 1
+    return int(bases.sum()), line_bases, line_width
+
+
+def read_fai(path: str | PathLike) -> list[FaiRecord]:
+    """Read a .fai index file.
+
+    Raises:
+        FileNotFoundError:
+            If the index file is not found.
+        FastaFormatError:
+            If a line does not have the five .fai columns.
+    """
+    records = []
+    with open(ensure_path(path), "r", encoding="utf-8") as f:
+        for i, line in enumerate(f, start=1):
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) < 5:
+                raise FastaFormatError(f"Invalid .fai line {i}: {line!r}")
+            name, *numbers = fields[:5]
+            try:
+                records.append(FaiRecord(name, *map(int, numbers)))
+            except ValueError as e:
+                raise FastaFormatError(
+                    f"Invalid .fai line {i}: {line!r}"
+                ) from e
+    return records
+
+
+class FastaIndex:
+    """Random access to the records of an indexed FASTA file.
+
+    The .fai sidecar is loaded if present, otherwise it is built and
+    written next to the FASTA file. fetch() seeks straight to the bytes of
+    the requested region, so its cost depends on the region size only.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        fai_path: str | PathLike | None = None,
+        rebuild: bool = False,
+        use_mmap: bool = False
+    ):
+        """Initialization for FastaIndex.
+
+        Args:
+            path (str | PathLike):
+                Path to the uncompressed FASTA file.
+            fai_path (str | PathLike | None, optional):
+                Path of the .fai index. Defaults to path + ".fai".
+            rebuild (bool, optional):
+                Whether to rebuild the index even if it exists and is
+                newer than the FASTA file. Defaults to False.
+            use_mmap (bool, optional):
+                Whether to read regions from a memory map instead of
+                seeking a file handle. Defaults to False.
+
+        Raises:
+            FileNotFoundError:
+                If the FASTA file is not found.
+            FastaFormatError:
+                If the file cannot be indexed.
+        """
+        self._path = _check_fasta_path(path)
+        self._fai_path = (
+            Path(fai_path) if fai_path is not None
+            else _fai_path(self._path)
+        )
+        self._faa = self._path.suffix.lower() == ".faa"
+        self._use_mmap = use_mmap
+        self._fh = None
+        self._mm: mmap.mmap | None = None
+
+        if (
+            not rebuild and self._fai_path.exists()
+            and self._fai_path.stat().st_mtime >= self._path.stat().st_mtime
+        ):
+            records = read_fai(self._fai_path)
+        else:
+            records = build_fai(self._path, write=False)
+            try:
+                _write_fai(records, self._fai_path)
+            except OSError as e:
+                warnings.warn(
+                    f"Could not write index to '{self._fai_path}': {e}"
+                )
+        self._records = {rec.name: rec for rec in records}
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the indexed FASTA file."""
+        return self._path
+
+    @property
+    def fai_path(self) -> Path:
+        """Return the path of the .fai index."""
+        return self._fai_path
+
+    @property
+    def records(self) -> dict[str, FaiRecord]:
+        """Return the dictionary of index records."""
+        return self._records
+
+    def seq_ids(self) -> list[str]:
+        """Return a list of sequence IDs in the index."""
+        return list(self._records.keys())
+
+    def get_record(self, seq_id: str) -> FaiRecord:
+        """Return the index record for the given seq_id."""
+        return self._records[seq_id]
+
+    def length(self, seq_id: str) -> int:
+        """Return the length of the given sequence."""
+        return self._records[seq_id].length
+
+    def fetch(
+        self,
+        seq_id: str,
+        start: int = 0,
+        end: int | None = None,
+        strict: bool = False
+    ) -> Sequence | Polypeptide:
+        """Return the region [start, end) of a sequence (0-based).
+
+        Args:
+            seq_id (str):
+                Name of the sequence.
+            start (int, optional):
+                Start position, inclusive. Defaults to 0.
+            end (int | None, optional):
+                End position, exclusive. Defaults to the sequence end.
+                Values past the end are clipped.
+            strict (bool, optional):
+                Whether to return a Sequence or Polypeptide in strict mode.
+                Defaults to False.
+
+        Raises:
+            KeyError:
+                If seq_id is not in the index.
+            TypeError:
+                If start or end is not an int.
+            ValueError:
+                If start is negative or greater than end.
+
+        Returns:
+            Sequence | Polypeptide:
+                The requested region, a Polypeptide for .faa files.
+        """
+        seq_str = self.fetch_str(seq_id, start, end)
+        if strict:
+            return (Polypeptide if self._faa else Sequence)(
+                seq_str, strict=True
+            )
+        if self._faa:
+            return Polypeptide._trusted(seq_str)
+        return Sequence._trusted(seq_str)
+
+    def fetch_str(
+        self, seq_id: str, start: int = 0, end: int | None = None
+    ) -> str:
+        """Same as fetch(), but returns the region as an upper-case str."""
+        if seq_id not in self._records:
+            raise KeyError(seq_id)
+        rec = self._records[seq_id]
+        if (
+            not isinstance(start, int)
+            or (end is not None and not isinstance(end, int))
+        ):
+            raise TypeError("fetch() argument 'start' and 'end' must be int")
+        end = rec.length if end is None else min(end, rec.length)
+        if start < 0 or start > end:
+            raise ValueError(
+                f"Invalid region: {seq_id}:{start}-{end} "
+                f"(length {rec.length})"
+            )
+        if start == end:
+            return ""
+
+        first = rec.byte_offset(start)
+        last = rec.byte_offset(end - 1) + 1
+        raw = self._read(first, last)
+        return raw.translate(None, b"\r\n").decode().upper()
+
+    def _read(self, first: int, last: int) -> bytes:
+        if self._use_mmap:
+            if self._mm is None:
+                with open(self._path, "rb") as f:
+                    self._mm = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+            return self._mm[first: last]
+
+        if self._fh is None:
+            self._fh = open(self._path, "rb")
+        self._fh.seek(first)
+        return self._fh.read(last - first)
+
+    def close(self) -> None:
+        """Close the underlying file handle or memory map."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __contains__(self, seq_id: str) -> bool:
+        return seq_id in self._records
+
+    def __getitem__(self, seq_id: str) -> Sequence | Polypeptide:
+        return self.fetch(seq_id)
+
+    def __repr__(self) -> str:
+        return f"FastaIndex('{self._path}', {len(self._records)} records)"
+
+
+def main():
+    input_path = r"./examples/data/example_long_seqs.fasta"
+    with FastaIndex(input_path) as index:
+        print(repr(index))
+        print(index.fetch("random_seq_1", 10, 40))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from typing import TextIO, Literal
 from omibio.bio import SeqCollections
 from omibio.io.read_fasta import read_fasta
 from omibio.io.read_fastq import read_fastq
-from omibio.utils.get_suffix import get_suffix
+from omibio.io.compression import split_compression_suffix
 
 
 FASTA_FORMATS = {"faa", "fa", "fasta", "fna"}
@@ -21,6 +21,8 @@ def read(
 
     Users can specify a file format to read, or the program can automatically
     determine the file format based on the file suffix in the path.
+    A trailing compression suffix (e.g. ".fastq.gz") is skipped, and the
+    file is decompressed on the fly.
 
     Args:
         source (str | PathLike | TextIO):
@@ -55,7 +57,8 @@ def read(
             )
     else:
         if format is None:
-            format_str = get_suffix(str(source), with_dot=False)
+            suffix, _ = split_compression_suffix(str(source))
+            format_str = suffix.lstrip(".")
         else:
             format_str = format.lstrip(".")
 
@@ -1,7 +1,11 @@
 from omibio.utils import ensure_path
-from typing import TYPE_CHECKING, Iterator, TextIO, cast
+from omibio.io.compression import open_source, split_compression_suffix
+from typing import TYPE_CHECKING, Iterator, TextIO, Literal, cast
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
 from os import PathLike
 import warnings
+import io
 if TYPE_CHECKING:
     from omibio.bio import SeqCollections, SeqEntry
 
@@ -14,6 +18,15 @@ VALID_AA = {
     "N", "P", "Q", "R", "S", "T", "V", "W", "Y", "X", "*"
 }
 
+# Lookup tables for the "fast" engine: bytes.translate() deletes every
+# valid character, so whatever is left over needs a closer look.
+_VALID_NT_BYTES = "".join(VALID_NT).encode()
+_VALID_NT_BYTES += _VALID_NT_BYTES.lower()
+_VALID_AA_BYTES = "".join(VALID_AA).encode()
+_VALID_AA_BYTES += _VALID_AA_BYTES.lower()
+
+_BLOCK_SIZE = 1 << 22
+
 
 class FastaFormatError(Exception):
 
@@ -27,9 +40,43 @@ def read_fasta_iter(
     warn: bool = True,
     output_strict: bool = False,
     skip_invalid_seq: bool = False,
+    engine: Literal["python", "fast"] = "python",
+    workers: int = 1,
+    ordered: bool = True
 ) -> Iterator["SeqEntry"]:
     """Parse a FASTA file and return a Generator.
 
+    Gzip and BGZF compressed files (e.g. "genome.fa.gz") are decompressed
+    on the fly by a background thread.
+
+    Args:
+        source (str | TextIO | PathLike):
+            Path to the FASTA file or a file-like object.
+        strict (bool, optional):
+            Whether to raise errors on invalid sequences. Defaults to False.
+        warn (bool, optional):
+            Whether to issue warnings on invalid sequences. Defaults to True.
+        output_strict (bool, optional):
+            Whether to enforce strictness on the output sequences.
+            Defaults to False.
+        skip_invalid_seq (bool, optional):
+            Whether to skip invalid sequences. Defaults to False.
+        engine (Literal["python", "fast"], optional):
+            Parser engine. "python" walks the file line by line, "fast"
+            reads large binary blocks and validates a whole run of
+            sequence lines with one lookup-table pass. Both engines yield
+            the same records, warnings and errors. Defaults to "python".
+        workers (int, optional):
+            Number of worker processes. With more than one, an uncompressed
+            FASTA file is split into byte ranges starting at record headers
+            and each range is parsed in its own process with the "fast"
+            engine. File-like objects and compressed files are always
+            parsed serially. Defaults to 1.
+        ordered (bool, optional):
+            Whether to yield records in file order when workers > 1. If
+            False, the records of each range are yielded as soon as it is
+            parsed. Defaults to True.
+
     Raises:
         FileNotFoundError:
             If the specified file is not found.
@@ -41,6 +88,10 @@ def read_fasta_iter(
             If the sequence name is missing.
         FastaFormatError:
             If the sequence is missing.
+        ValueError:
+            If the engine is not recognized.
+        ValueError:
+            If workers is less than 1.
 
     Yields:
         SeqEntry:
@@ -50,20 +101,64 @@ def read_fasta_iter(
     from omibio.sequence import Sequence, Polypeptide
     from omibio.bio import SeqEntry
 
+    if engine not in {"python", "fast"}:
+        raise ValueError(
+            f"read_fasta_iter() argument 'engine' must be 'python' or "
+            f"'fast', got {engine!r}"
+        )
+    if not isinstance(workers, int):
+        raise TypeError(
+            "read_fasta_iter() argument 'workers' must be int, got "
+            + type(workers).__name__
+        )
+    if workers < 1:
+        raise ValueError(
+            "read_fasta_iter() argument 'workers' must be at least 1, "
+            f"got {workers}"
+        )
+
     if hasattr(source, "read"):
         fh = cast(TextIO, source)
         file_name = "<stdin>"
         faa = False
     else:
         file_path = ensure_path(source)
-        suffix = file_path.suffix.lower()
+        suffix, compressed = split_compression_suffix(file_path)
         if suffix not in {".faa", ".fa", ".fasta", ".fna"}:
             raise FastaFormatError(
                 f"Invalid format to read: {suffix}"
             )
         faa = (suffix == ".faa")
         file_name = str(file_path)
-        fh = open(file_path, "r")
+        if workers > 1 and not compressed:
+            yield from _read_fasta_parallel(
+                file_name,
+                workers=workers,
+                ordered=ordered,
+                faa=faa,
+                strict=strict,
+                warn=warn,
+                output_strict=output_strict,
+                skip_invalid_seq=skip_invalid_seq
+            )
+            return
+        fh = open_source(file_path, "rb" if engine == "fast" else "r")
+
+    if engine == "fast":
+        parser = _FastaBlockParser(
+            file_name=file_name,
+            faa=faa,
+            strict=strict,
+            warn=warn,
+            output_strict=output_strict,
+            skip_invalid_seq=skip_invalid_seq
+        )
+        try:
+            yield from parser.parse(fh)
+        finally:
+            if not hasattr(source, "read"):
+                fh.close()
+        return
 
     current_name = None
     current_seq: list[str] = []
@@ -82,10 +177,14 @@ def read_fasta_iter(
 
         seq_str = "".join(current_seq)
         current_seq.clear()
-        if faa:
-            seq_obj = Polypeptide(seq_str, strict=output_strict)
+        # Lines are upper-cased already, so only strict output needs the
+        # validating constructor.
+        if output_strict:
+            seq_obj = (Polypeptide if faa else Sequence)(seq_str, strict=True)
+        elif faa:
+            seq_obj = Polypeptide._trusted(seq_str)
         else:
-            seq_obj = Sequence(seq_str, strict=output_strict)
+            seq_obj = Sequence._trusted(seq_str)
 
         return SeqEntry(seq=seq_obj, seq_id=current_name, source=file_name)
 
@@ -152,12 +251,361 @@ def read_fasta_iter(
             fh.close()
 
 
+class _FastaBlockParser:
+    """Internal helper behind read_fasta_iter(engine="fast").
+
+    The file is read in large binary blocks cut at the last line break.
+    Record boundaries are located with bytes.find(), and each run of
+    sequence lines is validated with a single bytes.translate() pass.
+    Anything unusual (comments, stray whitespace, invalid characters,
+    lone carriage returns) is replayed through the same line-by-line rules
+    as the "python" engine, so both engines behave identically.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        faa: bool,
+        strict: bool,
+        warn: bool,
+        output_strict: bool,
+        skip_invalid_seq: bool
+    ):
+        self.file_name = file_name
+        self.faa = faa
+        self.strict = strict
+        self.warn = warn
+        self.output_strict = output_strict
+        self.skip_invalid_seq = skip_invalid_seq
+        self.allowed_set = VALID_AA if faa else VALID_NT
+        self.valid_bytes = _VALID_AA_BYTES if faa else _VALID_NT_BYTES
+
+        self.current_name: str | None = None
+        self.current_seq: list[str] = []
+        # Number of lines consumed before the current chunk.
+        self.line_base = 0
+        self.universal_newlines = True
+
+    def parse(self, fh) -> Iterator["SeqEntry"]:
+        pending = b""
+        while True:
+            block = fh.read(_BLOCK_SIZE)
+            if not block:
+                break
+            if isinstance(block, str):
+                # Text streams have already applied their newline policy.
+                self.universal_newlines = False
+                block = block.encode()
+            buf = pending + block
+            cut = buf.rfind(b"\n") + 1
+            pending = buf[cut:]
+            if cut:
+                yield from self._chunk(buf[:cut])
+        if pending:
+            yield from self._chunk(pending)
+
+        entry = self._push_entry()
+        if entry:
+            yield entry
+
+    def _chunk(self, chunk: bytes) -> Iterator["SeqEntry"]:
+        if self.universal_newlines and b"\r" in chunk:
+            if chunk.count(b"\r") == chunk.count(b"\r\n"):
+                chunk = chunk.replace(b"\r\n", b"\n")
+            else:
+                # Lone carriage returns: let universal newlines decide.
+                lines = io.StringIO(chunk.decode(), newline=None)
+                n_lines = 0
+                for n_lines, line in enumerate(lines, start=1):
+                    yield from self._line(self.line_base + n_lines, line)
+                self.line_base += n_lines
+                return
+
+        pos = 0
+        n = len(chunk)
+        while pos < n:
+            if chunk[pos] == 62:  # ord(">")
+                eol = chunk.find(b"\n", pos)
+                if eol == -1:
+                    eol = n
+                header = chunk[pos + 1: eol]
+                if b"#" in header:
+                    header = header.split(b"#", 1)[0]
+                entry = self._push_entry()
+                if entry:
+                    yield entry
+                self._set_name(
+                    header.strip().decode(),
+                    lambda: self._line_no(chunk, pos)
+                )
+                pos = eol + 1
+            else:
+                nxt = chunk.find(b"\n>", pos)
+                end = n if nxt == -1 else nxt + 1
+                yield from self._seq_block(chunk, pos, end)
+                pos = end
+
+        self.line_base += chunk.count(b"\n")
+        if not chunk.endswith(b"\n"):
+            self.line_base += 1
+
+    def _seq_block(
+        self, chunk: bytes, start: int, end: int
+    ) -> Iterator["SeqEntry"]:
+        block = chunk[start: end]
+        seq = block.replace(b"\n", b"")
+        if seq.translate(None, self.valid_bytes):
+            first = self._line_no(chunk, start)
+            for i, line in enumerate(block.decode().split("\n"), first):
+                yield from self._line(i, line)
+            return
+        if self.current_name is not None and seq:
+            self.current_seq.append(seq.upper().decode("ascii"))
+
+    def _line_no(self, chunk: bytes, pos: int) -> int:
+        return self.line_base + chunk.count(b"\n", 0, pos) + 1
+
+    def _line(self, i: int, line: str) -> Iterator["SeqEntry"]:
+        """Apply the line-by-line rules of the "python" engine."""
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            return
+
+        if line.startswith(">"):
+            entry = self._push_entry()
+            if entry:
+                yield entry
+            self._set_name(line[1:].strip(), lambda: i)
+            return
+
+        if self.current_name is None:
+            return
+        line = line.upper()
+        if self.strict or self.warn or self.skip_invalid_seq:
+            if any(c not in self.allowed_set for c in line):
+                if self.strict:
+                    raise FastaFormatError(
+                        f"Invalid sequence in line {i}: {line}"
+                    )
+                elif self.warn:
+                    warnings.warn(
+                        f"Invalid sequence in line {i}: {line}, "
+                        f"{'skip' if self.skip_invalid_seq else 'invalid'} "
+                        "record"
+                    )
+                if self.skip_invalid_seq:
+                    self.current_name = None
+                    self.current_seq.clear()
+                    return
+        self.current_seq.append(line)
+
+    def _set_name(self, name: str, line_no) -> None:
+        if name:
+            self.current_name = name
+            return
+        if self.strict:
+            raise FastaFormatError(
+                f"Sequence name missing in line {line_no()}"
+            )
+        elif self.warn:
+            warnings.warn(
+                f"Sequence name missing in line {line_no()}, "
+                "skip record"
+            )
+        self.current_name = None
+        self.current_seq.clear()
+
+    def _push_entry(self) -> "SeqEntry | None":
+        from omibio.sequence import Sequence, Polypeptide
+        from omibio.bio import SeqEntry
+
+        if self.current_name is None:
+            return None
+        if not self.current_seq:
+            msg = f"Sequence missing for {self.current_name}"
+            if self.strict:
+                raise FastaFormatError(msg)
+            elif self.warn:
+                warnings.warn(msg + ", skip record")
+            return None
+
+        seq_str = "".join(self.current_seq)
+        self.current_seq.clear()
+        if self.output_strict:
+            seq_obj = (Polypeptide if self.faa else Sequence)(
+                seq_str, strict=True
+            )
+        elif self.faa:
+            seq_obj = Polypeptide._trusted(seq_str)
+        else:
+            seq_obj = Sequence._trusted(seq_str)
+
+        return SeqEntry(
+            seq=seq_obj, seq_id=self.current_name, source=self.file_name
+        )
+
+
+# Ranges smaller than this are not worth shipping to another process.
+_MIN_RANGE_SIZE = 1 << 20
+
+
+def _split_ranges(
+    file_name: str, n_ranges: int, count_lines: bool
+) -> list[tuple[int, int, int]]:
+    """Internal helper. Split a FASTA file into (start, end, line_base)
+    byte ranges that each begin at a record header.
+
+    line_base is the number of lines before start, used to keep the line
+    numbers of errors and warnings identical to a serial parse. It is only
+    computed when count_lines is True.
+    """
+    with open(file_name, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        n_ranges = max(1, min(n_ranges, size // _MIN_RANGE_SIZE))
+
+        cuts = [0]
+        for i in range(1, n_ranges):
+            target = max(size * i // n_ranges, cuts[-1])
+            f.seek(target)
+            # Look for the next line that starts with ">".
+            carry = b""
+            while True:
+                block = f.read(1 << 16)
+                if not block:
+                    cut = size
+                    break
+                buf = carry + block
+                hit = buf.find(b"\n>")
+                if hit != -1:
+                    cut = target - len(carry) + hit + 1
+                    break
+                target += len(block)
+                carry = buf[-1:]
+            if cut >= size:
+                break
+            if cut > cuts[-1]:
+                cuts.append(cut)
+        cuts.append(size)
+
+        line_bases = [0] * len(cuts)
+        if count_lines:
+            f.seek(0)
+            for i in range(1, len(cuts) - 1):
+                remaining = cuts[i] - cuts[i - 1]
+                n = 0
+                while remaining:
+                    block = f.read(min(remaining, _BLOCK_SIZE))
+                    n += block.count(b"\n")
+                    remaining -= len(block)
+                line_bases[i] = line_bases[i - 1] + n
+
+    return [
+        (cuts[i], cuts[i + 1], line_bases[i]) for i in range(len(cuts) - 1)
+    ]
+
+
+def _parse_range(
+    file_name: str,
+    start: int,
+    end: int,
+    line_base: int,
+    faa: bool,
+    strict: bool,
+    warn: bool,
+    output_strict: bool,
+    skip_invalid_seq: bool
+) -> tuple[list["SeqEntry"], list[str]]:
+    """Internal helper. Parse one byte range in a worker process.
+
+    Warnings raised in a child process never reach the caller, so they are
+    recorded and returned along with the entries.
+    """
+    with open(file_name, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    parser = _FastaBlockParser(
+        file_name=file_name,
+        faa=faa,
+        strict=strict,
+        warn=warn,
+        output_strict=output_strict,
+        skip_invalid_seq=skip_invalid_seq
+    )
+    parser.line_base = line_base
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        entries = list(parser.parse(io.BytesIO(data)))
+    return entries, [str(w.message) for w in caught]
+
+
+def _read_fasta_parallel(
+    file_name: str,
+    workers: int,
+    ordered: bool,
+    **kwargs
+) -> Iterator["SeqEntry"]:
+    """Internal helper behind read_fasta_iter(workers=n)."""
+    ranges = _split_ranges(
+        file_name,
+        n_ranges=workers * 4,
+        count_lines=kwargs["strict"] or kwargs["warn"]
+    )
+
+    def emit(result):
+        entries, messages = result
+        for msg in messages:
+            warnings.warn(msg)
+        yield from entries
+
+    # A small file gives a single range, not worth starting processes.
+    if len(ranges) <= 1:
+        for r in ranges:
+            yield from emit(_parse_range(file_name, *r, **kwargs))
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(ranges)))
+    try:
+        if not ordered:
+            futures = [
+                executor.submit(_parse_range, file_name, *r, **kwargs)
+                for r in ranges
+            ]
+            for future in as_completed(futures):
+                yield from emit(future.result())
+            return
+
+        # Keep a bounded number of ranges in flight and drain them in
+        # file order.
+        pending: deque = deque()
+        todo = iter(ranges)
+        for r in todo:
+            pending.append(
+                executor.submit(_parse_range, file_name, *r, **kwargs)
+            )
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            result = pending.popleft().result()
+            for r in todo:
+                pending.append(
+                    executor.submit(_parse_range, file_name, *r, **kwargs)
+                )
+                break
+            yield from emit(result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def read_fasta(
     source: str | TextIO | PathLike,
     strict: bool = False,
     output_strict: bool = False,
     warn: bool = True,
-    skip_invalid_seq: bool = False
+    skip_invalid_seq: bool = False,
+    engine: Literal["python", "fast"] = "python",
+    workers: int = 1,
+    ordered: bool = True
 ) -> "SeqCollections":
     """Parse a FASTA file and return a SeqCollections object.
 
@@ -173,6 +621,14 @@ def read_fasta(
             Whether to issue warnings on invalid sequences. Defaults to True.
         skip_invalid_seq (bool, optional):
             Whether to skip invalid sequences. Defaults to False.
+        engine (Literal["python", "fast"], optional):
+            Parser engine, see read_fasta_iter(). Defaults to "python".
+        workers (int, optional):
+            Number of worker processes, see read_fasta_iter().
+            Defaults to 1.
+        ordered (bool, optional):
+            Whether to keep records in file order when workers > 1.
+            Defaults to True.
 
     Returns:
         SeqCollections:
@@ -187,7 +643,10 @@ def read_fasta(
         strict=strict,
         output_strict=output_strict,
         warn=warn,
-        skip_invalid_seq=skip_invalid_seq
+        skip_invalid_seq=skip_invalid_seq,
+        engine=engine,
+        workers=workers,
+        ordered=ordered
     ):
         entries.append(entry)
 
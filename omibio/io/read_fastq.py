@@ -1,11 +1,15 @@
 from omibio.utils import ensure_path
+from omibio.io.compression import open_source, split_compression_suffix
 from typing import TYPE_CHECKING, Iterator, TextIO, cast
 from os import PathLike
 import warnings
 if TYPE_CHECKING:
-    from omibio.bio import SeqCollections, SeqEntry
+    from omibio.bio import SeqCollections, SeqEntry, FastqBatch
 
 VALID_NT = set("ATUCGRYKMBVDHSWN")
+_VALID_NT_BYTES = "".join(sorted(VALID_NT)).encode()
+
+_BLOCK_SIZE = 1 << 22
 
 
 class FastqFormatError(Exception):
@@ -20,7 +24,10 @@ def read_fastq_iter(
     warn: bool = True,
     skip_invalid_seq: bool = False
 ) -> Iterator["SeqEntry"]:
-    """Parse a FASTA file and return a Generator.
+    """Parse a FASTQ file and return a Generator.
+
+    Gzip and BGZF compressed files (e.g. "reads.fastq.gz") are
+    decompressed on the fly by a background thread.
 
     Raises:
         FileNotFoundError:
@@ -51,14 +58,14 @@ def read_fastq_iter(
         file_name = "<stdin>"
     else:
         file_path = ensure_path(source)
-        suffix = file_path.suffix.lower()
+        suffix, _ = split_compression_suffix(file_path)
 
         if suffix not in {".fastq", ".fq"}:
             raise FastqFormatError(
                 f"Invalid format to read: {suffix!r}"
             )
         file_name = str(file_path)
-        fh = open(file_path, "r")
+        fh = open_source(file_path, "r")
 
     try:
         line_num = 0
@@ -117,7 +124,8 @@ def read_fastq_iter(
                 continue
 
             skip_record = False
-            for char in seq.upper():
+            upper_seq = seq.upper()
+            for char in upper_seq:
                 if char not in VALID_NT:
                     if strict:
                         raise FastqFormatError(
@@ -136,7 +144,7 @@ def read_fastq_iter(
                 continue
 
             yield SeqEntry(
-                    seq=Sequence(seq), seq_id=header[1:],
+                    seq=Sequence._trusted(upper_seq), seq_id=header[1:],
                     qual=qual, source=file_name
                 )
     finally:
@@ -144,6 +152,193 @@ def read_fastq_iter(
             fh.close()
 
 
+def read_fastq_batches(
+    source: str | TextIO | PathLike,
+    batch_size: int = 100_000,
+    strict: bool = False,
+    warn: bool = True,
+    skip_invalid_seq: bool = False
+) -> Iterator["FastqBatch"]:
+    """Parse a FASTQ file into columnar batches of records.
+
+    Applies the same checks as read_fastq_iter(), but instead of one
+    SeqEntry per read it yields FastqBatch objects holding contiguous
+    sequence and quality buffers plus offset arrays. Compressed inputs
+    are handled as in read_fastq_iter().
+
+    Args:
+        source (str | TextIO | PathLike):
+            Path to the FASTQ file or a file-like object.
+        batch_size (int, optional):
+            Maximum number of records per batch. Defaults to 100,000.
+        strict (bool, optional):
+            Whether to raise errors on format issues. Defaults to False.
+        warn (bool, optional):
+            Whether to issue warnings on format issues. Defaults to True.
+        skip_invalid_seq (bool, optional):
+            Whether to skip records with invalid sequences. Defaults to False.
+
+    Raises:
+        TypeError:
+            If batch_size is not an int.
+        ValueError:
+            If batch_size is not positive.
+        FastqFormatError:
+            On the same format issues as read_fastq_iter().
+
+    Yields:
+        FastqBatch:
+            Batches of at most batch_size records, in file order.
+    """
+
+    import numpy as np
+    from omibio.bio import FastqBatch
+
+    if not isinstance(batch_size, int):
+        raise TypeError(
+            "read_fastq_batches() argument 'batch_size' must be int, got "
+            + type(batch_size).__name__
+        )
+    if batch_size <= 0:
+        raise ValueError(
+            "read_fastq_batches() argument 'batch_size' must be positive, "
+            f"got {batch_size}"
+        )
+
+    if hasattr(source, "read"):
+        fh = cast(TextIO, source)
+        file_name = "<stdin>"
+    else:
+        file_path = ensure_path(source)
+        suffix, _ = split_compression_suffix(file_path)
+
+        if suffix not in {".fastq", ".fq"}:
+            raise FastqFormatError(
+                f"Invalid format to read: {suffix!r}"
+            )
+        file_name = str(file_path)
+        fh = open_source(file_path, "rb")
+
+    ids: list[str] = []
+    seqs: list[bytes] = []
+    quals: list[bytes] = []
+
+    def make_batch() -> "FastqBatch":
+        lengths = np.fromiter(map(len, seqs), dtype=np.int64, count=len(ids))
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        batch = FastqBatch(
+            ids=ids.copy(),
+            seqs=np.frombuffer(b"".join(seqs).upper(), dtype=np.uint8),
+            quals=np.frombuffer(b"".join(quals), dtype=np.uint8),
+            offsets=offsets,
+            source=file_name
+        )
+        ids.clear()
+        seqs.clear()
+        quals.clear()
+        return batch
+
+    try:
+        lines = _iter_lines(fh)
+        line_num = 0
+
+        while True:
+            header = next(lines, None)
+            line_num += 1
+            if header is None:
+                break
+
+            header = header.rstrip()
+            if not header:
+                continue
+
+            if not header.startswith(b"@"):
+                raise FastqFormatError(
+                    f"Line {line_num}: FASTQ header must start with '@', "
+                    f"got: {header.decode()}"
+                )
+            seq = next(lines, b"").rstrip()
+            plus = next(lines, b"").rstrip()
+            qual = next(lines, b"").rstrip()
+            line_num += 3
+
+            if (not seq) or (not plus) or (not qual):
+                raise FastqFormatError(
+                    f"File ends prematurely at line {line_num}"
+                )
+
+            if not plus.startswith(b"+"):
+                if strict:
+                    raise FastqFormatError(
+                        f"Line {line_num}: invalid '+' line: {plus.decode()}"
+                    )
+                elif warn:
+                    warnings.warn(
+                        f"Line {line_num}: invalid '+' line: "
+                        f"{plus.decode()}, skip record"
+                    )
+                continue
+
+            if len(seq) != len(qual):
+                if strict:
+                    raise FastqFormatError(
+                        f"Line {line_num-2} & {line_num}: Sequence / quality "
+                        f"length mismatch: ({len(seq)} vs {len(qual)})"
+                    )
+                elif warn:
+                    warnings.warn(
+                        f"Line {line_num-2} & {line_num}: Sequence / quality, "
+                        f"length mismatch: ({len(seq)} vs {len(qual)})"
+                        "skip record"
+                    )
+                continue
+
+            if seq.upper().translate(None, _VALID_NT_BYTES):
+                if strict:
+                    raise FastqFormatError(
+                        f"Invalid Sequence in line {line_num-2}: "
+                        f"{seq.decode()}"
+                    )
+                elif warn:
+                    warnings.warn(
+                        f"Invalid Sequence in line {line_num-2}: "
+                        f"{seq.decode()}, "
+                        f"{'skip' if skip_invalid_seq else 'invalid'} "
+                        "record"
+                    )
+                if skip_invalid_seq:
+                    continue
+
+            ids.append(header[1:].decode())
+            seqs.append(seq)
+            quals.append(qual)
+            if len(ids) == batch_size:
+                yield make_batch()
+
+        if ids:
+            yield make_batch()
+    finally:
+        if not hasattr(source, "read"):
+            fh.close()
+
+
+def _iter_lines(fh) -> Iterator[bytes]:
+    """Internal helper. Split a text or binary handle into byte lines."""
+    pending = b""
+    while True:
+        block = fh.read(_BLOCK_SIZE)
+        if not block:
+            break
+        if isinstance(block, str):
+            block = block.encode()
+        lines = (pending + block).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
 def read_fastq(
     source: str | TextIO | PathLike,
     strict: bool = False,
@@ -191,6 +386,8 @@ def main():
     result = read_fastq_iter(input_path, warn=True)
     for entry in result:
         print(entry.qual)
+    for batch in read_fastq_batches(input_path, batch_size=2):
+        print(repr(batch))
 
 
 if __name__ == "__main__":
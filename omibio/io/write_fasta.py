@@ -1,7 +1,193 @@
 from pathlib import Path
 from omibio.sequence import Sequence, Polypeptide
-from omibio.bio import SeqCollections
-from typing import Mapping
+from omibio.bio import SeqCollections, SeqEntry
+from typing import Iterable, Mapping, TextIO
+from os import PathLike
+
+
+class FastaWriter:
+    """Stream sequences to a FASTA file at constant memory.
+
+    Sequence lines are wrapped straight into a write buffer that is
+    flushed once it holds buffer_size characters, so generators of any
+    length can be written without building the output in memory first.
+
+    Examples:
+        >>> with FastaWriter("out.fasta") as writer:
+        ...     writer.write_many(read_fasta_iter("in.fasta"))
+    """
+
+    def __init__(
+        self,
+        target: str | PathLike | TextIO,
+        line_len: int = 60,
+        buffer_size: int = 1 << 20
+    ):
+        """Initialization for FastaWriter.
+
+        Args:
+            target (str | PathLike | TextIO):
+                Path to the output FASTA file, or a writable text stream
+                such as sys.stdout. Streams are not closed by the writer.
+            line_len (int, optional):
+                Maximum line length for sequences. Defaults to 60.
+            buffer_size (int, optional):
+                Number of characters buffered before each write.
+                Defaults to 1 MiB.
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+            ValueError:
+                If line_len or buffer_size is not positive.
+            OSError:
+                If the output file cannot be opened.
+        """
+        for arg, value in (
+            ("line_len", line_len), ("buffer_size", buffer_size)
+        ):
+            if not isinstance(value, int):
+                raise TypeError(
+                    f"FastaWriter argument '{arg}' must be int, got "
+                    + type(value).__name__
+                )
+            if value <= 0:
+                raise ValueError(
+                    f"FastaWriter argument '{arg}' must be positive, "
+                    f"got {value}"
+                )
+
+        self._line_len = line_len
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._count = 0
+
+        if hasattr(target, "write"):
+            self._fh = target
+            self._owns_fh = False
+            self._name = getattr(target, "name", "<stream>")
+        else:
+            self._name = str(target)
+            try:
+                file_path = Path(target)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = open(file_path, "w", encoding="utf-8")
+            except OSError as e:
+                raise OSError(
+                    f"Could not write fasta to '{self._name}': {e}"
+                ) from e
+            self._owns_fh = True
+
+    @property
+    def count(self) -> int:
+        """Return the number of records written so far."""
+        return self._count
+
+    def write(
+        self,
+        entry: SeqEntry | tuple[str, Sequence | Polypeptide | str]
+    ) -> None:
+        """Write one record, given as a SeqEntry or a (name, seq) pair.
+
+        Raises:
+            TypeError:
+                If the record or its name has the wrong type.
+            ValueError:
+                If the writer is closed.
+        """
+        if self._fh is None:
+            raise ValueError("I/O operation on closed FastaWriter")
+        if isinstance(entry, SeqEntry):
+            name, seq = entry.seq_id, entry.seq
+        elif isinstance(entry, tuple) and len(entry) == 2:
+            name, seq = entry
+        else:
+            raise TypeError(
+                "FastaWriter.write() argument 'entry' must be SeqEntry or "
+                f"(name, seq) tuple, got {type(entry).__name__}"
+            )
+        if not isinstance(name, str):
+            raise TypeError(
+                "FastaWriter Sequence name must be str, got "
+                + type(name).__name__
+            )
+
+        seq_str = str(seq).replace("\n", "")
+        n = self._line_len
+        buffer = self._buffer
+        buffer.append(f">{name}\n")
+        if len(seq_str) <= n:
+            if seq_str:
+                buffer.append(seq_str + "\n")
+        else:
+            buffer.append(
+                "\n".join(
+                    [seq_str[i: i+n] for i in range(0, len(seq_str), n)]
+                ) + "\n"
+            )
+        self._buffered += len(name) + len(seq_str) + len(seq_str) // n + 3
+        self._count += 1
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def write_many(
+        self,
+        entries: (
+            Iterable[SeqEntry | tuple[str, Sequence | Polypeptide | str]]
+            | Mapping[str, Sequence | Polypeptide | str]
+            | SeqCollections
+        )
+    ) -> int:
+        """Write every record of an iterable, mapping or SeqCollections.
+
+        Generators are consumed one record at a time.
+
+        Returns:
+            int:
+                Number of records written by this call.
+        """
+        if isinstance(entries, Mapping):
+            entries = entries.items()
+        start = self._count
+        for entry in entries:
+            self.write(entry)
+        return self._count - start
+
+    def flush(self) -> None:
+        """Write the buffered records to the output."""
+        if self._fh is None:
+            return
+        if self._buffer:
+            try:
+                self._fh.write("".join(self._buffer))
+            except OSError as e:
+                raise OSError(
+                    f"Could not write fasta to '{self._name}': {e}"
+                ) from e
+            self._buffer.clear()
+            self._buffered = 0
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Flush the buffer and close the file if the writer opened it."""
+        if self._fh is None:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._owns_fh:
+                self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "FastaWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"FastaWriter('{self._name}', {self._count} records)"
 
 
 def write_fasta(
@@ -87,6 +273,10 @@ def main():
     write_fasta(file_name=output_path, seqs=seqs)
     print(output_path)
 
+    with FastaWriter(output_path, line_len=80) as writer:
+        writer.write_many(seqs)
+    print(repr(writer))
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,208 @@
 from pathlib import Path
-from omibio.bio import SeqCollections
+from omibio.bio import SeqCollections, SeqEntry, FastqBatch
+from omibio.io.compression import (
+    ParallelGzipWriter, split_compression_suffix
+)
+from typing import IO, Iterable, TextIO
+from os import PathLike
+
+
+class FastqWriter:
+    """Stream FASTQ records to a plain or gzip file at constant memory.
+
+    Records are formatted into a write buffer that is flushed once it
+    holds buffer_size characters. Paths ending in .gz, .bgz or .bgzf are
+    written as multi-member gzip, with the blocks compressed on a thread
+    pool by ParallelGzipWriter.
+
+    Examples:
+        >>> with FastqWriter("out.fastq.gz") as writer:
+        ...     writer.write_many(read_fastq_batches("in.fastq"))
+    """
+
+    def __init__(
+        self,
+        target: str | PathLike | TextIO,
+        buffer_size: int = 1 << 20,
+        compresslevel: int = 6,
+        threads: int | None = None
+    ):
+        """Initialization for FastqWriter.
+
+        Args:
+            target (str | PathLike | TextIO):
+                Path to the output FASTQ file, or a writable text stream
+                such as sys.stdout. Streams are not closed by the writer.
+            buffer_size (int, optional):
+                Number of characters buffered before each write, also the
+                gzip block size. Defaults to 1 MiB.
+            compresslevel (int, optional):
+                zlib compression level for gzip output. Defaults to 6.
+            threads (int | None, optional):
+                Number of compression threads for gzip output.
+                Defaults to the CPU count, capped at 8.
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+            ValueError:
+                If buffer_size is not positive.
+            OSError:
+                If the output file cannot be opened.
+        """
+        if not isinstance(buffer_size, int):
+            raise TypeError(
+                "FastqWriter argument 'buffer_size' must be int, got "
+                + type(buffer_size).__name__
+            )
+        if buffer_size <= 0:
+            raise ValueError(
+                "FastqWriter argument 'buffer_size' must be positive, "
+                f"got {buffer_size}"
+            )
+
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._count = 0
+        self._binary = False
+        self._fh: IO | None
+
+        if hasattr(target, "write"):
+            self._fh = target
+            self._owns_fh = False
+            self._name = getattr(target, "name", "<stream>")
+            return
+
+        self._name = str(target)
+        self._owns_fh = True
+        self._binary = True
+        try:
+            file_path = Path(target)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _, compressed = split_compression_suffix(file_path)
+            if compressed:
+                self._fh = ParallelGzipWriter(
+                    file_path, block_size=buffer_size,
+                    compresslevel=compresslevel, threads=threads
+                )
+            else:
+                self._fh = open(file_path, "wb")
+        except OSError as e:
+            raise OSError(
+                f"Could not write fastq to '{self._name}': {e}"
+            ) from e
+
+    @property
+    def count(self) -> int:
+        """Return the number of records written so far."""
+        return self._count
+
+    def write(self, entry: SeqEntry) -> None:
+        """Write one SeqEntry carrying a quality string.
+
+        Raises:
+            TypeError:
+                If entry is not a SeqEntry.
+            ValueError:
+                If the entry has no quality string or the writer is closed.
+        """
+        if self._fh is None:
+            raise ValueError("I/O operation on closed FastqWriter")
+        if not isinstance(entry, SeqEntry):
+            raise TypeError(
+                "FastqWriter.write() argument 'entry' must be SeqEntry, got "
+                + type(entry).__name__
+            )
+        if entry.qual is None:
+            raise ValueError(
+                f"SeqEntry {entry.seq_id!r} has no quality string"
+            )
+        seq = str(entry.seq)
+        record = f"@{entry.seq_id}\n{seq}\n+\n{entry.qual}\n"
+        self._buffer.append(record)
+        self._buffered += len(record)
+        self._count += 1
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def write_batch(self, batch: FastqBatch) -> None:
+        """Write every record of a FastqBatch straight from its buffers."""
+        if self._fh is None:
+            raise ValueError("I/O operation on closed FastqWriter")
+        if not isinstance(batch, FastqBatch):
+            raise TypeError(
+                "FastqWriter.write_batch() argument 'batch' must be "
+                f"FastqBatch, got {type(batch).__name__}"
+            )
+        seqs = batch.seqs.tobytes().decode()
+        quals = batch.quals.tobytes().decode()
+        bounds = batch.offsets.tolist()
+        record = "@{}\n{}\n+\n{}\n".format
+        text = "".join([
+            record(seq_id, seqs[start: end], quals[start: end])
+            for seq_id, start, end in zip(batch.ids, bounds, bounds[1:])
+        ])
+        self._buffer.append(text)
+        self._buffered += len(text)
+        self._count += len(batch)
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def write_many(
+        self, records: Iterable[SeqEntry | FastqBatch] | SeqCollections
+    ) -> int:
+        """Write an iterable of SeqEntry objects or FastqBatch objects.
+
+        Generators are consumed one item at a time.
+
+        Returns:
+            int:
+                Number of records written by this call.
+        """
+        start = self._count
+        for record in records:
+            if isinstance(record, FastqBatch):
+                self.write_batch(record)
+            else:
+                self.write(record)
+        return self._count - start
+
+    def flush(self) -> None:
+        """Write the buffered records to the output."""
+        if self._fh is None or not self._buffer:
+            return
+        text = "".join(self._buffer)
+        try:
+            self._fh.write(text.encode() if self._binary else text)
+        except OSError as e:
+            raise OSError(
+                f"Could not write fastq to '{self._name}': {e}"
+            ) from e
+        self._buffer.clear()
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Flush the buffer and close the file if the writer opened it."""
+        if self._fh is None:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._owns_fh:
+                self._fh.close()
+            else:
+                self._fh.flush()
+            self._fh = None
+
+    def __enter__(self) -> "FastqWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"FastqWriter('{self._name}', {self._count} records)"
 
 
 def write_fastq(
@@ -68,6 +271,10 @@ def main():
     print(output_path)
     print("\n".join(lines))
 
+    with FastqWriter(output_path + ".gz") as writer:
+        writer.write_many(seqs)
+    print(repr(writer))
+
 
 if __name__ == "__main__":
     main()
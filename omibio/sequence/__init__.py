@@ -1,5 +1,9 @@
 from omibio.sequence.polypeptide import Polypeptide
 from omibio.sequence.sequence import Sequence
+from omibio.sequence.packed_sequence import PackedSequence
+from omibio.sequence.sequence_view import SequenceView
+from omibio.sequence.sequence_builder import SequenceBuilder
+from omibio.sequence.sequence_batch import SequenceBatch
 from omibio.sequence.seq_utils import (
     clean, CleanReport, CleanReportItem, write_report,
     complement, reverse_complement,
@@ -13,6 +17,10 @@ from omibio.sequence.seq_utils import (
 __all__ = [
     "Polypeptide",
     "Sequence",
+    "PackedSequence",
+    "SequenceView",
+    "SequenceBuilder",
+    "SequenceBatch",
     "clean",
     "CleanReport",
     "CleanReportItem",
@@ -0,0 +1,382 @@
+from omibio.sequence.sequence import Sequence
+from omibio.utils import to_percentage, truncate_repr
+import numpy as np
+
+
+# 2-bit codes: A=0, C=1, G=2, T/U=3. 255 marks a base that goes to the
+# exception table instead.
+_NO_CODE = 255
+_DNA_CODES = np.full(256, _NO_CODE, dtype=np.uint8)
+_RNA_CODES = np.full(256, _NO_CODE, dtype=np.uint8)
+for _code, _base in enumerate("ACG"):
+    _DNA_CODES[ord(_base)] = _RNA_CODES[ord(_base)] = _code
+_DNA_CODES[ord("T")] = 3
+_RNA_CODES[ord("U")] = 3
+
+_DNA_BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+_RNA_BASES = np.frombuffer(b"ACGU", dtype=np.uint8)
+
+# Number of C/G codes packed in each possible byte.
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+_BYTE_CODES = (np.arange(256, dtype=np.uint8)[:, None] >> _SHIFTS) & 3
+_GC_PER_BYTE = ((_BYTE_CODES == 1) | (_BYTE_CODES == 2)).sum(axis=1)
+
+_IUPAC_COMPLEMENT = str.maketrans(
+    "ATUCGRYKMBVDHSWN", "TAAGCYRMKVBHDSWN"
+)
+
+
+class PackedSequence:
+    """A nucleotide sequence stored at 2 bits per base.
+
+    A, C, G and T (or U for RNA) are packed four to a byte in a NumPy
+    array. Any other character (N, IUPAC codes, gaps) is kept in a sparse
+    table of runs, so N-rich assemblies stay compact. Slicing, GC content
+    and reverse complement work on the packed codes directly.
+    """
+
+    __slots__ = (
+        "_packed", "_length", "_is_rna",
+        "_exc_starts", "_exc_lengths", "_exc_chars"
+    )
+
+    def __init__(
+        self,
+        sequence: str | Sequence | None = None,
+        rna: bool | None = None
+    ):
+        """Initialization for PackedSequence.
+
+        Args:
+            sequence (str | Sequence | None, optional):
+                The nucleotide sequence to pack. Defaults to None.
+            rna (bool | None, optional):
+                Whether the sequence is RNA. If None, it is RNA when it
+                contains 'U', or taken from the Sequence. Defaults to None.
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+        """
+        if rna is not None and not isinstance(rna, bool):
+            raise TypeError(
+                "PackedSequence argument 'rna' must be bool or None, got "
+                + type(rna).__name__
+            )
+        if isinstance(sequence, Sequence):
+            if rna is None:
+                rna = sequence.is_rna
+            sequence = str(sequence)
+        elif sequence is None:
+            sequence = ""
+        elif not isinstance(sequence, str):
+            raise TypeError(
+                "PackedSequence argument 'sequence' must be str or "
+                f"Sequence, got {type(sequence).__name__}"
+            )
+
+        sequence = sequence.upper()
+        if rna is None:
+            rna = "U" in sequence
+        raw = np.frombuffer(sequence.encode(), dtype=np.uint8)
+        codes = (_RNA_CODES if rna else _DNA_CODES)[raw]
+        self._init_from_codes(codes, raw, rna)
+
+    def _init_from_codes(
+        self, codes: np.ndarray, raw: np.ndarray | None, rna: bool
+    ) -> None:
+        self._is_rna = rna
+        self._length = len(codes)
+
+        exc = codes == _NO_CODE if raw is not None else None
+        if exc is not None and exc.any():
+            # Collapse exceptions into runs of one repeated character.
+            pos = np.flatnonzero(exc)
+            chars = raw[pos]
+            brk = np.flatnonzero(
+                (np.diff(pos) != 1) | (np.diff(chars) != 0)
+            ) + 1
+            starts = np.concatenate(([0], brk))
+            ends = np.concatenate((brk, [len(pos)]))
+            self._exc_starts = pos[starts].astype(np.int64)
+            self._exc_lengths = (ends - starts).astype(np.int64)
+            self._exc_chars = chars[starts].copy()
+            codes = np.where(exc, 0, codes).astype(np.uint8)
+        else:
+            self._exc_starts = np.empty(0, dtype=np.int64)
+            self._exc_lengths = np.empty(0, dtype=np.int64)
+            self._exc_chars = np.empty(0, dtype=np.uint8)
+
+        self._packed = self._pack(codes)
+
+    @staticmethod
+    def _pack(codes: np.ndarray) -> np.ndarray:
+        pad = -len(codes) % 4
+        if pad:
+            codes = np.concatenate((codes, np.zeros(pad, dtype=np.uint8)))
+        quads = codes.reshape(-1, 4)
+        return (
+            (quads[:, 0] << 6) | (quads[:, 1] << 4)
+            | (quads[:, 2] << 2) | quads[:, 3]
+        ).astype(np.uint8)
+
+    @classmethod
+    def from_sequence(cls, seq: Sequence) -> "PackedSequence":
+        """Pack a Sequence object."""
+        if not isinstance(seq, Sequence):
+            raise TypeError(
+                "from_sequence() argument 'seq' must be Sequence, got "
+                + type(seq).__name__
+            )
+        return cls(seq)
+
+    @classmethod
+    def _from_parts(
+        cls,
+        codes: np.ndarray,
+        rna: bool,
+        exc_starts: np.ndarray,
+        exc_lengths: np.ndarray,
+        exc_chars: np.ndarray
+    ) -> "PackedSequence":
+        obj = cls.__new__(cls)
+        if len(exc_starts):
+            # Exception slots must be stored as A, which count(), at_content()
+            # and __eq__ rely on; a complement turns them into T.
+            codes = codes.copy()
+            for s, n in zip(exc_starts.tolist(), exc_lengths.tolist()):
+                codes[s: s + n] = 0
+        obj._init_from_codes(codes, None, rna)
+        obj._exc_starts = exc_starts
+        obj._exc_lengths = exc_lengths
+        obj._exc_chars = exc_chars
+        return obj
+
+    @property
+    def is_rna(self) -> bool:
+        """Return whether the sequence is RNA."""
+        return self._is_rna
+
+    @property
+    def type(self) -> str:
+        """Return 'DNA' or 'RNA' indicating the sequence type."""
+        return "RNA" if self._is_rna else "DNA"
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Return the packed uint8 buffer, four bases per byte."""
+        return self._packed
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the packed representation."""
+        return (
+            self._packed.nbytes + self._exc_starts.nbytes
+            + self._exc_lengths.nbytes + self._exc_chars.nbytes
+        )
+
+    def exceptions(self) -> list[tuple[int, int, str]]:
+        """Return the (start, length, char) runs of non-ACGT bases."""
+        return [
+            (int(s), int(n), chr(c)) for s, n, c in zip(
+                self._exc_starts, self._exc_lengths, self._exc_chars
+            )
+        ]
+
+    def codes(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """Return the 2-bit codes (A=0, C=1, G=2, T/U=3) of [start, end).
+
+        Positions covered by the exception table read as 0, use mask()
+        to exclude them.
+        """
+        start, end, _ = slice(start, end).indices(self._length)
+        if end <= start:
+            return np.empty(0, dtype=np.uint8)
+        first, last = start // 4, (end + 3) // 4
+        unpacked = _BYTE_CODES[self._packed[first: last]].ravel()
+        return unpacked[start - first * 4: end - first * 4]
+
+    def mask(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """Return a bool array, True where [start, end) is plain ACGT."""
+        start, end, _ = slice(start, end).indices(self._length)
+        out = np.ones(max(end - start, 0), dtype=bool)
+        for s, n in zip(self._exc_starts, self._exc_lengths):
+            lo, hi = max(s, start), min(s + n, end)
+            if lo < hi:
+                out[lo - start: hi - start] = False
+        return out
+
+    def to_str(self) -> str:
+        """Decode the sequence to an upper-case str."""
+        bases = _RNA_BASES if self._is_rna else _DNA_BASES
+        raw = bases[self.codes()]
+        for s, n, c in zip(
+            self._exc_starts, self._exc_lengths, self._exc_chars
+        ):
+            raw[s: s + n] = c
+        return raw.tobytes().decode()
+
+    def to_sequence(self, strict: bool = False) -> Sequence:
+        """Convert to a Sequence object."""
+        if strict:
+            return Sequence(self.to_str(), rna=self._is_rna, strict=True)
+        return Sequence._trusted(self.to_str(), rna=self._is_rna)
+
+    def gc_content(self, percent: bool = False) -> float | str:
+        """Calculate and return the GC content of the sequence."""
+        if not self._length:
+            return 0.0 if not percent else "0.00%"
+        # Padding and exception slots are stored as A, so they never count.
+        gc = int(_GC_PER_BYTE[self._packed].sum())
+        return (round(gc / self._length, 3) if not percent
+                else to_percentage(gc / self._length))
+
+    def at_content(self, percent: bool = False) -> float | str:
+        """Calculate and return the AT content of the sequence.
+
+        As with Sequence.at_content(), only A and T count, so U does not
+        count for RNA.
+        """
+        if not self._length:
+            return 0.0 if not percent else "0.00%"
+        if self._is_rna:
+            at = self.count("A") + self.count("T")
+        else:
+            gc = int(_GC_PER_BYTE[self._packed].sum())
+            at = self._length - gc - int(self._exc_lengths.sum())
+        return (round(at / self._length, 3) if not percent
+                else to_percentage(at / self._length))
+
+    def count(self, base: str) -> int:
+        """Count occurrences of a base in the sequence."""
+        base = base.upper()
+        if len(base) != 1:
+            return self.to_str().count(base)
+        code = (_RNA_CODES if self._is_rna else _DNA_CODES)[ord(base)]
+        if code == _NO_CODE:
+            return int(
+                self._exc_lengths[self._exc_chars == ord(base)].sum()
+            )
+        n = int(np.count_nonzero(self.codes() == code))
+        if code == 0:
+            # Exception slots are stored as A.
+            n -= int(self._exc_lengths.sum())
+        return n
+
+    def complement(self) -> "PackedSequence":
+        """Return the complement of the sequence."""
+        return self._complement(reverse=False)
+
+    def reverse_complement(self) -> "PackedSequence":
+        """Return the reverse complement of the sequence."""
+        return self._complement(reverse=True)
+
+    def _complement(self, reverse: bool) -> "PackedSequence":
+        codes = 3 - self.codes()
+        starts = self._exc_starts
+        chars = np.frombuffer(
+            self._exc_chars.tobytes().decode()
+            .translate(_IUPAC_COMPLEMENT).encode(),
+            dtype=np.uint8
+        )
+        lengths = self._exc_lengths
+        if reverse:
+            codes = codes[::-1]
+            starts = (self._length - starts - lengths)[::-1]
+            lengths = lengths[::-1]
+            chars = chars[::-1]
+        return self._from_parts(
+            np.ascontiguousarray(codes), self._is_rna,
+            np.ascontiguousarray(starts), np.ascontiguousarray(lengths),
+            np.ascontiguousarray(chars)
+        )
+
+    def subseq(self, start: int, end: int | None = None) -> "PackedSequence":
+        """Return a subsequence from start to end (end exclusive)."""
+        if (
+            not isinstance(start, int)
+            or (end is not None and not isinstance(end, int))
+        ):
+            raise TypeError("subseq() argument 'start' and ''end' must be int")
+        return self[start: end]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+    def __repr__(self) -> str:
+        return (
+            f"PackedSequence({truncate_repr(self.to_str())}, "
+            f"type={self.type}, length={self._length})"
+        )
+
+    def __getitem__(self, idx) -> "str | PackedSequence":
+        if isinstance(idx, slice):
+            start, end, step = idx.indices(self._length)
+            if step != 1:
+                return PackedSequence(self.to_str()[idx], rna=self._is_rna)
+            end = max(start, end)
+            starts = self._exc_starts
+            ends = starts + self._exc_lengths
+            keep = (ends > start) & (starts < end)
+            new_starts = np.maximum(starts[keep], start)
+            new_ends = np.minimum(ends[keep], end)
+            # An empty slice clips runs to zero length.
+            nonempty = new_ends > new_starts
+            new_starts, new_ends = new_starts[nonempty], new_ends[nonempty]
+            return self._from_parts(
+                self.codes(start, end).copy(), self._is_rna,
+                new_starts - start, new_ends - new_starts,
+                self._exc_chars[keep][nonempty]
+            )
+
+        if not isinstance(idx, (int, np.integer)):
+            raise TypeError(
+                "PackedSequence indices must be int or slice, got "
+                + type(idx).__name__
+            )
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError("PackedSequence index out of range")
+        hit = np.flatnonzero(
+            (self._exc_starts <= idx)
+            & (idx < self._exc_starts + self._exc_lengths)
+        )
+        if len(hit):
+            return chr(self._exc_chars[hit[0]])
+        bases = "ACGU" if self._is_rna else "ACGT"
+        return bases[(self._packed[idx // 4] >> (6 - 2 * (idx % 4))) & 3]
+
+    def __iter__(self):
+        return iter(self.to_str())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedSequence):
+            return (
+                self._length == other._length
+                and self._is_rna == other._is_rna
+                and np.array_equal(self._packed, other._packed)
+                and self.exceptions() == other.exceptions()
+            )
+        if isinstance(other, Sequence):
+            return self.to_str() == str(other)
+        if isinstance(other, str):
+            return self.to_str() == other.upper()
+        return False
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def main():
+    seq = PackedSequence("ACGTNNNNNNACGGCRTTAC")
+    print(repr(seq))
+    print(seq.nbytes, seq.gc_content(), seq.exceptions())
+    print(seq.reverse_complement())
+    print(seq[3:12], seq[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Polypeptide:
@@ -6,6 +9,8 @@ class Polypeptide:
     Class representing a polypeptide (amino acid) sequence.
     """
 
+    __slots__ = ("_aa_seq", "_strict")
+
     VALID_AA = {
         "A", "R", "N", "D", "C", "Q", "E", "G", "H", "I",
         "L", "K", "M", "F", "P", "S", "T", "W", "Y", "V"
@@ -56,6 +61,18 @@ class Polypeptide:
         self._strict = strict
         self.aa_seq = aa_seq if aa_seq is not None else ""
 
+    @classmethod
+    def _trusted(cls, aa_seq: str, strict: bool = False) -> "Polypeptide":
+        """Internal constructor that skips the aa_seq setter.
+
+        The caller guarantees that aa_seq is an upper-case str and, in
+        strict mode, that it only holds valid amino acids.
+        """
+        obj = cls.__new__(cls)
+        obj._aa_seq = aa_seq
+        obj._strict = strict
+        return obj
+
     @property
     def strict(self) -> bool:
         """Getter for strict mode."""
@@ -115,7 +132,7 @@ class Polypeptide:
         """Returns a subsequence from start to end (exclusive)."""
         sub = self.aa_seq[start:end]
 
-        return Polypeptide(sub, strict=self._strict)
+        return Polypeptide._trusted(sub, strict=self._strict)
 
     def formula(self) -> str:
         """Calculates the molecular formula of the polypeptide."""
@@ -148,6 +165,17 @@ class Polypeptide:
 
         return " ".join(formula)
 
+    def encoded(self, alphabet: str = "protein") -> "np.ndarray":
+        """Return the sequence as a read-only array of alphabet codes.
+
+        See omibio.encoding.encode_table() for the alphabets.
+        """
+        from omibio.encoding import encode
+
+        codes = encode(self._aa_seq, alphabet)
+        codes.setflags(write=False)
+        return codes
+
     def is_valid(self) -> bool:
         """Checks if the polypeptide sequence is valid."""
         return not (set(self.aa_seq) - self.VALID_AA)
@@ -183,6 +211,10 @@ class Polypeptide:
     def __add__(self, other) -> "Polypeptide":
         if isinstance(other, Polypeptide):
             strict_mode = self._strict or other.strict
+            if self._strict == other.strict:
+                return Polypeptide._trusted(
+                    self.aa_seq + other.aa_seq, strict=strict_mode
+                )
             return Polypeptide(self.aa_seq + other.aa_seq, strict=strict_mode)
 
         elif isinstance(other, str):
@@ -208,7 +240,7 @@ class Polypeptide:
                 "Polypeptide cannot be multiply by a negative number"
             )
 
-        return Polypeptide(
+        return Polypeptide._trusted(
             self.aa_seq * n, strict=self._strict
         )
 
@@ -1,5 +1,5 @@
 from omibio.sequence import Sequence, Polypeptide
-from omibio.bio import SeqCollections, SeqEntry
+from omibio.bio import SeqCollections, SeqEntry, LazySeqCollections
 from omibio.utils import within_range
 from typing import Literal, Iterable, Mapping, overload
 from dataclasses import dataclass
@@ -167,7 +167,7 @@ def clean(
                 "clean() argument 'allowed_bases' must be an iterable "
                 "of single-character strings."
             )
-    if not isinstance(seqs, (dict, SeqCollections)):
+    if not isinstance(seqs, (dict, SeqCollections, LazySeqCollections)):
         raise TypeError(
             "clean() argument 'seqs' must be dict or SeqCollections, got "
             + type(seqs).__name__
@@ -205,7 +205,7 @@ def clean(
     cleaned_names = set()
     if report:
         clean_report = CleanReport()
-    if isinstance(seqs, SeqCollections):
+    if isinstance(seqs, (SeqCollections, LazySeqCollections)):
         if source is None:
             source = seqs.source
         seqs = seqs.seq_dict()
@@ -2,16 +2,18 @@ from typing import Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
 
 
 def complement(
-    seq: Union["Sequence", str],
+    seq: Union["Sequence", str, "SequenceBatch"],
     as_str: bool = False
-) -> Union["Sequence", str]:
+) -> Union["Sequence", str, "SequenceBatch", list[str]]:
     """Complement a given sequence.
 
     Args:
-        seq (Sequence | str): Input sequence.
+        seq (Sequence | str | SequenceBatch):
+            Input sequence, or a batch complemented in one pass.
         as_str (bool, optional):
             Whether to return the result as a string. Defaults to False.
 
@@ -19,9 +21,15 @@ def complement(
         TypeError: If the input sequence is not of type Sequence or string.
 
     Returns:
-        Sequence | str: Complemented sequence.
+        Sequence | str | SequenceBatch | list[str]:
+            Complemented sequence, or a batch (list of str) for a batch.
     """
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
+
+    if isinstance(seq, SequenceBatch):
+        batch = seq.complement()
+        return batch.seq_strs() if as_str is True else batch
     # Validate input type
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
@@ -36,13 +44,14 @@ def complement(
 
 
 def reverse_complement(
-    seq: Union["Sequence", str],
+    seq: Union["Sequence", str, "SequenceBatch"],
     as_str: bool = False
-) -> Union["Sequence", str]:
+) -> Union["Sequence", str, "SequenceBatch", list[str]]:
     """Reverse complement a given sequence.
 
     Args:
-        seq (Sequence | str): Input sequence.
+        seq (Sequence | str | SequenceBatch):
+            Input sequence, or a batch complemented in one pass.
         as_str (bool, optional):
             Whether to return the result as a string. Defaults to False.
 
@@ -50,9 +59,16 @@ def reverse_complement(
         TypeError: If the input sequence is not of type Sequence or string.
 
     Returns:
-        str: Reverse complemented sequence.
+        Sequence | str | SequenceBatch | list[str]:
+            Reverse complemented sequence, or a batch (list of str) for a
+            batch.
     """
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
+
+    if isinstance(seq, SequenceBatch):
+        batch = seq.reverse_complement()
+        return batch.seq_strs() if as_str is True else batch
     # Validate input type
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
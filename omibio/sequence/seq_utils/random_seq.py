@@ -1,6 +1,6 @@
 import random
 from omibio.sequence import Sequence, Polypeptide
-from omibio.io.write_fasta import write_fasta
+from omibio.io.write_fasta import write_fasta, FastaWriter
 
 
 def random_seq(
@@ -91,22 +91,28 @@ def random_fasta(
             Weights for each character in the alphabet. Defaults to None.
         seed (int | None, optional):
             Random seed for reproducibility. Defaults to None.
+
+    Returns:
+        list[str]:
+            The FASTA lines if file_path is None. When writing to a file
+            the records are streamed and an empty list is returned.
     """
 
     rng = random.Random(seed)
-    seq_dict = {}
 
-    for i in range(1, seq_num+1):
-        seq_seed = rng.randint(0, 2**32 - 1)
-        seq_dict[f"{prefix}_{i}"] = random_seq(
-            length=length, alphabet=alphabet,
-            weights=weights, as_str=True, seed=seq_seed
-        )
+    def records():
+        for i in range(1, seq_num+1):
+            seq_seed = rng.randint(0, 2**32 - 1)
+            yield f"{prefix}_{i}", random_seq(
+                length=length, alphabet=alphabet,
+                weights=weights, as_str=True, seed=seq_seed
+            )
+
     if file_path is not None:
-        res = write_fasta(file_name=file_path, seqs=seq_dict)
-    else:
-        res = write_fasta(seqs=seq_dict)
-    return res
+        with FastaWriter(file_path) as writer:
+            writer.write_many(records())
+        return []
+    return write_fasta(seqs=dict(records()))
 
 
 def main():
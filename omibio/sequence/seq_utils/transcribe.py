@@ -2,17 +2,19 @@ from typing import Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
 
 
 def transcribe(
-    seq: Union["Sequence", str],
+    seq: Union["Sequence", str, "SequenceBatch"],
     strand: str = "+",
     as_str: bool = False
-) -> Union["Sequence", str]:
+) -> Union["Sequence", str, "SequenceBatch", list[str]]:
     """Transcribe a DNA seq sequence to RNA.
 
     Args:
-        seq (Sequence | str): input seq sequence
+        seq (Sequence | str | SequenceBatch):
+            input seq sequence, or a batch processed in one pass
         strand (str, optional):
             Sense or antisense, either '+' or '-'. Defaults to '+'.
         as_str (bool, optional):
@@ -22,10 +24,16 @@ def transcribe(
         TypeError: If the input sequence is not of type Sequence or string.
 
     Returns:
-        Sequence | str: transcribed RNA sequence
+        Sequence | str | SequenceBatch | list[str]:
+            transcribed RNA sequence, or a batch (list of str) for a batch
     """
 
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
+
+    if isinstance(seq, SequenceBatch):
+        batch = seq.transcribe(strand=strand)
+        return batch.seq_strs() if as_str else batch
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
             "transcribe() argument 'seq' must be Sequence or str, not "
@@ -39,13 +47,14 @@ def transcribe(
 
 
 def reverse_transcribe(
-    seq: Union["Sequence", str],
+    seq: Union["Sequence", str, "SequenceBatch"],
     as_str: bool = False
-) -> Union["Sequence", str]:
+) -> Union["Sequence", str, "SequenceBatch", list[str]]:
     """Reverse transcribe a RNA seq sequence to DNA.
 
     Args:
-        seq (Sequence | str): input seq sequence
+        seq (Sequence | str | SequenceBatch):
+            input seq sequence, or a batch processed in one pass
         as_str (bool, optional):
         Whether to return the result as a string. Defaults to False.
 
@@ -53,9 +62,16 @@ def reverse_transcribe(
         TypeError: If the input sequence is not of type Sequence or string.
 
     Returns:
-        Sequence | str: reverse transcribed DNA sequence
+        Sequence | str | SequenceBatch | list[str]:
+            reverse transcribed DNA sequence, or a batch (list of str) for
+            a batch
     """
     from omibio.sequence.sequence import Sequence
+    from omibio.sequence.sequence_batch import SequenceBatch
+
+    if isinstance(seq, SequenceBatch):
+        batch = seq.reverse_transcribe()
+        return batch.seq_strs() if as_str else batch
     if not isinstance(seq, (Sequence, str)):
         raise TypeError(
             "reverse_transcribe() argument 'seq' must be Sequence or str, not "
@@ -1,5 +1,10 @@
 from omibio.sequence.polypeptide import Polypeptide
 from omibio.utils import to_percentage, truncate_repr
+from typing import TYPE_CHECKING, Literal, overload
+if TYPE_CHECKING:
+    import numpy as np
+    from omibio.sequence.packed_sequence import PackedSequence
+    from omibio.sequence.sequence_view import SequenceView
 
 
 class Sequence:
@@ -7,6 +12,8 @@ class Sequence:
     A class representing a DNA or RNA sequence with methods for analysis.
     """
 
+    __slots__ = ("_sequence", "_is_rna", "_strict", "_cache", "_cache_max_len")
+
     _VALID_DNA_BASES = {
         "A", "T", "C", "G",
         "N", "R", "Y", "K", "M", "B", "V", "D", "H", "S", "W"
@@ -36,8 +43,31 @@ class Sequence:
 
         self._is_rna = rna
         self._strict = strict
+        self._cache: dict | None = None
+        self._cache_max_len = 0
         self.sequence = sequence if sequence is not None else ""
 
+    @classmethod
+    def _trusted(
+        cls,
+        sequence: str,
+        rna: bool | None = None,
+        strict: bool = False
+    ) -> "Sequence":
+        """Internal constructor that skips the sequence setter.
+
+        The caller guarantees that sequence is an upper-case str and, in
+        strict mode, that it is valid for the given type, e.g. because it
+        was derived from an already validated Sequence or parser output.
+        """
+        obj = cls.__new__(cls)
+        obj._sequence = sequence
+        obj._is_rna = ("U" in sequence) if rna is None else rna
+        obj._strict = strict
+        obj._cache = None
+        obj._cache_max_len = 0
+        return obj
+
     @property
     def strict(self) -> bool:
         """Getter, returns whether strict mode is enabled."""
@@ -116,17 +146,84 @@ class Sequence:
                 )
 
         self._sequence = sequence
+        if self._cache is not None:
+            self._cache.clear()
 
         if self._is_rna is None:
             self._is_rna = "U" in sequence
 
+    @property
+    def cache_enabled(self) -> bool:
+        """Return whether derived results are memoized."""
+        return self._cache is not None
+
+    def enable_cache(self, max_len: int | None = 10_000_000) -> None:
+        """Memoize composition counts, the reverse complement and
+        translations of this sequence.
+
+        The cache is cleared whenever the sequence is reassigned.
+
+        Args:
+            max_len (int | None, optional):
+                Longest sequence for which the reverse complement and
+                translations, which are as large as the sequence, are
+                kept. Base counts are always kept. None means no limit.
+                Defaults to 10,000,000.
+
+        Raises:
+            TypeError:
+                If max_len is not an int or None.
+            ValueError:
+                If max_len is negative.
+        """
+        if max_len is not None and not isinstance(max_len, int):
+            raise TypeError(
+                "enable_cache() argument 'max_len' must be int or None, got "
+                + type(max_len).__name__
+            )
+        if max_len is not None and max_len < 0:
+            raise ValueError(
+                "enable_cache() argument 'max_len' must be non-negative, "
+                f"got {max_len}"
+            )
+        if self._cache is None:
+            self._cache = {}
+        self._cache_max_len = -1 if max_len is None else max_len
+
+    def disable_cache(self) -> None:
+        """Stop memoizing and drop the cached results."""
+        self._cache = None
+
+    def clear_cache(self) -> None:
+        """Drop the cached results but keep caching enabled."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cache_large(self) -> bool:
+        """Whether results as long as the sequence may be cached."""
+        return (
+            self._cache is not None
+            and (
+                self._cache_max_len < 0
+                or len(self._sequence) <= self._cache_max_len
+            )
+        )
+
+    def _base_count(self, base: str) -> int:
+        if self._cache is None or len(base) != 1:
+            return self._sequence.count(base)
+        key = ("count", base)
+        if key not in self._cache:
+            self._cache[key] = self._sequence.count(base)
+        return self._cache[key]
+
     def gc_content(self, percent: bool = False) -> float | str:
         """Calculate and return the GC content of the sequence."""
         seq_length = len(self.sequence)
         if seq_length == 0:
             return 0.0 if not percent else "0.00%"
 
-        gc = self.sequence.count("G") + self.sequence.count("C")
+        gc = self._base_count("G") + self._base_count("C")
 
         return (round(gc / seq_length, 3) if not percent
                 else to_percentage(gc / seq_length))
@@ -137,7 +234,7 @@ class Sequence:
         if seq_length == 0:
             return 0.0 if not percent else "0.00%"
 
-        at = self.sequence.count("A") + self.sequence.count("T")
+        at = self._base_count("A") + self._base_count("T")
 
         return (round(at / seq_length, 3) if not percent
                 else to_percentage(at / seq_length))
@@ -149,16 +246,25 @@ class Sequence:
         else:
             comp_table = str.maketrans("ATCGRYKMBVDHSWN", "TAGCYRMKVBHDSWN")
         comp = self.sequence.translate(comp_table)
-        return Sequence(comp, rna=self._is_rna, strict=self._strict)
+        return Sequence._trusted(comp, rna=self._is_rna, strict=self._strict)
 
     def reverse_complement(self) -> "Sequence":
         """Return the reverse complement of the sequence."""
+        if self._cache is not None and "rev_comp" in self._cache:
+            return Sequence._trusted(
+                self._cache["rev_comp"], rna=self._is_rna,
+                strict=self._strict
+            )
         if self._is_rna is True:
             rev_comp_tb = str.maketrans("AUCGRYKMBVDHSWN", "UAGCYRMKVBHDSWN")
         else:
             rev_comp_tb = str.maketrans("ATCGRYKMBVDHSWN", "TAGCYRMKVBHDSWN")
         rev_comp = self.sequence.translate(rev_comp_tb)[::-1]
-        return Sequence(rev_comp, rna=self._is_rna, strict=self._strict)
+        if self._cache_large():
+            self._cache["rev_comp"] = rev_comp
+        return Sequence._trusted(
+            rev_comp, rna=self._is_rna, strict=self._strict
+        )
 
     def transcribe(self, strand: str = "+") -> "Sequence":
         """Transcribe the DNA sequence to RNA."""
@@ -170,24 +276,46 @@ class Sequence:
             rna_seq = self.sequence.replace("T", "U")
         else:
             rna_seq = self.reverse_complement().sequence.replace("T", "U")
-        return Sequence(rna_seq, rna=True, strict=self._strict)
+        return Sequence._trusted(rna_seq, rna=True, strict=self._strict)
 
     def reverse_transcribe(self) -> "Sequence":
         """Transcribe the RNA sequence to DNA."""
         if self._is_rna is False:
             return self
-        return Sequence(
+        return Sequence._trusted(
             self.sequence.replace("U", "T"), rna=False, strict=self._strict
         )
 
-    def subseq(self, start: int, end: int | None = None) -> "Sequence":
-        """Return a subsequence from start to end (end exclusive)."""
+    @overload
+    def subseq(
+        self, start: int, end: int | None = ...,
+        view: Literal[False] = ...
+    ) -> "Sequence": ...
+
+    @overload
+    def subseq(
+        self, start: int, end: int | None = ...,
+        view: Literal[True] = ...
+    ) -> "SequenceView": ...
+
+    def subseq(
+        self, start: int, end: int | None = None, view: bool = False
+    ) -> "Sequence | SequenceView":
+        """Return a subsequence from start to end (end exclusive).
+
+        With view=True, return a SequenceView on this sequence's string
+        instead of copying it.
+        """
         if (
             not isinstance(start, int)
             or (end is not None and not isinstance(end, int))
         ):
             raise TypeError("subseq() argument 'start' and ''end' must be int")
-        return Sequence(
+        if view:
+            from omibio.sequence.sequence_view import SequenceView
+
+            return SequenceView(self, start, end)
+        return Sequence._trusted(
             self.sequence[start: end], rna=self._is_rna, strict=self._strict
         )
 
@@ -203,19 +331,34 @@ class Sequence:
         """Translate the nucleotide sequence to an amino acid sequence."""
         from omibio.sequence.seq_utils.translate import translate_nt
 
-        return translate_nt(
-            self.sequence,
-            as_str=as_str,
-            strict=strict,
-            stop_symbol=stop_symbol,
-            to_stop=to_stop,
-            frame=frame,
-            require_start=require_start
-        )
+        if not self._cache_large():
+            return translate_nt(
+                self.sequence,
+                as_str=as_str,
+                strict=strict,
+                stop_symbol=stop_symbol,
+                to_stop=to_stop,
+                frame=frame,
+                require_start=require_start
+            )
+
+        key = ("translate", strict, stop_symbol, to_stop, frame, require_start)
+        if key not in self._cache:
+            self._cache[key] = translate_nt(
+                self.sequence,
+                as_str=True,
+                strict=strict,
+                stop_symbol=stop_symbol,
+                to_stop=to_stop,
+                frame=frame,
+                require_start=require_start
+            )
+        res = self._cache[key]
+        return res if as_str else Polypeptide(res, strict=strict)
 
     def count(self, base: str) -> int:
         """Count occurrences of a base in the sequence."""
-        return self.sequence.count(base)
+        return self._base_count(base)
 
     def copy(
         self,
@@ -231,6 +374,29 @@ class Sequence:
         """Return a copy of the Sequence object in strict mode."""
         return self.copy(as_rna=as_rna, strict=True)
 
+    def to_packed(self) -> "PackedSequence":
+        """Return a 2-bit packed copy of the sequence."""
+        from omibio.sequence.packed_sequence import PackedSequence
+
+        return PackedSequence(self)
+
+    def encoded(self, alphabet: str = "nt") -> "np.ndarray":
+        """Return the sequence as a read-only array of alphabet codes.
+
+        See omibio.encoding.encode_table() for the alphabets. The array
+        is cached while caching is enabled, see enable_cache().
+        """
+        from omibio.encoding import encode
+
+        key = ("encoded", alphabet)
+        if self._cache is not None and key in self._cache:
+            return self._cache[key]
+        codes = encode(self._sequence, alphabet)
+        codes.setflags(write=False)
+        if self._cache_large():
+            self._cache[key] = codes
+        return codes
+
     def is_valid(self) -> bool:
         """Check if the sequence contains only valid bases."""
         valid_bases = (
@@ -287,6 +453,12 @@ class Sequence:
                     "Cannot combine RNA sequence and DNA sequence"
                 )
             rna_result = self._is_rna
+            if self._strict == other.strict:
+                # Both halves were validated under the same rules.
+                return Sequence._trusted(
+                    self.sequence + other.sequence,
+                    rna=rna_result, strict=strict_mode
+                )
             return Sequence(
                 self.sequence + other.sequence,
                 rna=rna_result, strict=strict_mode
@@ -328,7 +500,7 @@ class Sequence:
                 "Sequence cannot be multiply by a negative number"
             )
 
-        return Sequence(
+        return Sequence._trusted(
             self.sequence * n, rna=self._is_rna, strict=self._strict
         )
 
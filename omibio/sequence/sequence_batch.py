@@ -0,0 +1,315 @@
+from dataclasses import dataclass, field
+from omibio.sequence.sequence import Sequence
+from omibio.utils import to_percentage
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TextIO
+import numpy as np
+if TYPE_CHECKING:
+    from omibio.bio import SeqCollections, SeqEntry
+
+
+def _byte_table(src: bytes, dst: bytes) -> np.ndarray:
+    table = np.arange(256, dtype=np.uint8)
+    table[np.frombuffer(src, dtype=np.uint8)] = np.frombuffer(
+        dst, dtype=np.uint8
+    )
+    return table
+
+
+_DNA_COMPLEMENT = _byte_table(b"ATCGRYKMBVDHSWN", b"TAGCYRMKVBHDSWN")
+_RNA_COMPLEMENT = _byte_table(b"AUCGRYKMBVDHSWN", b"UAGCYRMKVBHDSWN")
+_IS_GC = np.zeros(256, dtype=bool)
+_IS_GC[[ord("G"), ord("C")]] = True
+_IS_AT = np.zeros(256, dtype=bool)
+_IS_AT[[ord("A"), ord("T")]] = True
+
+
+@dataclass()
+class SequenceBatch:
+    """Many nucleotide sequences stored in one contiguous buffer.
+
+    Record i occupies seqs[offsets[i]: offsets[i+1]], so composition,
+    complement and transcription run as NumPy operations over the whole
+    batch instead of one Python call per sequence.
+
+    Args:
+        ids (list[str]):
+            Record IDs, in order.
+        seqs (np.ndarray):
+            uint8 buffer holding the upper-cased sequences.
+        offsets (np.ndarray):
+            int64 array of len(ids) + 1 record boundaries.
+        rna (np.ndarray):
+            bool array, True for RNA records.
+        source (str | None):
+            Source information for the batch.
+
+    Raises:
+        TypeError:
+            If the input types are incorrect.
+        ValueError:
+            If the buffers and offsets do not describe the same records.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    seqs: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.uint8)
+    )
+    offsets: np.ndarray = field(
+        default_factory=lambda: np.zeros(1, dtype=np.int64)
+    )
+    rna: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=bool)
+    )
+    source: str | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.ids, list):
+            raise TypeError(
+                "SequenceBatch argument 'ids' must be list, got "
+                + type(self.ids).__name__
+            )
+        for name in ("seqs", "offsets", "rna"):
+            if not isinstance(getattr(self, name), np.ndarray):
+                raise TypeError(
+                    f"SequenceBatch argument '{name}' must be np.ndarray, "
+                    f"got {type(getattr(self, name)).__name__}"
+                )
+        if len(self.offsets) != len(self.ids) + 1:
+            raise ValueError(
+                "SequenceBatch argument 'offsets' must have len(ids) + 1 "
+                f"items, got {len(self.offsets)} for {len(self.ids)} ids"
+            )
+        if len(self.rna) != len(self.ids):
+            raise ValueError(
+                "SequenceBatch argument 'rna' must have len(ids) items, "
+                f"got {len(self.rna)} for {len(self.ids)} ids"
+            )
+        if len(self.seqs) != self.offsets[-1]:
+            raise ValueError(
+                "SequenceBatch sequence buffer length mismatch: "
+                f"({len(self.seqs)} vs {self.offsets[-1]})"
+            )
+
+    @classmethod
+    def from_sequences(
+        cls,
+        records: Iterable["SeqEntry | tuple[str, Sequence | str]"],
+        source: str | None = None
+    ) -> "SequenceBatch":
+        """Build a batch from SeqEntry objects or (id, seq) pairs."""
+        ids: list[str] = []
+        seqs: list[str] = []
+        rna: list[bool] = []
+        for record in records:
+            if isinstance(record, tuple):
+                seq_id, seq = record
+            else:
+                seq_id, seq = record.seq_id, record.seq
+            if isinstance(seq, Sequence):
+                seq_str, is_rna = seq.sequence, bool(seq.is_rna)
+            elif isinstance(seq, str):
+                seq_str = seq.upper()
+                is_rna = "U" in seq_str
+            else:
+                raise TypeError(
+                    "SequenceBatch can only hold Sequence or str, got "
+                    + type(seq).__name__
+                )
+            ids.append(seq_id)
+            seqs.append(seq_str)
+            rna.append(is_rna)
+
+        lengths = np.fromiter(map(len, seqs), dtype=np.int64, count=len(ids))
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(
+            ids=ids,
+            seqs=np.frombuffer("".join(seqs).encode(), dtype=np.uint8),
+            offsets=offsets,
+            rna=np.array(rna, dtype=bool),
+            source=source
+        )
+
+    @classmethod
+    def from_collection(cls, seqs: "SeqCollections") -> "SequenceBatch":
+        """Build a batch from a SeqCollections or LazySeqCollections."""
+        return cls.from_sequences(seqs, source=seqs.source)
+
+    @classmethod
+    def from_fasta(
+        cls, source: str | TextIO | PathLike, **kwargs: Any
+    ) -> "SequenceBatch":
+        """Read a FASTA file straight into a batch.
+
+        Keyword arguments are passed to read_fasta_iter().
+        """
+        from omibio.io import read_fasta_iter
+
+        file_name = "<stdin>" if hasattr(source, "read") else str(source)
+        return cls.from_sequences(
+            read_fasta_iter(source, **kwargs), source=file_name
+        )
+
+    def lengths(self) -> np.ndarray:
+        """Return the length of every record."""
+        return np.diff(self.offsets)
+
+    def _segment_sums(self, mask: np.ndarray) -> np.ndarray:
+        totals = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask, out=totals[1:])
+        return totals[self.offsets[1:]] - totals[self.offsets[:-1]]
+
+    def _fraction(
+        self, table: np.ndarray, percent: bool
+    ) -> np.ndarray | list[str]:
+        counts = self._segment_sums(table[self.seqs])
+        lengths = self.lengths()
+        out = np.zeros(len(lengths), dtype=np.float64)
+        np.divide(counts, lengths, out=out, where=lengths > 0)
+        return [to_percentage(x) for x in out] if percent else out
+
+    def gc_content(self, percent: bool = False) -> np.ndarray | list[str]:
+        """Return the GC fraction of every record (0.0 when empty).
+
+        Values are not rounded, unlike Sequence.gc_content(). If percent
+        is True, return a list of percentage strings instead.
+        """
+        return self._fraction(_IS_GC, percent)
+
+    def at_content(self, percent: bool = False) -> np.ndarray | list[str]:
+        """Return the AT fraction of every record (0.0 when empty).
+
+        Values are not rounded, unlike Sequence.at_content(). If percent
+        is True, return a list of percentage strings instead.
+        """
+        return self._fraction(_IS_AT, percent)
+
+    def _base_rna(self) -> np.ndarray:
+        return np.repeat(self.rna, self.lengths())
+
+    def _complement_buffer(self) -> np.ndarray:
+        comp = _DNA_COMPLEMENT[self.seqs]
+        if self.rna.any():
+            rna = self._base_rna()
+            comp[rna] = _RNA_COMPLEMENT[self.seqs[rna]]
+        return comp
+
+    def _reverse_records(self, buf: np.ndarray) -> np.ndarray:
+        # Reversing the whole buffer reverses every record but also their
+        # order; shift each record back to its own slot.
+        total = len(buf)
+        shift = total - self.offsets[1:] - self.offsets[:-1]
+        idx = np.arange(total, dtype=np.int64)
+        idx += np.repeat(shift, self.lengths())
+        return buf[::-1][idx]
+
+    def _with_seqs(
+        self, seqs: np.ndarray, rna: np.ndarray | None = None
+    ) -> "SequenceBatch":
+        return SequenceBatch(
+            ids=list(self.ids), seqs=seqs, offsets=self.offsets.copy(),
+            rna=self.rna.copy() if rna is None else rna, source=self.source
+        )
+
+    def complement(self) -> "SequenceBatch":
+        """Return the complement of every record."""
+        return self._with_seqs(self._complement_buffer())
+
+    def reverse_complement(self) -> "SequenceBatch":
+        """Return the reverse complement of every record."""
+        return self._with_seqs(
+            self._reverse_records(self._complement_buffer())
+        )
+
+    def transcribe(self, strand: str = "+") -> "SequenceBatch":
+        """Transcribe every DNA record to RNA; RNA records are kept."""
+        if strand not in {"+", "-"}:
+            raise ValueError("strand type should be either '+' or '-'")
+        dna = ~self._base_rna()
+        buf = self.seqs if strand == "+" else np.where(
+            dna, self._reverse_records(self._complement_buffer()), self.seqs
+        )
+        buf = np.where(dna & (buf == ord("T")), ord("U"), buf)
+        return self._with_seqs(
+            buf.astype(np.uint8), rna=np.ones(len(self.ids), dtype=bool)
+        )
+
+    def reverse_transcribe(self) -> "SequenceBatch":
+        """Reverse transcribe every RNA record to DNA."""
+        rna = self._base_rna()
+        buf = np.where(rna & (self.seqs == ord("U")), ord("T"), self.seqs)
+        return self._with_seqs(
+            buf.astype(np.uint8), rna=np.zeros(len(self.ids), dtype=bool)
+        )
+
+    def get_seq(self, idx: int) -> str:
+        """Return the sequence of the record at the given index."""
+        start, end = self._bounds(idx)
+        return self.seqs[start: end].tobytes().decode()
+
+    def seq_strs(self) -> list[str]:
+        """Return every record as a str."""
+        text = self.seqs.tobytes().decode()
+        bounds = self.offsets.tolist()
+        return [text[a: b] for a, b in zip(bounds, bounds[1:])]
+
+    def get_sequence(self, idx: int) -> Sequence:
+        """Return the record at the given index as a Sequence."""
+        return Sequence._trusted(self.get_seq(idx), rna=bool(self.rna[idx]))
+
+    def get_entry(self, idx: int) -> "SeqEntry":
+        """Return the record at the given index as a SeqEntry."""
+        from omibio.bio import SeqEntry
+
+        return SeqEntry(
+            seq=self.get_sequence(idx), seq_id=self.ids[idx],
+            source=self.source
+        )
+
+    def entry_list(self) -> list["SeqEntry"]:
+        """Return a list of SeqEntry objects in the batch."""
+        return [self.get_entry(i) for i in range(len(self.ids))]
+
+    def to_collection(self) -> "SeqCollections":
+        """Return the batch as a SeqCollections."""
+        from omibio.bio import SeqCollections
+
+        return SeqCollections(self.entry_list(), source=self.source)
+
+    def _bounds(self, idx: int) -> tuple[int, int]:
+        if idx < 0:
+            idx += len(self.ids)
+        if not 0 <= idx < len(self.ids):
+            raise IndexError("SequenceBatch index out of range")
+        return int(self.offsets[idx]), int(self.offsets[idx + 1])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Sequence]:
+        for i in range(len(self.ids)):
+            yield self.get_sequence(i)
+
+    def __getitem__(self, idx: int) -> Sequence:
+        self._bounds(idx)
+        return self.get_sequence(idx)
+
+    def __repr__(self) -> str:
+        return (
+            f"SequenceBatch({len(self.ids)} records, "
+            f"{len(self.seqs)} bases, source={self.source!r})"
+        )
+
+
+def main():
+    batch = SequenceBatch.from_fasta(
+        r"./examples/data/example_short_seqs.fasta"
+    )
+    print(repr(batch))
+    print(batch.gc_content()[:5])
+    print(batch.reverse_complement().get_seq(0))
+
+
+if __name__ == "__main__":
+    main()
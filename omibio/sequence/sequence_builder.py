@@ -0,0 +1,191 @@
+from omibio.sequence.sequence import Sequence
+from omibio.sequence.sequence_view import SequenceView
+from typing import TYPE_CHECKING, Iterable
+if TYPE_CHECKING:
+    from omibio.bio import SeqInterval
+
+
+class SequenceBuilder:
+    """Build a Sequence from many pieces with a single final join.
+
+    Appending stores a reference to each piece, so building a sequence of
+    n pieces costs O(total length) instead of the O(n * length) of
+    repeated Sequence + Sequence. The strict-mode checks of
+    Sequence.__add__ are applied to every piece as it is appended.
+
+    Examples:
+        >>> builder = SequenceBuilder()
+        >>> for exon in exons:
+        ...     builder.append(exon)
+        >>> seq = builder.build()
+    """
+
+    __slots__ = ("_pieces", "_length", "_is_rna", "_strict")
+
+    def __init__(
+        self,
+        pieces: Iterable["Sequence | SequenceView | str | SeqInterval"]
+        | None = None,
+        rna: bool | None = None,
+        strict: bool = False
+    ):
+        """Initialization for SequenceBuilder.
+
+        Args:
+            pieces (Iterable[Sequence | SequenceView | str | SeqInterval]
+                | None, optional):
+                Pieces to append right away. Defaults to None.
+            rna (bool | None, optional):
+                Whether the result is RNA. If None, it is taken from the
+                first Sequence appended, or detected on build.
+                Defaults to None.
+            strict (bool, optional):
+                Whether to build a strict-mode Sequence and refuse to mix
+                DNA and RNA pieces. Defaults to False.
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+        """
+        if rna is not None and not isinstance(rna, bool):
+            raise TypeError(
+                "SequenceBuilder argument 'rna' must be bool or None, got "
+                + type(rna).__name__
+            )
+        if not isinstance(strict, bool):
+            raise TypeError(
+                "SequenceBuilder argument 'strict' must be bool, got "
+                + type(strict).__name__
+            )
+        self._pieces: list[str] = []
+        self._length = 0
+        self._is_rna = rna
+        self._strict = strict
+        if pieces is not None:
+            self.extend(pieces)
+
+    @property
+    def strict(self) -> bool:
+        """Return whether strict mode is enabled."""
+        return self._strict
+
+    @property
+    def is_rna(self) -> bool | None:
+        """Return whether the result is RNA, or None if not known yet."""
+        return self._is_rna
+
+    def append(
+        self, piece: "Sequence | SequenceView | str | SeqInterval"
+    ) -> "SequenceBuilder":
+        """Append one piece in amortized O(1) and return the builder.
+
+        Raises:
+            TypeError:
+                If the piece type is not supported, or strict mode mixes
+                DNA and RNA.
+            ValueError:
+                If a SeqInterval has no nt_seq, or a str piece in strict
+                mode contains both 'U' and 'T'.
+        """
+        from omibio.bio import SeqInterval
+
+        if isinstance(piece, (Sequence, SequenceView)):
+            if self._is_rna is None:
+                self._is_rna = piece.is_rna
+            elif (
+                (self._strict or piece.strict)
+                and piece.is_rna != self._is_rna
+            ):
+                raise TypeError(
+                    "(Strict Mode) "
+                    "Cannot combine RNA sequence and DNA sequence"
+                )
+            text = piece.sequence
+        elif isinstance(piece, (str, SeqInterval)):
+            if isinstance(piece, SeqInterval):
+                if piece.nt_seq is None:
+                    raise ValueError(
+                        "Cannot append SeqInterval: nt_seq is not set. "
+                    )
+                piece = piece.nt_seq
+            text = piece.upper()
+            if self._strict:
+                self._check_str(text)
+        else:
+            raise TypeError(
+                "Can only append Sequence, SequenceView, str or SeqInterval "
+                f"to SequenceBuilder, got {type(piece).__name__}"
+            )
+
+        self._pieces.append(text)
+        self._length += len(text)
+        return self
+
+    def _check_str(self, text: str) -> None:
+        has_u, has_t = "U" in text, "T" in text
+        if has_u and has_t:
+            raise ValueError(
+                "(Strict Mode) Invalid string added to Sequence: "
+                "contains both 'U' and 'T'"
+            )
+        if self._is_rna is None:
+            if has_u or has_t:
+                self._is_rna = has_u
+        elif (has_u and not self._is_rna) or (has_t and self._is_rna):
+            raise TypeError(
+                "(Strict Mode) "
+                "Cannot combine RNA sequence and DNA sequence"
+            )
+
+    def extend(
+        self, pieces: Iterable["Sequence | SequenceView | str | SeqInterval"]
+    ) -> "SequenceBuilder":
+        """Append every piece of an iterable and return the builder."""
+        for piece in pieces:
+            self.append(piece)
+        return self
+
+    def build(self) -> Sequence:
+        """Join the pieces into a new Sequence.
+
+        Raises:
+            ValueError:
+                If strict mode is enabled and the result has invalid bases.
+        """
+        seq_str = "".join(self._pieces)
+        # Keep the joined string so repeated builds stay cheap.
+        self._pieces = [seq_str] if seq_str else []
+        if self._strict:
+            return Sequence(seq_str, rna=self._is_rna, strict=True)
+        return Sequence._trusted(seq_str, rna=self._is_rna)
+
+    def clear(self) -> None:
+        """Remove every piece."""
+        self._pieces.clear()
+        self._length = 0
+
+    def __iadd__(
+        self, piece: "Sequence | SequenceView | str | SeqInterval"
+    ) -> "SequenceBuilder":
+        return self.append(piece)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return (
+            f"SequenceBuilder({len(self._pieces)} pieces, "
+            f"length={self._length}, strict={self._strict})"
+        )
+
+
+def main():
+    builder = SequenceBuilder(strict=True)
+    for piece in (Sequence("ATG"), "aaa", Sequence("CCCTAG")):
+        builder += piece
+    print(repr(builder))
+    print(repr(builder.build()))
+
+
+if __name__ == "__main__":
+    main()
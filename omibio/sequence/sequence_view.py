@@ -0,0 +1,261 @@
+from omibio.sequence.sequence import Sequence
+from omibio.sequence.polypeptide import Polypeptide
+from omibio.utils import to_percentage, truncate_repr
+
+_DNA_COMPLEMENT = str.maketrans("ATCGRYKMBVDHSWN", "TAGCYRMKVBHDSWN")
+_RNA_COMPLEMENT = str.maketrans("AUCGRYKMBVDHSWN", "UAGCYRMKVBHDSWN")
+
+
+class SequenceView:
+    """A read-only window on the string of a Sequence, without copying.
+
+    The view keeps a reference to the parent's (immutable) sequence
+    string plus start, end and strand. Counting, GC/AT content, length,
+    indexing and nested slicing work on the parent buffer directly; a new
+    string is only built by str(), to_sequence() and the methods that
+    return new sequences. A "-" strand view reads the reverse complement.
+
+    Views are created by Sequence.subseq(..., view=True) and
+    SeqInterval.view().
+    """
+
+    __slots__ = ("_buf", "_start", "_end", "_strand", "_is_rna", "_strict")
+
+    def __init__(
+        self,
+        parent: "Sequence | SequenceView",
+        start: int = 0,
+        end: int | None = None,
+        strand: str = "+"
+    ):
+        """Initialization for SequenceView.
+
+        Args:
+            parent (Sequence | SequenceView):
+                The sequence to look into.
+            start (int, optional):
+                Start position in the parent, inclusive. Negative values
+                count from the end, as in slicing. Defaults to 0.
+            end (int | None, optional):
+                End position in the parent, exclusive. Defaults to the
+                end of the parent.
+            strand (str, optional):
+                "+" for the parent strand, "-" for its reverse complement,
+                relative to the parent. Defaults to "+".
+
+        Raises:
+            TypeError:
+                If the input types are incorrect.
+            ValueError:
+                If strand is not "+" or "-".
+        """
+        if not isinstance(parent, (Sequence, SequenceView)):
+            raise TypeError(
+                "SequenceView argument 'parent' must be Sequence or "
+                f"SequenceView, got {type(parent).__name__}"
+            )
+        if (
+            not isinstance(start, int)
+            or (end is not None and not isinstance(end, int))
+        ):
+            raise TypeError(
+                "SequenceView argument 'start' and 'end' must be int"
+            )
+        if strand not in {"+", "-"}:
+            raise ValueError(f"strand must be '+' or '-', got {strand!r}")
+
+        start, end, _ = slice(start, end).indices(len(parent))
+        end = max(start, end)
+
+        if isinstance(parent, SequenceView):
+            # Re-base onto the root buffer so views never nest.
+            if parent._strand == "+":
+                start, end = parent._start + start, parent._start + end
+            else:
+                start, end = parent._end - end, parent._end - start
+                strand = "-" if strand == "+" else "+"
+            self._buf = parent._buf
+        else:
+            self._buf = parent.sequence
+        self._start = start
+        self._end = end
+        self._strand = strand
+        self._is_rna = parent.is_rna
+        self._strict = parent.strict
+
+    @property
+    def start(self) -> int:
+        """Return the start position in the root sequence."""
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """Return the end position in the root sequence."""
+        return self._end
+
+    @property
+    def strand(self) -> str:
+        """Return the strand relative to the root sequence."""
+        return self._strand
+
+    @property
+    def strict(self) -> bool:
+        """Return whether the parent is in strict mode."""
+        return self._strict
+
+    @property
+    def is_rna(self) -> bool | None:
+        """Return whether the parent is RNA."""
+        return self._is_rna
+
+    @property
+    def type(self) -> str:
+        """Return 'DNA' or 'RNA' indicating the sequence type."""
+        return "RNA" if self._is_rna else "DNA"
+
+    @property
+    def sequence(self) -> str:
+        """Return the viewed sequence as a new str."""
+        seq = self._buf[self._start: self._end]
+        if self._strand == "-":
+            seq = seq.translate(self._complement_table())[::-1]
+        return seq
+
+    def _complement_table(self) -> dict[int, int]:
+        return _RNA_COMPLEMENT if self._is_rna else _DNA_COMPLEMENT
+
+    def count(self, base: str) -> int:
+        """Count occurrences of a base without copying."""
+        if self._strand == "-":
+            if len(base) != 1:
+                return self.sequence.count(base)
+            base = base.translate(self._complement_table())
+        return self._buf.count(base, self._start, self._end)
+
+    def gc_content(self, percent: bool = False) -> float | str:
+        """Calculate and return the GC content of the sequence."""
+        length = len(self)
+        if length == 0:
+            return 0.0 if not percent else "0.00%"
+        gc = (
+            self._buf.count("G", self._start, self._end)
+            + self._buf.count("C", self._start, self._end)
+        )
+        return (round(gc / length, 3) if not percent
+                else to_percentage(gc / length))
+
+    def at_content(self, percent: bool = False) -> float | str:
+        """Calculate and return the AT content of the sequence."""
+        length = len(self)
+        if length == 0:
+            return 0.0 if not percent else "0.00%"
+        at = (
+            self._buf.count("A", self._start, self._end)
+            + self._buf.count("T", self._start, self._end)
+        )
+        return (round(at / length, 3) if not percent
+                else to_percentage(at / length))
+
+    def reverse_complement(self) -> "SequenceView":
+        """Return the reverse complement as a view on the same buffer."""
+        view = SequenceView.__new__(SequenceView)
+        view._buf = self._buf
+        view._start = self._start
+        view._end = self._end
+        view._strand = "-" if self._strand == "+" else "+"
+        view._is_rna = self._is_rna
+        view._strict = self._strict
+        return view
+
+    def complement(self) -> Sequence:
+        """Return the complement of the sequence."""
+        return self.to_sequence().complement()
+
+    def transcribe(self, strand: str = "+") -> Sequence:
+        """Transcribe the DNA sequence to RNA."""
+        return self.to_sequence().transcribe(strand)
+
+    def translate_nt(self, **kwargs) -> Polypeptide | str:
+        """Translate the viewed sequence, see Sequence.translate_nt()."""
+        return self.to_sequence().translate_nt(**kwargs)
+
+    def subseq(
+        self, start: int, end: int | None = None, view: bool = True
+    ) -> "SequenceView | Sequence":
+        """Return a subsequence from start to end (end exclusive).
+
+        Positions are relative to this view. Returns a nested view unless
+        view is False.
+        """
+        if not view:
+            return self.to_sequence().subseq(start, end)
+        return SequenceView(self, start, end)
+
+    def to_sequence(self, strict: bool | None = None) -> Sequence:
+        """Copy the viewed region into a new Sequence."""
+        strict = self._strict if strict is None else strict
+        if strict and not self._strict:
+            return Sequence(self.sequence, rna=self._is_rna, strict=True)
+        return Sequence._trusted(
+            self.sequence, rna=self._is_rna, strict=strict
+        )
+
+    def is_valid(self) -> bool:
+        """Check if the viewed region contains only valid bases."""
+        return self.to_sequence().is_valid()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __str__(self) -> str:
+        return self.sequence
+
+    def __repr__(self) -> str:
+        return (
+            f"SequenceView({truncate_repr(self.sequence)}, "
+            f"start={self._start}, end={self._end}, "
+            f"strand={self._strand!r})"
+        )
+
+    def __getitem__(self, idx) -> str:
+        if isinstance(idx, slice):
+            start, end, step = idx.indices(len(self))
+            if step == 1:
+                return str(SequenceView(self, start, end))
+            return self.sequence[idx]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("SequenceView index out of range")
+        if self._strand == "+":
+            return self._buf[self._start + idx]
+        base = self._buf[self._end - 1 - idx]
+        return base.translate(self._complement_table())
+
+    def __iter__(self):
+        return iter(self.sequence)
+
+    def __contains__(self, item) -> bool:
+        if self._strand == "+" and isinstance(item, str):
+            return self._buf.find(item, self._start, self._end) != -1
+        return item in self.sequence
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Sequence, SequenceView)):
+            return self.sequence == other.sequence
+        if isinstance(other, str):
+            return self.sequence == other.upper()
+        return False
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def main():
+    seq = Sequence("ATGCGTACGTTAGC")
+    view = seq.subseq(2, 10, view=True)
+    print(repr(view))
+    print(view.gc_content(), view.reverse_complement())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from omibio.viz.plot_sliding_gc import plot_sliding_gc
 from omibio.viz.plot_orfs import plot_orfs
 from omibio.viz.plot_kmer_heatmap import plot_kmer
 from omibio.viz.plot_motifs import plot_motifs
+from omibio.viz.plot_kmer_hist import plot_kmer_hist
 import matplotlib.pyplot as plt
 
 
@@ -10,5 +11,6 @@ __all__ = [
     "plot_sliding_gc",
     "plot_orfs",
     "plot_kmer",
-    "plot_motifs"
+    "plot_motifs",
+    "plot_kmer_hist"
 ]
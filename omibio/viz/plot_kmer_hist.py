@@ -0,0 +1,102 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.axes import Axes
+from omibio.bio import KmerHistResult
+
+
+def plot_kmer_hist(
+    hist: KmerHistResult,
+    ax: Axes | None = None,
+    max_x: int | None = None,
+    log: bool = True,
+    show: bool = False,
+    figsize: tuple = (8, 4)
+) -> Axes:
+    """Plot a k-mer abundance histogram with its peaks.
+
+    Args:
+        hist (KmerHistResult):
+            Result of kmer_histogram().
+        ax (Axes | None, optional):
+            Matplotlib Axes to plot on. If None, a new figure and axes
+            will be created. Defaults to None.
+        max_x (int | None, optional):
+            Largest abundance to show. Defaults to three times the
+            coverage, or the whole histogram without a peak.
+        log (bool, optional):
+            Whether to use a log scale for the counts. Defaults to True.
+        show (bool, optional):
+            Whether to display the plot immediately. Defaults to False.
+        figsize (tuple, optional):
+            Figure size if a new figure is created. Defaults to (8, 4).
+
+    Raises:
+        TypeError:
+            If hist is not a KmerHistResult.
+
+    Returns:
+        Axes:
+            The Matplotlib Axes object containing the plot.
+    """
+    if not isinstance(hist, KmerHistResult):
+        raise TypeError(
+            "plot_kmer_hist() argument 'hist' must be KmerHistResult, got "
+            + type(hist).__name__
+        )
+    if ax is None:
+        ax = plt.subplots(figsize=figsize)[1]
+
+    coverage = hist.metadata.get("coverage") or hist.peak
+    if max_x is None:
+        max_x = round(3 * coverage) if coverage else hist.max_count
+    max_x = min(max_x, hist.max_count)
+    x = np.arange(1, max_x + 1)
+    ax.plot(x, hist.histogram[1: max_x + 1], color="#005AEB", linewidth=1)
+
+    cutoff = hist.metadata.get("error_cutoff")
+    if cutoff is not None:
+        ax.axvline(
+            cutoff, color="grey", linestyle=":",
+            label=f"Error cutoff: {cutoff}"
+        )
+    if hist.peak is not None:
+        ax.axvline(
+            hist.peak, color="#E14040", linestyle="--",
+            label=f"Peak: {hist.peak}"
+        )
+    het = hist.metadata.get("het_peak")
+    if het is not None and het != hist.peak:
+        ax.axvline(
+            het, color="#E1A040", linestyle="--", label=f"Het peak: {het}"
+        )
+
+    title = "k-mer Spectrum"
+    if hist.seq_id is not None:
+        title += f" of {hist.seq_id}"
+    if hist.genome_size is not None:
+        title += f" (genome size ~{hist.genome_size:,})"
+    ax.set_title(title)
+    ax.set_xlabel("Abundance")
+    ax.set_ylabel("Distinct k-mers")
+    if log:
+        ax.set_yscale("log")
+    ax.grid(True, linestyle='--', alpha=0.5)
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend(loc='upper right')
+
+    if show:
+        plt.show()
+    return ax
+
+
+def main():
+    from omibio.analysis import kmer_histogram
+    rng = np.random.default_rng(0)
+    counts = np.concatenate([
+        rng.geometric(0.7, 200_000), rng.poisson(30, 500_000)
+    ])
+    plot_kmer_hist(kmer_histogram(counts, k=21), show=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import replace
 from omibio.sequence import Sequence
 from omibio.analysis.find_orfs import find_orfs, find_orfs_in_frame
 
@@ -231,3 +232,38 @@ class TestFindORFs:
             start_codons={"ATG"}, seq_id="seq1"
         )
         assert orfs[0].seq_id == "seq1"
+
+    @pytest.mark.parametrize("overlap", [False, True])
+    def test_matches_frame_scan(self, overlap):
+        import random
+        rng = random.Random(7)
+        for _ in range(50):
+            seq = "".join(rng.choice("ACGTTAAGN") for _ in range(300))
+            result = find_orfs(
+                seq, min_length=9, max_length=150, overlap=overlap,
+                translate=True, start_codons={"ATG", "GTG"}, seq_id="s"
+            )
+            expected = []
+            for strand, strand_seq in (
+                ("+", seq), ("-", str(Sequence(seq).reverse_complement()))
+            ):
+                for frame in (0, 1, 2):
+                    for orf in find_orfs_in_frame(
+                        strand_seq, min_length=9, max_length=150,
+                        overlap=overlap, strand=strand, frame=frame,
+                        translate=True, start_codons={"ATG", "GTG"},
+                        str_seq=True, seq_id="s"
+                    ):
+                        if strand == "-":
+                            orf = replace(
+                                orf, start=len(seq) - orf.end,
+                                end=len(seq) - orf.start
+                            )
+                        expected.append(orf)
+            expected.sort(key=lambda orf: orf.length, reverse=True)
+            assert list(result.intervals) == expected
+
+    def test_non_ascii_sequence(self):
+        orfs = find_orfs("ATGAAATAAé", min_length=6, include_reverse=False)
+        assert len(orfs) == 1
+        assert orfs[0].nt_seq == "ATGAAATAA"
@@ -1,7 +1,8 @@
 import pytest
+import numpy as np
 from omibio.sequence.sequence import Sequence
 from omibio.sequence.seq_utils.complement import reverse_complement
-from omibio.analysis import kmer
+from omibio.analysis import kmer, kmer_collection
 
 
 class TestKmer:
@@ -59,3 +60,123 @@ class TestKmer:
         seq = "ACGTAC"
         result = kmer(seq, 2, canonical=True)
         assert "AC" in result
+
+    @pytest.mark.parametrize("k", [1, 3, 13, 33])
+    def test_matches_string_slicing(self, k):
+        import random
+        from collections import Counter
+
+        rng = random.Random(k)
+        for alphabet in ("ACGT", "ACGU", "ACGTN", "acgtUX", "MKVLA"):
+            seq = "".join(rng.choice(alphabet) for _ in range(300))
+            expected: Counter = Counter()
+            for i in range(len(seq) - k + 1):
+                expected[seq[i: i + k].upper()] += 1
+            result = kmer(seq, k)
+            assert result.counts == expected
+            assert list(result.counts) == list(expected)
+
+    @pytest.mark.parametrize("k", [1, 4, 13, 21, 33])
+    def test_canonical_matches_reverse_complement(self, k):
+        import random
+        from collections import Counter
+
+        rng = random.Random(k)
+        for alphabet in ("ACGT", "ACGTN", "acgtRX"):
+            seq = "".join(rng.choice(alphabet) for _ in range(300))
+            expected: Counter = Counter()
+            for i in range(len(seq) - k + 1):
+                w = seq[i: i + k].upper()
+                expected[min(w, reverse_complement(w, as_str=True))] += 1
+            result = kmer(seq, k, canonical=True)
+            assert result.counts == expected
+            assert list(result.counts) == list(expected)
+
+    def test_canonical_rna(self):
+        result = kmer("GAGCUC", 3, canonical=True)
+        assert result.counts == {"CUC": 2, "AGC": 2}
+
+    def test_top(self):
+        result = kmer("ACTACTACTGG", 3, top=2)
+        assert list(result.items()) == [("ACT", 3), ("CTA", 2)]
+        with pytest.raises(ValueError):
+            kmer("ACTG", 2, top=0)
+        with pytest.raises(TypeError):
+            kmer("ACTG", 2, top="1")
+
+    def test_approximate(self):
+        result = kmer("ACTACTACTGG", 3, approximate=True, top=2)
+        assert dict(result.counts) == {"ACT": 3, "CTA": 2}
+        assert result.metadata["approximate"] is True
+        assert result.metadata["errors"] == {"ACT": 0, "CTA": 0}
+
+
+class TestKmerCollection:
+
+    RECORDS = ["ACGTACGTNNACG", "AUGGCUAGG", "", "ACG", "ttacgatcga"]
+
+    def expected(self, k, canonical=False, min_count=1):
+        from collections import Counter
+
+        total: Counter = Counter()
+        for seq in self.RECORDS:
+            total.update(kmer(seq, k, canonical=canonical).counts)
+        return {km: c for km, c in total.items() if c >= min_count}
+
+    @pytest.mark.parametrize("k", [1, 3, 14, 33])
+    @pytest.mark.parametrize("canonical", [False, True])
+    def test_matches_kmer(self, k, canonical):
+        result = kmer_collection(self.RECORDS, k, canonical=canonical)
+        expected = self.expected(k, canonical)
+        assert result.counts == expected
+        assert list(result.counts) == list(expected)
+        assert result.metadata["n_seqs"] == 5
+        assert result.metadata["seq_length"] == 35
+
+    def test_chunks_and_workers(self):
+        expected = self.expected(3, min_count=2)
+        for workers, chunk_size in ((1, 4), (2, 10)):
+            result = kmer_collection(
+                self.RECORDS, 3, min_count=2,
+                workers=workers, chunk_size=chunk_size
+            )
+            assert result.counts == expected
+
+    def test_windows_stay_in_records(self):
+        result = kmer_collection(["AAAA", "CCCC", "GG"], 3)
+        assert result.counts == {"AAA": 2, "CCC": 2}
+
+    def test_many_short_reads_stay_small(self):
+        import tracemalloc
+        rng = np.random.default_rng(0)
+        reads = [
+            "".join("ACGT"[i] for i in rng.integers(0, 4, 100))
+            for _ in range(200)
+        ]
+        tracemalloc.start()
+        try:
+            kmer_collection(reads, 12)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # One dense 4**12 table per read would take over 100 MB.
+        assert peak < 16 << 20
+
+    def test_collection_input(self):
+        from omibio.bio import SeqCollections, SeqEntry
+
+        seqs = SeqCollections([
+            SeqEntry(Sequence(s), seq_id=str(i))
+            for i, s in enumerate(self.RECORDS)
+        ])
+        result = kmer_collection(seqs, 2, seq_id="total")
+        assert result.counts == self.expected(2)
+        assert result.seq_id == "total"
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            kmer_collection([123], 3)
+        with pytest.raises(TypeError):
+            kmer_collection(self.RECORDS, "3")
+        with pytest.raises(ValueError):
+            kmer_collection(self.RECORDS, 3, workers=0)
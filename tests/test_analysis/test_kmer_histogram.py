@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from omibio.analysis import (
+    kmer, kmer_histogram, kmer_partitioned, iter_kmer_partitions
+)
+
+
+def simulated_counts(het=0, coverage=30, seed=0, hom=200_000):
+    rng = np.random.default_rng(seed)
+    return np.concatenate([
+        rng.geometric(0.7, 100_000),
+        rng.poisson(coverage / 2, het),
+        rng.poisson(coverage, hom),
+    ])
+
+
+class TestKmerHistogram:
+
+    def test_bins(self):
+        result = kmer_histogram(np.array([1, 1, 2, 5, 9]), max_count=5)
+        assert result.histogram.tolist() == [0, 2, 1, 0, 0, 2]
+        assert result.distinct == 5
+
+    def test_from_kmer_result(self):
+        counts = kmer("ACGTACGTAAAC", 2)
+        result = kmer_histogram(counts, max_count=10)
+        assert result.k == 2
+        expected = np.bincount(list(counts.values()), minlength=11)
+        assert result.histogram.tolist() == expected.tolist()
+
+    def test_streaming_matches_whole(self):
+        records = ["ACGTTGCAACGT" * 20, "TTGCAGGCATAC" * 15, "ACGT" * 30]
+        streamed = kmer_histogram(
+            iter_kmer_partitions(records, 5, n_partitions=4), k=5
+        )
+        whole = kmer_histogram(kmer_partitioned(records, 5))
+        assert streamed == whole
+        chunks = [np.array([1, 2]), (None, np.array([2, 3])), [4]]
+        result = kmer_histogram(iter(chunks), max_count=4)
+        assert result.histogram.tolist() == [0, 1, 2, 1, 1]
+
+    def test_haploid_estimates(self):
+        result = kmer_histogram(simulated_counts(), k=21, max_count=200)
+        assert 28 <= result.peak <= 31
+        assert result.genome_size == pytest.approx(200_000, rel=0.05)
+        assert result.heterozygosity is None
+        assert result.metadata["het_peak"] is None
+        assert 2 <= result.metadata["error_cutoff"] < 20
+
+    def test_diploid_estimates(self):
+        counts = simulated_counts(het=100_000)
+        result = kmer_histogram(counts, k=21, max_count=200)
+        assert result.metadata["het_peak"] == pytest.approx(15, abs=2)
+        assert result.metadata["coverage"] == pytest.approx(30, abs=1.5)
+        # 50000 heterozygous positions over 250000.
+        assert result.genome_size == pytest.approx(250_000, rel=0.05)
+        assert result.metadata["het_kmer_fraction"] == pytest.approx(
+            0.2, abs=0.01
+        )
+        expected = 1 - (1 - 0.2) ** (1 / 21)
+        assert result.heterozygosity == pytest.approx(expected, rel=0.05)
+
+    def test_het_fraction_unbiased(self):
+        # The low tail of a tall homozygous peak is not heterozygous.
+        for seed in range(3):
+            counts = simulated_counts(het=100_000, seed=seed, hom=480_000)
+            result = kmer_histogram(counts, k=21, max_count=200)
+            expected = 1.5e6 / (1.5e6 + 480_000 * 30)
+            assert result.metadata["het_kmer_fraction"] == pytest.approx(
+                expected, abs=0.005
+            )
+
+    def test_no_side_peak_beside_main(self):
+        # The main peak's own shoulder is not a heterozygous peak.
+        for counts in ([5], [5, 5, 4, 6, 5]):
+            result = kmer_histogram(np.array(counts), k=3)
+            assert result.metadata["het_peak"] is None
+            assert result.heterozygosity is None
+            assert "het_kmer_fraction" not in result.metadata
+
+    def test_no_peak(self):
+        result = kmer_histogram(np.array([1, 1, 1, 2, 3]))
+        assert result.peak is None and result.genome_size is None
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            kmer_histogram("ACGT")
+        with pytest.raises(TypeError):
+            kmer_histogram(np.array([1.5]))
+        with pytest.raises(ValueError):
+            kmer_histogram(np.array([-1]))
+        with pytest.raises(ValueError):
+            kmer_histogram(np.array([1]), max_count=2)
+        with pytest.raises(TypeError):
+            kmer_histogram(np.array([1]), k="21")
@@ -0,0 +1,93 @@
+import pytest
+import random
+import numpy as np
+from omibio.analysis import (
+    kmer_collection, kmer_partitioned, iter_kmer_partitions
+)
+
+
+def make_records(seed=0):
+    rng = random.Random(seed)
+    records = [
+        "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 400)))
+        for _ in range(6)
+    ]
+    records.append("ACGTNNACGTACGU")
+    records.append("A" * 300)
+    return records
+
+
+def expected_counts(records, k, canonical=False, min_count=1):
+    counts = kmer_collection(
+        [r.replace("U", "T") for r in records], k,
+        canonical=canonical, min_count=min_count
+    ).counts
+    return {km: c for km, c in counts.items() if "N" not in km}
+
+
+class TestKmerPartitioned:
+
+    @pytest.mark.parametrize("k", [1, 5, 13, 32])
+    @pytest.mark.parametrize("canonical", [False, True])
+    def test_matches_in_memory(self, k, canonical):
+        records = make_records(k)
+        result = kmer_partitioned(records, k, canonical=canonical)
+        assert dict(result.counts) == expected_counts(records, k, canonical)
+        assert result.metadata["partitioned"] is True
+        assert list(result.keys()) == sorted(result.keys())
+
+    def test_small_budget_splits(self, tmp_path):
+        records = make_records()
+        result = kmer_partitioned(
+            records, 7, min_count=2, max_memory=128, n_partitions=2,
+            tmp_dir=tmp_path
+        )
+        assert dict(result.counts) == expected_counts(
+            records, 7, min_count=2
+        )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_workers(self):
+        records = make_records(1)
+        result = kmer_partitioned(
+            records, 9, max_memory=512, n_partitions=4, workers=2
+        )
+        assert dict(result.counts) == expected_counts(records, 9)
+
+    def test_partitions_disjoint(self):
+        parts = list(iter_kmer_partitions(make_records(), 6, n_partitions=8))
+        codes = np.concatenate([codes for codes, _ in parts])
+        assert len(codes) == len(np.unique(codes))
+        for codes, counts in parts:
+            assert np.all(np.diff(codes.astype(np.int64)) > 0)
+            assert counts.dtype == np.int64
+
+    def test_output(self, tmp_path):
+        out = tmp_path / "kmers.tsv"
+        records = make_records()
+        assert kmer_partitioned(records, 4, seq_id="s", output=out) is None
+        lines = out.read_text().splitlines()
+        assert lines[0] == "seq_id\tk\tkmer\tcount"
+        rows = {line.split("\t")[2]: int(line.split("\t")[3])
+                for line in lines[1:]}
+        assert rows == expected_counts(records, 4)
+        assert lines[1].startswith("s\t4\t")
+
+    def test_rna_spelling(self, tmp_path):
+        records = ["ACGUACGU", "ggcauuacg"]
+        result = kmer_partitioned(records, 3)
+        assert result.counts == kmer_collection(records, 3).counts
+        out = tmp_path / "kmers.tsv"
+        kmer_partitioned(records, 3, output=out)
+        assert "\tCGU\t2" in out.read_text()
+        assert not kmer_partitioned(["ACGT", "ACGU"], 3).rna
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            kmer_partitioned(["ACGT"], 33)
+        with pytest.raises(ValueError):
+            kmer_partitioned(["ACGT"], 3, max_memory=0)
+        with pytest.raises(ValueError):
+            kmer_partitioned(["ACGT"], 3, n_partitions=1 << 17)
+        with pytest.raises(TypeError):
+            kmer_partitioned(["ACGT"], 3, workers="2")
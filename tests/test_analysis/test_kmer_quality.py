@@ -0,0 +1,110 @@
+import pytest
+import numpy as np
+from collections import Counter
+from omibio.analysis import kmer_fastq
+from omibio.bio import FastqBatch, KmerArrayResult, SeqEntry
+from omibio.sequence import Sequence
+from omibio.io import read_fastq_iter
+
+FASTQ = "./examples/data/example_fastq.fastq"
+
+
+def entry(seq, qual, seq_id="r"):
+    return SeqEntry(Sequence(seq), seq_id=seq_id, qual=qual)
+
+
+def trusted_counter(entries, k, min_qual):
+    counter = Counter()
+    for e in entries:
+        seq, qual = str(e.seq).upper(), e.qual
+        for i in range(len(seq) - k + 1):
+            window = seq[i: i + k]
+            if set(window) <= set("ACGT") and all(
+                ord(q) - 33 >= min_qual for q in qual[i: i + k]
+            ):
+                counter[window] += 1
+    return counter
+
+
+class TestKmerFastq:
+
+    def test_masks_low_quality(self):
+        # The '#' (Phred 2) base only spoils the windows that cover it.
+        result = kmer_fastq([entry("ACGTACG", "IIII#II")], 2, min_qual=20)
+        assert isinstance(result, KmerArrayResult)
+        assert dict(result.counts) == {"AC": 1, "CG": 2, "GT": 1}
+        assert result.metadata["low_quality_bases"] == 1
+        assert result.metadata["windows"] == 6
+        assert result.metadata["trusted_windows"] == 4
+
+    def test_no_threshold_counts_acgt(self):
+        result = kmer_fastq([entry("ACGNAC", "!!!!!!")], 2, min_qual=0)
+        assert dict(result.counts) == {"AC": 2, "CG": 1}
+
+    def test_windows_stay_in_reads(self):
+        entries = [entry("AAAA", "IIII"), entry("CCCC", "IIII")]
+        result = kmer_fastq(entries, 3)
+        assert dict(result.counts) == {"AAA": 2, "CCC": 2}
+
+    def test_matches_reference(self):
+        entries = list(read_fastq_iter(FASTQ))
+        for k in (1, 5, 13):
+            for min_qual in (0, 20, 35):
+                result = kmer_fastq(entries, k, min_qual=min_qual)
+                expected = trusted_counter(entries, k, min_qual)
+                assert dict(result.counts) == dict(expected)
+
+    def test_inputs_agree(self):
+        entries = list(read_fastq_iter(FASTQ))
+        from_path = kmer_fastq(FASTQ, 7, min_qual=25)
+        from_batch = kmer_fastq(FastqBatch.from_entries(entries), 7,
+                                min_qual=25)
+        mixed = kmer_fastq(
+            [FastqBatch.from_entries(entries[:3])] + entries[3:], 7,
+            min_qual=25
+        )
+        assert from_path == from_batch == mixed
+        assert from_path.metadata["n_reads"] == len(entries)
+
+    def test_canonical_and_min_count(self):
+        entries = [entry("AACC", "IIII"), entry("GGTT", "IIII")]
+        result = kmer_fastq(entries, 2, canonical=True, min_count=2)
+        assert dict(result.counts) == {"AA": 2, "AC": 2, "CC": 2}
+        assert result.metadata["canonical"] is True
+
+    def test_empty(self):
+        result = kmer_fastq([], 4)
+        assert len(result) == 0
+        assert result.metadata["n_reads"] == 0
+        codes, counts = result.to_numpy()
+        assert codes.dtype == np.uint64 and counts.dtype == np.int64
+
+    def test_zero_length_reads(self):
+        trimmed = [entry("", "", "a"), entry("", "", "b")]
+        result = kmer_fastq(FastqBatch.from_entries(trimmed), 3)
+        assert len(result) == 0
+        assert result.metadata["n_reads"] == 2
+        assert len(kmer_fastq(FastqBatch(), 3)) == 0
+        mixed = kmer_fastq(
+            [FastqBatch.from_entries(trimmed), entry("ACGTA", "IIIII")], 3
+        )
+        assert dict(mixed.counts) == {"ACG": 1, "CGT": 1, "GTA": 1}
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            kmer_fastq([entry("ACGT", "IIII")], "2")
+        with pytest.raises(ValueError):
+            kmer_fastq([entry("ACGT", "IIII")], 33)
+        with pytest.raises(ValueError):
+            kmer_fastq([entry("ACGT", "IIII")], 2, min_qual=-1)
+        with pytest.raises(ValueError):
+            kmer_fastq([entry("ACGT", None)], 2)
+        with pytest.raises(TypeError):
+            kmer_fastq(["ACGT"], 2)
+
+    def test_slices_agree(self, monkeypatch):
+        import omibio.analysis.kmer_quality as module
+        entries = list(read_fastq_iter(FASTQ))
+        whole = kmer_fastq(entries, 6, min_qual=20)
+        monkeypatch.setattr(module, "_SLICE_BASES", 100)
+        assert kmer_fastq(entries, 6, min_qual=20) == whole
@@ -0,0 +1,179 @@
+import pytest
+import random
+import numpy as np
+from omibio.analysis import (
+    kmer_approximate, kmer_collection, CountMinSketch, SpaceSaving
+)
+from omibio.encoding import encode, kmer_codes
+
+
+def make_records(seed=0):
+    rng = random.Random(seed)
+    records = [
+        "".join(rng.choice("ACGT") for _ in range(rng.randint(100, 600)))
+        for _ in range(20)
+    ]
+    records += ["ACGTTGCA" * 40] * 3
+    return records
+
+
+class TestCountMinSketch:
+
+    def test_never_undercounts(self):
+        rng = np.random.default_rng(0)
+        keys = rng.integers(0, 5000, 20000).astype(np.uint64)
+        sketch = CountMinSketch(width=256, depth=3)
+        sketch.add(keys)
+        uniq, counts = np.unique(keys, return_counts=True)
+        estimate = sketch.query(uniq)
+        assert np.all(estimate >= counts)
+        assert sketch.total == len(keys)
+        # Holds with probability 1 - delta for every key.
+        assert np.mean(estimate - counts <= sketch.max_error) > 0.9
+
+    def test_weighted_and_merge(self):
+        keys = np.array([1, 2, 3], dtype=np.uint64)
+        a = CountMinSketch(width=1024, depth=4)
+        b = CountMinSketch(width=1024, depth=4)
+        a.add(keys, np.array([5, 1, 2]))
+        b.add(keys[:1])
+        a.merge(b)
+        assert a.query(keys).tolist() == [6, 1, 2]
+        assert a.total == 9
+
+    def test_bounds_and_size(self):
+        sketch = CountMinSketch(width=1000, depth=5)
+        assert sketch.width == 1024
+        assert sketch.nbytes == 5 * 1024 * 8
+        assert sketch.epsilon == pytest.approx(np.e / 1024)
+        assert sketch.delta == pytest.approx(np.exp(-5))
+
+    def test_merge_incompatible(self):
+        with pytest.raises(ValueError):
+            CountMinSketch(64).merge(CountMinSketch(64, seed=1))
+
+    def test_invalid_args(self):
+        with pytest.raises(TypeError):
+            CountMinSketch(width=1.5)
+        with pytest.raises(ValueError):
+            CountMinSketch(depth=0)
+
+
+class TestSpaceSaving:
+
+    def test_exact_below_capacity(self):
+        ss = SpaceSaving(10)
+        ss.update(np.array([1, 2]), np.array([3, 1]))
+        ss.update(np.array([2, 5]), np.array([4, 2]))
+        keys, counts, errors = ss.top()
+        assert keys.tolist() == [2, 1, 5]
+        assert counts.tolist() == [5, 3, 2]
+        assert errors.tolist() == [0, 0, 0]
+
+    def test_bounds_hold(self):
+        rng = np.random.default_rng(1)
+        truth: dict[int, int] = {}
+        ss = SpaceSaving(50)
+        for _ in range(30):
+            batch = rng.zipf(1.5, 2000) % 1000
+            keys, counts = np.unique(batch, return_counts=True)
+            ss.update(keys, counts)
+            for key, c in zip(keys.tolist(), counts.tolist()):
+                truth[key] = truth.get(key, 0) + c
+        assert len(ss) == 50
+        for key, c, e in zip(*(a.tolist() for a in ss.top())):
+            assert c - e <= truth[key] <= c
+        heavy = [key for key, c in truth.items() if c > ss.total / 50]
+        assert set(heavy) <= set(ss.keys.tolist())
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSaving(0)
+
+
+class TestKmerApproximate:
+
+    @pytest.mark.parametrize("canonical", [False, True])
+    def test_bounds_against_exact(self, canonical):
+        records = make_records()
+        exact = kmer_collection(records, 6, canonical=canonical).counts
+        result = kmer_approximate(
+            records, 6, canonical=canonical, top=15, width=512,
+            capacity=200
+        )
+        assert len(result) == 15
+        errors = result.metadata["errors"]
+        for km, c in result.items():
+            assert c - errors[km] <= exact[km] <= c
+        assert result.metadata["total_kmers"] == sum(exact.values())
+
+    def test_top_matches_exact_with_room(self):
+        records = make_records(1)
+        exact = kmer_collection(records, 5).counts
+        result = kmer_approximate(records, 5, top=5, width=1 << 16)
+        expected = sorted(exact.values(), reverse=True)[:5]
+        assert list(result.values()) == expected
+        assert all(exact[km] == c for km, c in result.items())
+
+    def test_metadata(self):
+        result = kmer_approximate(
+            make_records(), 4, top=3, width=2048, depth=3, seq_id="x"
+        )
+        meta = result.metadata
+        assert meta["approximate"] is True
+        assert meta["epsilon"] == pytest.approx(np.e / 2048)
+        assert meta["delta"] == pytest.approx(np.exp(-3))
+        assert meta["max_error"] == int(np.ceil(
+            meta["epsilon"] * meta["total_kmers"]
+        ))
+        assert meta["n_seqs"] == 23
+        assert meta["sketch"].nbytes == 3 * 2048 * 8
+        assert result.seq_id == "x"
+
+    def test_sketch_query(self):
+        records = make_records()
+        result = kmer_approximate(records, 6, top=1)
+        exact = kmer_collection(records, 6).counts
+        codes, _ = kmer_codes(encode("ACGTTG", "2bit"), 6)
+        assert result.metadata["sketch"].query(codes)[0] >= exact["ACGTTG"]
+
+    def test_single_sequence_and_rna(self):
+        result = kmer_approximate("ACGUACGUNNAC", 4, top=2)
+        assert dict(result.counts) == {"ACGU": 2, "CGUA": 1}
+        result = kmer_approximate("ACGT", 5)
+        assert len(result) == 0
+
+    def test_min_count(self):
+        result = kmer_approximate(make_records(), 6, min_count=100, top=50)
+        assert result.values() and min(result.values()) >= 100
+
+    def test_long_record_in_bounded_pieces(self, monkeypatch):
+        import omibio.analysis.kmer_sketch as module
+        monkeypatch.setattr(module, "_PIECE", 50)
+        record = "".join(make_records(3))
+        tasks = list(module._sketch_tasks([record], 6, 120, [0, 0],
+                                          [False, False]))
+        assert len(tasks) > 1
+        assert max(sum(map(len, task)) for task in tasks) < 120 + 55
+        exact = kmer_collection([record], 6).counts
+        result = kmer_approximate(
+            [record], 6, top=5, width=1 << 16, chunk_size=120
+        )
+        assert all(exact[km] == c for km, c in result.items())
+        assert result.metadata["total_kmers"] == sum(exact.values())
+
+    def test_workers(self):
+        records = make_records(2)
+        single = kmer_approximate(records, 7, top=10, chunk_size=500)
+        multi = kmer_approximate(
+            records, 7, top=10, chunk_size=500, workers=2
+        )
+        assert dict(single.counts) == dict(multi.counts)
+
+    def test_invalid_args(self):
+        with pytest.raises(TypeError):
+            kmer_approximate(["ACGT"], 2.0)
+        with pytest.raises(ValueError):
+            kmer_approximate(["ACGT"], 33)
+        with pytest.raises(ValueError):
+            kmer_approximate(["ACGT"], 2, top=0)
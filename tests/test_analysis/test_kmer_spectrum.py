@@ -0,0 +1,66 @@
+import pytest
+import random
+from omibio.sequence.sequence import Sequence
+from omibio.analysis import kmer, kmer_spectrum, spectrum_labels
+
+
+class TestKmerSpectrum:
+
+    @pytest.mark.parametrize("canonical", [False, True])
+    def test_matches_kmer(self, canonical):
+        rng = random.Random(0)
+        seq = "".join(rng.choice("ACGTNacgt") for _ in range(300))
+        ks = [1, 2, 5, 9, 13, 33]
+        spectrum = kmer_spectrum(seq, ks, canonical=canonical, min_count=2)
+        assert list(spectrum) == ks
+        for k in ks:
+            expected = kmer(seq, k, canonical=canonical, min_count=2)
+            assert spectrum[k].counts == expected.counts
+            assert list(spectrum[k].counts) == list(expected.counts)
+
+    def test_default_ks_and_rna(self):
+        spectrum = kmer_spectrum(Sequence("ACGUAC"), seq_id="x")
+        assert list(spectrum) == list(range(1, 9))
+        assert spectrum[2].counts == {"AC": 2, "CG": 1, "GU": 1, "UA": 1}
+        assert spectrum[7].counts == {}
+        assert spectrum[1].seq_id == "x"
+
+    def test_vector(self):
+        vector = kmer_spectrum("ACGTNAC", [1, 2], as_vector=True)
+        labels = spectrum_labels([1, 2])
+        assert len(vector) == len(labels) == 4 + 16
+        counts = dict(zip(labels, vector.tolist()))
+        assert counts["A"] == 2 and counts["AC"] == 2 and counts["GT"] == 1
+        assert sum(vector[:4]) == 6
+
+    def test_vector_normalize_and_canonical(self):
+        vector = kmer_spectrum(
+            "AACCGGTT", [1, 3], as_vector=True, normalize=True,
+            canonical=True
+        )
+        assert vector[:4].sum() == pytest.approx(1)
+        assert vector[4:].sum() == pytest.approx(1)
+        labels = spectrum_labels([1, 3])
+        assert dict(zip(labels, vector))["T"] == 0
+        empty = kmer_spectrum("AC", [3], as_vector=True, normalize=True)
+        assert not empty.any()
+
+    def test_vector_rejects_large_k(self):
+        with pytest.raises(ValueError):
+            kmer_spectrum("ACGT", [13], as_vector=True)
+        with pytest.raises(ValueError):
+            spectrum_labels([13])
+
+    def test_invalid_args(self):
+        with pytest.raises(TypeError):
+            kmer_spectrum(123)
+        with pytest.raises(TypeError):
+            kmer_spectrum("ACGT", 3)
+        with pytest.raises(TypeError):
+            kmer_spectrum("ACGT", [1.0])
+        with pytest.raises(ValueError):
+            kmer_spectrum("ACGT", [0, 1])
+        with pytest.raises(ValueError):
+            kmer_spectrum("ACGT", [])
+        with pytest.raises(ValueError):
+            kmer_spectrum("ACGT", min_count=-1)
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from omibio.bio import FastqBatch, SeqEntry
+from omibio.sequence import Sequence
+
+
+class TestFastqBatch:
+    def make_batch(self):
+        return FastqBatch.from_entries(
+            [
+                SeqEntry(Sequence("ACGT"), seq_id="r1", qual="II#I"),
+                SeqEntry(Sequence("GG"), seq_id="r2", qual="!5"),
+            ],
+            source="test"
+        )
+
+    def test_init_empty(self):
+        batch = FastqBatch()
+        assert len(batch) == 0
+        assert list(batch) == []
+        assert batch.lengths().tolist() == []
+
+    def test_from_entries(self):
+        batch = self.make_batch()
+        assert len(batch) == 2
+        assert batch.ids == ["r1", "r2"]
+        assert batch.offsets.tolist() == [0, 4, 6]
+        assert batch.seqs.tobytes() == b"ACGTGG"
+        assert batch.quals.tobytes() == b"II#I!5"
+        assert batch.source == "test"
+
+    def test_from_entries_missing_qual(self):
+        with pytest.raises(ValueError):
+            FastqBatch.from_entries([SeqEntry(Sequence("A"), seq_id="a")])
+
+    def test_accessors(self):
+        batch = self.make_batch()
+        assert batch.get_id(1) == "r2"
+        assert batch.get_seq(0) == "ACGT"
+        assert batch.get_qual(-1) == "!5"
+        assert batch.lengths().tolist() == [4, 2]
+        assert batch.phred().tolist() == [40, 40, 2, 40, 0, 20]
+        with pytest.raises(IndexError):
+            batch.get_seq(2)
+
+    def test_entries(self):
+        batch = self.make_batch()
+        entry = batch[1]
+        assert isinstance(entry, SeqEntry)
+        assert entry.seq_id == "r2"
+        assert entry.seq == "GG"
+        assert entry.qual == "!5"
+        assert [e.seq_id for e in batch.entry_list()] == ["r1", "r2"]
+
+    def test_invalid_types(self):
+        with pytest.raises(TypeError):
+            FastqBatch(ids=("a",))
+        with pytest.raises(TypeError):
+            FastqBatch(seqs=b"ACGT")
+
+    def test_inconsistent_buffers(self):
+        with pytest.raises(ValueError):
+            FastqBatch(ids=["a"])
+        with pytest.raises(ValueError):
+            FastqBatch(
+                ids=["a"],
+                seqs=np.frombuffer(b"ACGT", dtype=np.uint8),
+                quals=np.frombuffer(b"III", dtype=np.uint8),
+                offsets=np.array([0, 4]),
+            )
+
+    def test_repr(self):
+        assert "2 records" in repr(self.make_batch())
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from omibio.bio import KmerArrayResult, KmerResult
+
+
+def codes_of(*kmers):
+    table = {"A": 0, "C": 1, "G": 2, "T": 3}
+    codes = []
+    for kmer in kmers:
+        code = 0
+        for base in kmer:
+            code = code << 2 | table[base]
+        codes.append(code)
+    return np.array(codes, dtype=np.uint64)
+
+
+class TestKmerArrayResult:
+
+    def test_init_sorts_and_sums(self):
+        r = KmerArrayResult(
+            2, codes_of("GT", "AC", "GT"), np.array([1, 2, 3]), seq_id="s"
+        )
+        assert isinstance(r, KmerResult)
+        assert r.codes.tolist() == codes_of("AC", "GT").tolist()
+        assert r.code_counts.tolist() == [2, 4]
+        assert r.counts == {"AC": 2, "GT": 4}
+        assert len(r) == 2
+        assert r.seq_id == "s"
+
+    def test_lookup(self):
+        r = KmerArrayResult(3, codes_of("ACG", "TTT"), np.array([5, 1]))
+        assert r["ACG"] == 5
+        assert "TTT" in r and "TTA" not in r and "AC" not in r
+        with pytest.raises(KeyError):
+            r["NNN"]
+        assert list(r) == ["ACG", "TTT"]
+        assert list(r.items()) == [("ACG", 5), ("TTT", 1)]
+        assert list(r.values()) == [5, 1]
+
+    def test_rna(self):
+        r = KmerArrayResult(2, codes_of("GT"), np.array([1]), rna=True)
+        assert r.counts == {"GU": 1}
+        assert r["GU"] == 1
+
+    def test_from_result(self):
+        result = KmerResult(k=2, counts={"GT": 3, "AC": 1}, seq_id="x")
+        r = KmerArrayResult.from_result(result)
+        assert r.counts == result.counts
+        assert result.to_array_result() == r
+        with pytest.raises(ValueError):
+            KmerArrayResult.from_result(KmerResult(k=2, counts={"AN": 1}))
+        with pytest.raises(TypeError):
+            KmerArrayResult.from_result({"AC": 1})
+
+    def test_merge_and_add(self):
+        a = KmerArrayResult(2, codes_of("AA", "GT"), np.array([1, 2]))
+        b = KmerArrayResult(2, codes_of("AC", "GT"), np.array([3, 4]))
+        merged = a + b
+        assert merged.counts == {"AA": 1, "AC": 3, "GT": 6}
+        assert sum([a, b, a]).counts == {"AA": 2, "AC": 3, "GT": 8}
+        plain = KmerResult(k=2, counts={"TT": 1, "AA": 1})
+        assert (plain + a).counts == {"AA": 2, "GT": 2, "TT": 1}
+        assert a.merge(b, plain) == merged + plain
+
+    def test_merge_keeps_rna_with_empty(self):
+        rna = KmerArrayResult.from_result(
+            KmerResult(k=2, counts={"GU": 1, "AC": 2})
+        )
+        empty = KmerArrayResult.from_result(KmerResult(k=2, counts={}))
+        assert list((rna + empty).keys()) == ["AC", "GU"]
+        assert list((empty + rna).keys()) == ["AC", "GU"]
+
+    def test_equal_to_plain_result(self):
+        plain = KmerResult(k=2, counts={"GT": 3, "AC": 1})
+        r = KmerArrayResult.from_result(plain)
+        assert r == plain and plain == r
+        assert r != KmerResult(k=2, counts={"GT": 3, "AC": 2})
+        assert KmerResult(k=3, counts={}) != KmerArrayResult.from_result(
+            KmerResult(k=2, counts={})
+        )
+
+    def test_merge_mismatch(self):
+        a = KmerArrayResult(2, codes_of("AA"), np.array([1]))
+        with pytest.raises(ValueError):
+            a + KmerArrayResult(3, codes_of("AAA"), np.array([1]))
+        b = KmerArrayResult(
+            2, codes_of("AA"), np.array([1]), metadata={"canonical": True}
+        )
+        c = KmerArrayResult(
+            2, codes_of("AA"), np.array([1]), metadata={"canonical": False}
+        )
+        with pytest.raises(ValueError):
+            b + c
+
+    def test_top(self):
+        r = KmerArrayResult(
+            2, codes_of("AA", "AC", "AG", "AT"), np.array([3, 9, 3, 1])
+        )
+        assert r.top(2) == [("AC", 9), ("AA", 3)]
+        assert r.top() == [("AC", 9), ("AA", 3), ("AG", 3), ("AT", 1)]
+        assert r.top(0) == []
+
+    def test_to_numpy_and_dataframe(self):
+        r = KmerArrayResult(2, codes_of("AA", "GT"), np.array([1, 2]))
+        codes, counts = r.to_numpy()
+        assert codes is r.codes and counts is r.code_counts
+        df = r.to_dataframe()
+        assert df["kmer"].tolist() == ["AA", "GT"]
+        assert df["count"].tolist() == [1, 2]
+        raw = r.to_dataframe(decode=False)
+        assert raw["code"].tolist() == r.codes.tolist()
+
+    def test_to_csv_matches_kmer_result(self, tmp_path):
+        result = KmerResult(k=2, counts={"AC": 2, "GT": 5}, seq_id="s1")
+        result.to_csv(tmp_path / "a.tsv")
+        result.to_array_result().to_csv(tmp_path / "b.tsv")
+        assert (tmp_path / "a.tsv").read_bytes() == (
+            (tmp_path / "b.tsv").read_bytes()
+        )
+
+    def test_repr_and_str(self):
+        r = KmerArrayResult(2, codes_of("AA"), np.array([4]), seq_id="s")
+        assert "KmerArrayResult" in repr(r) and "n_kmers=1" in repr(r)
+        assert str(r) == "{'AA': 4}"
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            KmerArrayResult(0, codes_of(), np.array([]))
+        with pytest.raises(TypeError):
+            KmerArrayResult(2, [0], np.array([1]))
+        with pytest.raises(ValueError):
+            KmerArrayResult(2, codes_of("AA"), np.array([1, 2]))
+        with pytest.raises(ValueError):
+            KmerArrayResult(1, codes_of("TT"), np.array([1]))
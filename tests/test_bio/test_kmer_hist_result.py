@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from omibio.bio import KmerHistResult, AnalysisResult
+
+
+class TestKmerHistResult:
+
+    def make(self):
+        return KmerHistResult(
+            k=3, histogram=np.array([0, 5, 0, 2, 1]), peak=3,
+            genome_size=10, seq_id="s"
+        )
+
+    def test_init(self):
+        r = self.make()
+        assert isinstance(r, AnalysisResult)
+        assert r.max_count == 4
+        assert r.distinct == 8
+        assert r.total == 5 + 6 + 4
+        assert r[3] == 2
+        assert list(r) == [0, 5, 0, 2, 1]
+        assert len(r) == 5
+
+    def test_empty(self):
+        r = KmerHistResult()
+        assert r.distinct == 0
+        assert r.peak is None
+
+    def test_items_and_str(self):
+        r = self.make()
+        assert list(r.items()) == [(1, 5), (3, 2), (4, 1)]
+        assert str(r) == "{1: 5, 3: 2, 4: 1}"
+        assert "peak=3" in repr(r)
+
+    def test_to_csv(self, tmp_path):
+        path = tmp_path / "hist.tsv"
+        self.make().to_csv(path)
+        lines = path.read_text().splitlines()
+        assert lines == ["abundance\tcount", "1\t5", "3\t2", "4\t1"]
+
+    def test_eq(self):
+        assert self.make() == self.make()
+        other = self.make()
+        other.histogram = np.array([0, 5, 0, 2, 2])
+        assert self.make() != other
+
+    def test_info(self, capsys):
+        self.make().info()
+        out = capsys.readouterr().out
+        assert "Genome size: 10" in out
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            KmerHistResult(histogram=[0, 1])
+        with pytest.raises(TypeError):
+            KmerHistResult(k="3")
@@ -67,6 +67,17 @@ class TestKmerResult:
         actual_lines = {line.strip() for line in lines[1:]}
         assert actual_lines == expected_lines
 
+    def test_top(self):
+        r = KmerResult(counts={"AA": 2, "AT": 5, "AC": 2}, k=2)
+        assert r.top(2) == [("AT", 5), ("AA", 2)]
+        assert r.top() == [("AT", 5), ("AA", 2), ("AC", 2)]
+
+    def test_to_dataframe(self):
+        r = KmerResult(counts={"AA": 2, "AT": 5}, k=2)
+        df = r.to_dataframe()
+        assert df["kmer"].tolist() == ["AA", "AT"]
+        assert df["count"].tolist() == [2, 5]
+
     def test_info_prints_expected(self, capsys):
         obj = KmerResult(
             counts={"AA": 5, "AC": 3, "AG": 2},
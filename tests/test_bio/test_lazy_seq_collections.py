@@ -0,0 +1,92 @@
+import pytest
+from pathlib import Path
+from omibio.bio import LazySeqCollections, SeqCollections, SeqEntry
+from omibio.io import read_fasta
+from omibio.sequence import Sequence, Polypeptide, clean
+from omibio.analysis import find_orfs, kmer, sliding_gc
+
+DATA_DIR = Path(__file__).parents[2] / "examples" / "data"
+
+
+class TestLazySeqCollections:
+    def copy_example(self, tmp_path, name="example_long_seqs.fasta"):
+        p = tmp_path / name
+        p.write_bytes((DATA_DIR / name).read_bytes())
+        return p
+
+    def test_matches_read_fasta(self, tmp_path):
+        p = self.copy_example(tmp_path)
+        eager = read_fasta(p)
+        with LazySeqCollections(p) as lazy:
+            assert len(lazy) == len(eager)
+            assert lazy.seq_ids() == eager.seq_ids()
+            assert lazy.source == str(p)
+            for seq_id, entry in lazy.items():
+                assert isinstance(entry, SeqEntry)
+                assert entry.seq == eager[seq_id]
+                assert lazy.seq_len(seq_id) == len(eager[seq_id])
+            assert lazy.seq_dict() == eager.seq_dict()
+
+    def test_analysis_accepts_items(self, tmp_path):
+        p = self.copy_example(tmp_path)
+        eager = read_fasta(p)
+        with LazySeqCollections(p) as lazy:
+            seq_id = lazy.seq_ids()[0]
+            assert find_orfs(lazy[seq_id]) == find_orfs(eager[seq_id])
+            assert kmer(lazy[seq_id], 3) == kmer(eager[seq_id], 3)
+            assert (
+                sliding_gc(lazy[seq_id]) == sliding_gc(eager[seq_id])
+            )
+
+    def test_lru_cache(self, tmp_path):
+        p = tmp_path / "a.fasta"
+        p.write_text(">a\nACGT\n>b\nGGCC\n>c\nTTAA\n")
+        with LazySeqCollections(p, cache_size=2) as lazy:
+            a = lazy["a"]
+            assert lazy["a"] is a
+            lazy["b"]
+            lazy["a"]
+            lazy["c"]
+            assert list(lazy._cache) == ["a", "c"]
+            lazy.clear_cache()
+            assert lazy["a"] is not a
+            assert lazy["a"] == Sequence("ACGT")
+
+    def test_no_cache(self, tmp_path):
+        p = tmp_path / "a.fasta"
+        p.write_text(">a\nACGT\n")
+        with LazySeqCollections(p, cache_size=0) as lazy:
+            assert lazy["a"] == Sequence("ACGT")
+            assert not lazy._cache
+
+    def test_fetch_and_contains(self, tmp_path):
+        p = tmp_path / "a.fasta"
+        p.write_text(">a desc\nACG\nTAC\n")
+        with LazySeqCollections(p) as lazy:
+            assert "a" in lazy and "b" not in lazy
+            assert lazy.fetch("a", 2, 5) == Sequence("GTA")
+            assert lazy.get_entry("a").seq_id == "a"
+            with pytest.raises(KeyError):
+                lazy["b"]
+
+    def test_faa(self, tmp_path):
+        p = tmp_path / "a.faa"
+        p.write_text(">p\nMKV\n")
+        with LazySeqCollections(p) as lazy:
+            assert lazy.get_seq("p") == Polypeptide("MKV")
+
+    def test_clean(self, tmp_path):
+        p = tmp_path / "a.fasta"
+        p.write_text(">a\nACGTACGTACGT\n>b\nAC\n")
+        with LazySeqCollections(p) as lazy:
+            cleaned = clean(lazy)
+        assert isinstance(cleaned, SeqCollections)
+        assert cleaned.seq_ids() == ["a"]
+
+    def test_invalid_args(self, tmp_path):
+        p = tmp_path / "a.fasta"
+        p.write_text(">a\nACGT\n")
+        with pytest.raises(TypeError):
+            LazySeqCollections(p, cache_size="1")
+        with pytest.raises(ValueError):
+            LazySeqCollections(p, cache_size=-1)
@@ -0,0 +1,35 @@
+from click.testing import CliRunner
+from omibio.cli import cli
+
+
+def run_spectrum(tmp_path, *args):
+    path = tmp_path / "a.fa"
+    path.write_text(">a\nACGTACGTTT\n")
+    return CliRunner().invoke(cli, ["kmer", "spectrum", str(path), *args])
+
+
+class TestKmerSpectrumCli:
+
+    def test_vector(self, tmp_path):
+        result = run_spectrum(tmp_path, "--ks", "1-2", "-v")
+        assert result.exit_code == 0, result.output
+        header, row = result.output.splitlines()
+        assert header.split("\t")[:3] == ["seq_id", "A", "C"]
+        assert len(row.split("\t")) == 1 + 4 + 16
+
+    def test_vector_rejects_large_k(self, tmp_path):
+        result = run_spectrum(tmp_path, "--ks", "13", "-v")
+        assert result.exit_code == 2
+        assert "at most 12 with --vector" in result.output
+        assert result.exception is None or isinstance(
+            result.exception, SystemExit
+        )
+
+    def test_bad_ks(self, tmp_path):
+        result = run_spectrum(tmp_path, "--ks", "8-1")
+        assert result.exit_code == 2
+        assert "range '8-1' is empty" in result.output
+        result = run_spectrum(tmp_path, "--ks", "0-2")
+        assert "k must be positive" in result.output
+        result = run_spectrum(tmp_path, "--ks", "a")
+        assert "expected a list" in result.output
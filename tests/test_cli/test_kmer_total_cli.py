@@ -0,0 +1,36 @@
+from click.testing import CliRunner
+from omibio.cli import cli
+
+
+def run_total(path, *args):
+    result = CliRunner().invoke(cli, ["kmer", "total", str(path), *args])
+    assert result.exit_code == 0, result.output
+    return sorted(result.output.splitlines())
+
+
+class TestKmerTotalCli:
+
+    def test_partitioned_matches_in_memory_on_rna(self, tmp_path):
+        path = tmp_path / "rna.fa"
+        path.write_text(">a\nACGUACGU\n>b\nGGCAUUACG\n")
+        in_memory = run_total(path, "-k", "3")
+        partitioned = run_total(path, "-k", "3", "--max-memory", "1")
+        assert partitioned == in_memory
+        assert "total\t3\tCGU\t2" in partitioned
+
+    def test_partitioned_skips_n_windows(self, tmp_path):
+        path = tmp_path / "rna.fa"
+        path.write_text(">a\nACGUNACGU\n")
+        rows = run_total(path, "-k", "3", "--max-memory", "1")
+        assert rows[1:] == ["total\t3\tACG\t2", "total\t3\tCGU\t2"]
+
+    def test_approx_rejects_max_memory(self, tmp_path):
+        path = tmp_path / "a.fa"
+        path.write_text(">a\nACGTACGT\n")
+        for extra in (["--max-memory", "1"], ["--tmp-dir", str(tmp_path)]):
+            result = CliRunner().invoke(
+                cli, ["kmer", "total", str(path), "-k", "3", "--approx",
+                      *extra]
+            )
+            assert result.exit_code == 2
+            assert "--approx cannot be combined" in result.output
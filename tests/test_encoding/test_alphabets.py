@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from omibio.encoding import (
+    INVALID, ALPHABETS, encode_table, decode_table, complement_table
+)
+
+
+class TestEncodeTable:
+
+    def test_nt_codes(self):
+        table = encode_table("nt")
+        assert [table[ord(c)] for c in "ACGTU"] == [0, 1, 2, 3, 3]
+        assert table[ord("a")] == table[ord("A")]
+        assert table[ord("N")] == 4
+        assert table[ord("-")] == 15
+        assert table[ord("Z")] == INVALID
+
+    def test_2bit_codes(self):
+        table = encode_table("2bit")
+        assert [table[ord(c)] for c in "acgtu"] == [0, 1, 2, 3, 3]
+        assert table[ord("N")] == INVALID
+
+    def test_iupac4_bitmask(self):
+        table = encode_table("iupac4")
+        assert table[ord("R")] == table[ord("A")] | table[ord("G")]
+        assert table[ord("N")] == 15
+        assert table[ord("-")] == 0
+
+    def test_protein_codes(self):
+        table = encode_table("protein")
+        assert table[ord("A")] == 0
+        assert table[ord("*")] == 20
+        assert table[ord("U")] == INVALID
+
+    def test_cached_read_only(self):
+        assert encode_table("nt") is encode_table("nt")
+        with pytest.raises(ValueError):
+            encode_table("nt")[0] = 1
+
+    def test_unknown_alphabet(self):
+        with pytest.raises(ValueError):
+            encode_table("dna")
+
+
+class TestDecodeTable:
+
+    @pytest.mark.parametrize("alphabet", ALPHABETS)
+    def test_round_trip(self, alphabet):
+        enc, dec = encode_table(alphabet), decode_table(alphabet)
+        codes = np.flatnonzero(enc != INVALID)
+        assert np.array_equal(enc[dec[enc[codes]]], enc[codes])
+
+    def test_rna(self):
+        assert decode_table("nt", rna=True)[3] == ord("U")
+        assert decode_table("nt")[3] == ord("T")
+
+
+class TestComplementTable:
+
+    def test_2bit(self):
+        assert complement_table("2bit")[:4].tolist() == [3, 2, 1, 0]
+
+    def test_nt_involution(self):
+        table = complement_table("nt")
+        assert np.array_equal(table[table[:16]], np.arange(16))
+        nt = encode_table("nt")
+        assert table[nt[ord("R")]] == nt[ord("Y")]
+
+    def test_iupac4(self):
+        table, enc = complement_table("iupac4"), encode_table("iupac4")
+        assert table[enc[ord("B")]] == enc[ord("V")]
+
+    def test_protein(self):
+        with pytest.raises(ValueError):
+            complement_table("protein")
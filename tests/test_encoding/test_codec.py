@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from omibio.encoding import (
+    INVALID, as_bytes, encode, decode, complement, reverse_complement
+)
+from omibio.sequence import Sequence, Polypeptide
+
+
+class TestEncode:
+
+    def test_str_and_sequence(self):
+        assert encode("ACGTn").tolist() == [0, 1, 2, 3, 4]
+        seq = Sequence("AUGC")
+        assert encode(seq).tolist() == [0, 3, 2, 1]
+        assert encode(seq.subseq(1, 3, view=True)).tolist() == [3, 2]
+
+    def test_bytes(self):
+        assert encode(b"ACGT", "2bit").tolist() == [0, 1, 2, 3]
+        assert as_bytes(b"AC").tolist() == [65, 67]
+
+    def test_invalid(self):
+        assert encode("AXé", "2bit").tolist() == [0, INVALID, INVALID]
+        with pytest.raises(ValueError, match="X"):
+            encode("AXG", "2bit", strict=True)
+
+    def test_protein(self):
+        assert decode(encode(Polypeptide("MKV"), "protein"),
+                      "protein") == "MKV"
+
+    def test_type_error(self):
+        with pytest.raises(TypeError):
+            encode(123)
+        with pytest.raises(TypeError):
+            decode([0, 1])
+
+
+class TestDecode:
+
+    def test_round_trip(self):
+        seq = "ACGTNRYSWKMBDHV-"
+        assert decode(encode(seq)) == seq
+        assert decode(encode(seq, "iupac4"), "iupac4") == seq
+
+    def test_rna(self):
+        assert decode(encode("ACGU"), rna=True) == "ACGU"
+        assert decode(np.array([0, 3], dtype=np.int64)) == "AT"
+
+
+class TestComplement:
+
+    def test_matches_sequence(self):
+        seq = Sequence("ATGCRYKMBVDHSWN")
+        codes = encode(seq)
+        assert decode(complement(codes)) == seq.complement().sequence
+        assert decode(reverse_complement(codes)) == (
+            seq.reverse_complement().sequence
+        )
@@ -0,0 +1,94 @@
+import pytest
+import numpy as np
+from omibio.encoding import (
+    encode, kmer_codes, iter_kmer_codes, count_codes, decode_kmers,
+    DENSE_MAX_K
+)
+
+
+class TestKmerCodes:
+
+    def test_codes(self):
+        kcodes, valid = kmer_codes(encode("ACGT", "2bit"), 2)
+        assert kcodes.tolist() == [0b0001, 0b0110, 0b1011]
+        assert valid.all()
+
+    def test_invalid_windows(self):
+        _, valid = kmer_codes(encode("ACNGTA", "2bit"), 2)
+        assert valid.tolist() == [True, False, False, True, True]
+
+    def test_short(self):
+        kcodes, valid = kmer_codes(encode("AC", "2bit"), 3)
+        assert len(kcodes) == len(valid) == 0
+
+    def test_invalid_k(self):
+        with pytest.raises(ValueError):
+            kmer_codes(encode("ACGT", "2bit"), 33)
+        with pytest.raises(TypeError):
+            kmer_codes(encode("ACGT", "2bit"), "2")
+
+
+class TestCountCodes:
+
+    @pytest.mark.parametrize("k", [3, 6, DENSE_MAX_K, DENSE_MAX_K + 1])
+    def test_dense_and_sparse_agree(self, k):
+        rng = np.random.default_rng(0)
+        codes = rng.integers(0, 4, 500).astype(np.uint8)
+        kcodes, _ = kmer_codes(codes, k)
+        uniq, counts, first = count_codes(kcodes, k, first_index=True)
+        ref_uniq, ref_first, ref_counts = np.unique(
+            kcodes, return_index=True, return_counts=True
+        )
+        assert np.array_equal(uniq, ref_uniq)
+        assert np.array_equal(counts, ref_counts)
+        assert np.array_equal(first, ref_first)
+
+    def test_short_input_stays_small(self):
+        import tracemalloc
+        codes = np.random.default_rng(0).integers(0, 4, 104)
+        kcodes, _ = kmer_codes(codes.astype(np.uint8), DENSE_MAX_K)
+        tracemalloc.start()
+        try:
+            count_codes(kcodes, DENSE_MAX_K, first_index=True)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # A dense 4**12 table would take over 100 MB.
+        assert peak < 1 << 20
+
+
+class TestDecodeKmers:
+
+    def test_round_trip(self):
+        kcodes, _ = kmer_codes(encode("ACGTTGCA", "2bit"), 4)
+        assert decode_kmers(kcodes, 4) == [
+            "ACGT", "CGTT", "GTTG", "TTGC", "TGCA"
+        ]
+        assert decode_kmers(kcodes[:1], 4, rna=True) == ["ACGU"]
+        assert decode_kmers(np.empty(0, dtype=np.uint64), 4) == []
+
+
+class TestCanonicalCodes:
+
+    def test_min_of_both_strands(self):
+        codes = encode("AACGTTTG", "2bit")
+        kcodes, _ = kmer_codes(codes, 3, canonical=True)
+        names = decode_kmers(kcodes, 3)
+        assert names == ["AAC", "ACG", "ACG", "AAC", "AAA", "CAA"]
+
+
+class TestIterKmerCodes:
+
+    @pytest.mark.parametrize("canonical", [False, True])
+    def test_matches_kmer_codes(self, canonical):
+        codes = encode("ACGTNACGGTTAGCANTT", "2bit")
+        got = list(iter_kmer_codes(codes, [5, 1, 32, 3, 3], canonical))
+        assert [k for k, _, _ in got] == [1, 3, 5, 32]
+        for k, kcodes, valid in got:
+            expected, expected_valid = kmer_codes(codes, k, canonical)
+            assert np.array_equal(valid, expected_valid)
+            assert np.array_equal(kcodes[valid], expected[valid])
+
+    def test_invalid_k(self):
+        with pytest.raises(ValueError):
+            list(iter_kmer_codes(encode("ACGT", "2bit"), [2, 33]))
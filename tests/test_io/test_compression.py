@@ -0,0 +1,131 @@
+import pytest
+import gzip
+from omibio.io import (
+    read, read_fasta, read_fasta_iter, read_fastq_iter, read_fastq_batches
+)
+from omibio.io.compression import (
+    open_source, split_compression_suffix, ThreadedGzipReader,
+    ParallelGzipWriter
+)
+
+FASTA = ">a\nACGT\nAC\n>b\nGGCC\n"
+FASTQ = "@r1\nACGT\n+\nIIII\n@r2\nGG\n+\n!!\n"
+
+
+class TestCompression:
+    def write_gz(self, tmp_path, name, text, members=1):
+        p = tmp_path / name
+        data = text.encode()
+        step = -(-len(data) // members)
+        with open(p, "wb") as f:
+            # BGZF is a series of independent gzip members.
+            for i in range(0, len(data), step):
+                f.write(gzip.compress(data[i: i+step]))
+        return p
+
+    def test_split_compression_suffix(self):
+        assert split_compression_suffix("a.fastq.gz") == (".fastq", True)
+        assert split_compression_suffix("a.FA.BGZ") == (".fa", True)
+        assert split_compression_suffix("a.fasta") == (".fasta", False)
+        assert split_compression_suffix("a.gz") == ("", True)
+
+    def test_open_source_plain(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text(FASTA)
+        with open_source(p) as f:
+            assert f.read() == FASTA
+        with open_source(p, "rb") as f:
+            assert f.read() == FASTA.encode()
+
+    @pytest.mark.parametrize("threaded", [True, False])
+    def test_open_source_gzip(self, tmp_path, threaded):
+        p = self.write_gz(tmp_path, "a.fa.gz", FASTA * 50, members=7)
+        with open_source(p, threaded=threaded) as f:
+            assert f.read() == FASTA * 50
+        with open_source(p, "rb", threaded=threaded) as f:
+            assert f.read() == (FASTA * 50).encode()
+
+    def test_open_source_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_source(tmp_path / "a.fa", "w")
+
+    def test_threaded_reader_small_chunks(self, tmp_path):
+        p = self.write_gz(tmp_path, "a.fa.gz", FASTA * 20, members=3)
+        reader = ThreadedGzipReader(p, chunk_size=5, max_chunks=2)
+        buf = bytearray(3)
+        data = b""
+        while n := reader.readinto(buf):
+            data += buf[:n]
+        assert data == (FASTA * 20).encode()
+        assert reader.readinto(buf) == 0
+        reader.close()
+        assert reader.closed
+
+    def test_threaded_reader_close_early(self, tmp_path):
+        p = self.write_gz(tmp_path, "a.fa.gz", FASTA * 1000)
+        reader = ThreadedGzipReader(p, chunk_size=16, max_chunks=1)
+        reader.readinto(bytearray(4))
+        reader.close()
+        assert not reader._thread.is_alive()
+
+    def test_threaded_reader_corrupt(self, tmp_path):
+        p = tmp_path / "a.fa.gz"
+        p.write_bytes(gzip.compress(FASTA.encode())[:-8])
+        with pytest.raises(EOFError):
+            with open_source(p) as f:
+                f.read()
+
+    @pytest.mark.parametrize("engine", ["python", "fast"])
+    def test_read_fasta_gz(self, tmp_path, engine):
+        p = self.write_gz(tmp_path, "a.fasta.gz", FASTA, members=2)
+        res = list(read_fasta_iter(p, engine=engine))
+        assert [(e.seq_id, str(e.seq)) for e in res] == [
+            ("a", "ACGTAC"), ("b", "GGCC")
+        ]
+        assert len(read_fasta(p, engine=engine)) == 2
+
+    def test_read_faa_gz(self, tmp_path):
+        from omibio.sequence import Polypeptide
+        p = self.write_gz(tmp_path, "a.faa.bgz", ">p\nMKW\n")
+        res = list(read_fasta_iter(p))
+        assert isinstance(res[0].seq, Polypeptide)
+
+    def test_read_fastq_gz(self, tmp_path):
+        p = self.write_gz(tmp_path, "a.fastq.gz", FASTQ, members=3)
+        res = list(read_fastq_iter(p))
+        assert [(e.seq_id, e.qual) for e in res] == [
+            ("r1", "IIII"), ("r2", "!!")
+        ]
+        batch, = read_fastq_batches(p)
+        assert batch.ids == ["r1", "r2"]
+
+    def test_read_gz(self, tmp_path):
+        p = self.write_gz(tmp_path, "a.fq.gz", FASTQ)
+        assert read(p).seq_ids() == ["r1", "r2"]
+        p = self.write_gz(tmp_path, "a.fa.gz", FASTA)
+        assert read(p).seq_ids() == ["a", "b"]
+
+    def test_invalid_compressed_suffix(self, tmp_path):
+        from omibio.io.read_fasta import FastaFormatError
+        p = self.write_gz(tmp_path, "a.txt.gz", FASTA)
+        with pytest.raises(FastaFormatError):
+            list(read_fasta_iter(p))
+
+    @pytest.mark.parametrize("threads", [1, 4])
+    def test_parallel_gzip_writer(self, tmp_path, threads):
+        p = tmp_path / "a.fa.gz"
+        data = (FASTA * 100).encode()
+        with ParallelGzipWriter(p, block_size=37, threads=threads) as f:
+            for i in range(0, len(data), 50):
+                f.write(data[i: i + 50])
+        assert gzip.decompress(p.read_bytes()) == data
+        with open_source(p, "rb") as f:
+            assert f.read() == data
+        assert f.closed
+
+    def test_parallel_gzip_writer_closed(self, tmp_path):
+        f = ParallelGzipWriter(tmp_path / "a.gz")
+        f.close()
+        f.close()
+        with pytest.raises(ValueError):
+            f.write(b"x")
@@ -0,0 +1,155 @@
+import pytest
+import os
+from pathlib import Path
+from omibio.io import (
+    FastaIndex, FaiRecord, build_fai, read_fai, read_fasta
+)
+from omibio.io.read_fasta import FastaFormatError
+from omibio.sequence import Sequence, Polypeptide
+
+DATA_DIR = Path(__file__).parents[2] / "examples" / "data"
+
+FASTA = (
+    ">seq1 first record\n"
+    "ACGTACGTAC\n"
+    "GTACGTACGT\n"
+    "ACG\n"
+    ">seq2\n"
+    "ttttgggg\n"
+    "cc\n"
+)
+
+
+class TestFastaIndex:
+    def write(self, tmp_path, text, name="a.fasta"):
+        p = tmp_path / name
+        p.write_bytes(text.encode())
+        return p
+
+    def test_build_fai(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        records = build_fai(p)
+        assert records == [
+            FaiRecord("seq1", 23, 19, 10, 11),
+            FaiRecord("seq2", 10, 51, 8, 9),
+        ]
+        fai = Path(str(p) + ".fai")
+        assert fai.read_text() == "seq1\t23\t19\t10\t11\nseq2\t10\t51\t8\t9\n"
+        assert read_fai(fai) == records
+
+    def test_build_fai_no_write(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        build_fai(p, write=False)
+        assert not Path(str(p) + ".fai").exists()
+
+    def test_crlf(self, tmp_path):
+        p = self.write(tmp_path, FASTA.replace("\n", "\r\n"))
+        records = build_fai(p, write=False)
+        assert records[0] == FaiRecord("seq1", 23, 20, 10, 12)
+        with FastaIndex(p) as index:
+            assert index.fetch_str("seq1", 8, 22) == "ACGTACGTACGTAC"
+
+    def test_fetch(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        seq1 = "ACGTACGTACGTACGTACGTACG"
+        with FastaIndex(p) as index:
+            assert len(index) == 2
+            assert index.seq_ids() == ["seq1", "seq2"]
+            assert index.length("seq2") == 10
+            for start in range(len(seq1)):
+                for end in range(start, len(seq1) + 1):
+                    assert index.fetch_str("seq1", start, end) == (
+                        seq1[start: end]
+                    )
+            assert index.fetch("seq2") == Sequence("TTTTGGGGCC")
+            assert index.fetch("seq2", 6) == Sequence("GGCC")
+            assert index.fetch("seq2", 5, 100) == Sequence("GGGCC")
+            assert index["seq1"] == Sequence(seq1)
+            assert "seq1" in index and "seq3" not in index
+
+    def test_fetch_mmap(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        with FastaIndex(p, use_mmap=True) as index:
+            assert index.fetch_str("seq1", 9, 12) == "CGT"
+            assert index.fetch_str("seq2", 0, 10) == "TTTTGGGGCC"
+
+    def test_fetch_invalid(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        with FastaIndex(p) as index:
+            with pytest.raises(KeyError):
+                index.fetch("seq3")
+            with pytest.raises(ValueError):
+                index.fetch("seq1", -1, 5)
+            with pytest.raises(ValueError):
+                index.fetch("seq1", 6, 5)
+            with pytest.raises(TypeError):
+                index.fetch("seq1", "1")
+            assert index.fetch_str("seq1", 5, 5) == ""
+
+    def test_faa(self, tmp_path):
+        p = self.write(tmp_path, ">p1\nMKV\nLA\n", name="a.faa")
+        with FastaIndex(p) as index:
+            assert index.fetch("p1") == Polypeptide("MKVLA")
+
+    def test_trailing_blank_lines(self, tmp_path):
+        p = self.write(tmp_path, ">a\nACG\nAC\n\n\n>b\nAA")
+        assert build_fai(p, write=False) == [
+            FaiRecord("a", 5, 3, 3, 4), FaiRecord("b", 2, 15, 2, 3)
+        ]
+
+    @pytest.mark.parametrize("text", [
+        ">a\nACG\nACGT\n",
+        ">a\nACGT\nAC\nAC\n",
+        ">a\nACGT\n\nACGT\n",
+        ">a\nAC\n>a\nAC\n",
+        ">\nACGT\n",
+        "ACGT\n>a\nAC\n",
+    ])
+    def test_invalid_fasta(self, tmp_path, text):
+        p = self.write(tmp_path, text)
+        with pytest.raises(FastaFormatError):
+            build_fai(p, write=False)
+
+    def test_invalid_path(self, tmp_path):
+        with pytest.raises(FastaFormatError):
+            build_fai(self.write(tmp_path, FASTA, name="a.fasta.gz"))
+        with pytest.raises(FastaFormatError):
+            build_fai(self.write(tmp_path, FASTA, name="a.txt"))
+        with pytest.raises(FileNotFoundError):
+            FastaIndex(tmp_path / "missing.fasta")
+
+    def test_loads_existing_fai(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        fai = Path(str(p) + ".fai")
+        fai.write_text("seq1\t3\t19\t10\t11\n")
+        os.utime(p, (0, 0))
+        with FastaIndex(p) as index:
+            assert index.seq_ids() == ["seq1"]
+            assert index.fetch_str("seq1") == "ACG"
+        with FastaIndex(p, rebuild=True) as index:
+            assert index.seq_ids() == ["seq1", "seq2"]
+
+    def test_custom_fai_path(self, tmp_path):
+        p = self.write(tmp_path, FASTA)
+        fai = tmp_path / "custom.fai"
+        with FastaIndex(p, fai_path=fai) as index:
+            assert index.fai_path == fai
+        assert read_fai(fai) == build_fai(p, write=False)
+
+    def test_read_fai_invalid(self, tmp_path):
+        fai = tmp_path / "a.fai"
+        fai.write_text("seq1\t3\t19\n")
+        with pytest.raises(FastaFormatError):
+            read_fai(fai)
+
+    @pytest.mark.parametrize(
+        "name", ["example_long_seqs.fasta", "example_short_seqs.fasta"]
+    )
+    def test_matches_read_fasta(self, tmp_path, name):
+        p = tmp_path / name
+        p.write_bytes((DATA_DIR / name).read_bytes())
+        seqs = read_fasta(p)
+        with FastaIndex(p) as index:
+            assert index.seq_ids() == seqs.seq_ids()
+            for seq_id in seqs.seq_ids():
+                assert str(index[seq_id]) == str(seqs[seq_id])
@@ -5,8 +5,12 @@ from omibio.io.read_fasta import (
     read_fasta,
     FastaFormatError,
 )
+from pathlib import Path
+import warnings
 import io
 
+DATA_DIR = Path(__file__).parents[2] / "examples" / "data"
+
 
 class TestReadFasta:
     def write(self, tmp_path, name, text):
@@ -174,3 +178,165 @@ class TestReadFasta:
 
         seqcollections = read_fasta(fh)
         assert seqcollections.source == "<stdin>"
+
+
+class TestReadFastaFastEngine:
+    CASES = [
+        "",
+        ">a\nATGC\n",
+        ">a\nATGC\n>b\nGG\n",
+        ">a\n>b\nAT\n",
+        ">\nATGC\n>a\nAT\n",
+        ">a\nATXG\n>b\nAT\n",
+        "# comment\n>a\nAT\n#x\nGC\n",
+        ">a # note\nac gt\nAC\t\n>b\nNNNN",
+        "AAA\n>a\nAC\n\n\n>\n\n>b\n",
+        ">a\nAC>GT\n  >c\nTT\n",
+        ">a\r\nAC\r\nGT\r\n>b\rAA\rCC",
+    ]
+
+    def collect(self, source, **kwargs):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                res = [
+                    (e.seq_id, str(e.seq), type(e.seq), e.source)
+                    for e in read_fasta_iter(source, **kwargs)
+                ]
+                err = None
+            except FastaFormatError as e:
+                res, err = None, str(e)
+        return res, err, [str(w.message) for w in caught]
+
+    def assert_same(self, source, **kwargs):
+        # Text handles are consumed by the first pass, so re-create them.
+        def fresh():
+            if isinstance(source, io.StringIO):
+                return io.StringIO(source.getvalue())
+            return source
+
+        expected = self.collect(fresh(), engine="python", **kwargs)
+        assert self.collect(fresh(), engine="fast", **kwargs) == expected
+
+    def test_example_files(self):
+        paths = sorted(DATA_DIR.glob("*.fa*"))
+        assert paths
+        for path in paths:
+            self.assert_same(path)
+            self.assert_same(path, warn=False, skip_invalid_seq=True)
+            self.assert_same(path, strict=True)
+
+    @pytest.mark.parametrize("text", CASES)
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"warn": False},
+            {"skip_invalid_seq": True},
+            {"strict": True},
+        ],
+    )
+    def test_same_as_python_engine(self, tmp_path, text, options):
+        p = tmp_path / "a.fa"
+        p.write_bytes(text.encode())
+        self.assert_same(p, **options)
+        self.assert_same(io.StringIO(text), **options)
+
+    def test_small_blocks(self, tmp_path, monkeypatch):
+        import importlib
+
+        read_fasta_module = importlib.import_module("omibio.io.read_fasta")
+        p = tmp_path / "a.fa"
+        p.write_text(">a\nACGT\nAC\n#c\n>b\nGGGG\nTT\n")
+        expected = self.collect(p)
+        monkeypatch.setattr(read_fasta_module, "_BLOCK_SIZE", 3)
+        assert self.collect(p, engine="fast") == expected
+
+    def test_read_fasta_engine(self, tmp_path):
+        p = self.write_fasta(tmp_path)
+        col = read_fasta(p, engine="fast")
+        assert col.seq_ids() == ["a", "b"]
+        assert str(col["b"]) == "GC"
+
+    def test_invalid_engine(self, tmp_path):
+        p = self.write_fasta(tmp_path)
+        with pytest.raises(ValueError):
+            list(read_fasta_iter(p, engine="rust"))
+
+    def write_fasta(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text(">a\nAT\n>b\ngc\n")
+        return p
+
+
+class TestReadFastaParallel:
+    @pytest.fixture(autouse=True)
+    def small_ranges(self, monkeypatch):
+        import importlib
+
+        read_fasta_module = importlib.import_module("omibio.io.read_fasta")
+        monkeypatch.setattr(read_fasta_module, "_MIN_RANGE_SIZE", 4)
+
+    collect = TestReadFastaFastEngine.collect
+
+    @pytest.mark.parametrize("text", TestReadFastaFastEngine.CASES)
+    @pytest.mark.parametrize(
+        "options", [{}, {"skip_invalid_seq": True}, {"strict": True}]
+    )
+    def test_same_as_serial(self, tmp_path, text, options):
+        p = tmp_path / "a.fa"
+        p.write_bytes(text.encode())
+        expected = self.collect(p, **options)
+        assert self.collect(p, workers=3, **options) == expected
+
+    def test_example_files(self):
+        for path in sorted(DATA_DIR.glob("*.fa*")):
+            expected = self.collect(path)
+            assert self.collect(path, workers=2) == expected
+
+    def test_unordered(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text("".join(f">s{i}\nACGT\nAC\n" for i in range(50)))
+        res = list(read_fasta_iter(p, workers=3, ordered=False))
+        assert sorted(e.seq_id for e in res) == sorted(
+            f"s{i}" for i in range(50)
+        )
+        col = read_fasta(p, workers=3)
+        assert col.seq_ids() == [f"s{i}" for i in range(50)]
+
+    def test_strict_line_number(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text("".join(f">s{i}\nACGT\n" for i in range(20)) + ">x\nAZ\n")
+        with pytest.raises(FastaFormatError, match="line 42"):
+            list(read_fasta_iter(p, strict=True, workers=3))
+
+    def test_duplicate_ids_across_ranges(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text(">a\nACGT\n" * 10)
+        with pytest.raises(ValueError, match="Duplicate"):
+            read_fasta(p, workers=3)
+
+    def test_single_range_inline(self, tmp_path, monkeypatch):
+        import importlib
+
+        read_fasta_module = importlib.import_module("omibio.io.read_fasta")
+        monkeypatch.setattr(read_fasta_module, "_MIN_RANGE_SIZE", 1 << 20)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("no process pool for a single range")
+
+        monkeypatch.setattr(read_fasta_module, "ProcessPoolExecutor", no_pool)
+        p = tmp_path / "a.fa"
+        p.write_text(">a\nACGT\n>b\nTT\n")
+        assert self.collect(p, workers=4) == self.collect(p)
+        empty = tmp_path / "empty.fa"
+        empty.write_text("")
+        assert list(read_fasta_iter(empty, workers=4)) == []
+
+    def test_invalid_workers(self, tmp_path):
+        p = tmp_path / "a.fa"
+        p.write_text(">a\nAT\n")
+        with pytest.raises(ValueError):
+            list(read_fasta_iter(p, workers=0))
+        with pytest.raises(TypeError):
+            list(read_fasta_iter(p, workers=2.0))
@@ -3,6 +3,7 @@ from omibio.bio import SeqEntry, SeqCollections
 from omibio.io.read_fastq import (
     read_fastq_iter,
     read_fastq,
+    read_fastq_batches,
     FastqFormatError,
 )
 import io
@@ -201,3 +202,88 @@ class TestReadFastq:
 
         seqcollections = read_fastq(fh)
         assert seqcollections.source == "<stdin>"
+
+
+class TestReadFastqBatches:
+    def write(self, tmp_path, name, text):
+        p = tmp_path / name
+        p.write_text(text)
+        return p
+
+    def test_batches(self, tmp_path):
+        p = self.write(
+            tmp_path,
+            "a.fastq",
+            "@a\nAT\n+\n!!\n\n@b\ngcc\n+\n###\n@c\nN\n+\nI\n",
+        )
+        batches = list(read_fastq_batches(p, batch_size=2))
+        assert [len(b) for b in batches] == [2, 1]
+        assert batches[0].ids == ["a", "b"]
+        assert batches[0].seqs.tobytes() == b"ATGCC"
+        assert batches[0].quals.tobytes() == b"!!###"
+        assert batches[0].offsets.tolist() == [0, 2, 5]
+        assert batches[1].get_seq(0) == "N"
+        assert batches[0].source == str(p)
+
+    def test_same_records_as_iter(self, tmp_path):
+        p = self.write(
+            tmp_path,
+            "a.fq",
+            "@a\nAT\n+\n!!\n@b\nATXG\n+\n!!!!\n"
+            "@c\nAT\nx\n!!\n@d\nATG\n+\n!!\n@e\nGC\n+\n##\n",
+        )
+        for skip in (False, True):
+            expected = [
+                (e.seq_id, str(e.seq), e.qual)
+                for e in read_fastq_iter(
+                    p, warn=False, skip_invalid_seq=skip
+                )
+            ]
+            res = [
+                (e.seq_id, str(e.seq), e.qual)
+                for batch in read_fastq_batches(
+                    p, batch_size=1, warn=False, skip_invalid_seq=skip
+                )
+                for e in batch
+            ]
+            assert res == expected
+
+    def test_checks(self, tmp_path):
+        p = self.write(tmp_path, "a.fastq", "@a\nAT\nx\n!!\n")
+        with pytest.raises(FastqFormatError):
+            list(read_fastq_batches(p, strict=True))
+        with pytest.warns(UserWarning, match="invalid '\\+' line"):
+            assert list(read_fastq_batches(p)) == []
+
+        p = self.write(tmp_path, "a.fastq", "@a\nATG\n+\n!!\n")
+        with pytest.raises(FastqFormatError):
+            list(read_fastq_batches(p, strict=True))
+        with pytest.warns(UserWarning, match="mismatch"):
+            assert list(read_fastq_batches(p)) == []
+
+        p = self.write(tmp_path, "a.fastq", "a\nAT\n+\n!!\n")
+        with pytest.raises(FastqFormatError):
+            list(read_fastq_batches(p))
+
+        p = self.write(tmp_path, "a.fastq", "@a\nAT\n+\n")
+        with pytest.raises(FastqFormatError):
+            list(read_fastq_batches(p))
+
+    def test_invalid_suffix(self, tmp_path):
+        p = self.write(tmp_path, "a.fa", "@a\nAT\n+\n!!\n")
+        with pytest.raises(FastqFormatError):
+            list(read_fastq_batches(p))
+
+    def test_invalid_batch_size(self, tmp_path):
+        p = self.write(tmp_path, "a.fastq", "@a\nAT\n+\n!!\n")
+        with pytest.raises(TypeError):
+            list(read_fastq_batches(p, batch_size="1"))
+        with pytest.raises(ValueError):
+            list(read_fastq_batches(p, batch_size=0))
+
+    def test_from_stringio(self):
+        fh = io.StringIO("@seq\nACTG\n+\nIIII")
+        batches = list(read_fastq_batches(fh))
+        assert len(batches) == 1
+        assert batches[0].source == "<stdin>"
+        assert batches[0].get_qual(0) == "IIII"
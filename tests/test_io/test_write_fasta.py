@@ -1,5 +1,5 @@
 import pytest
-from omibio.io.write_fasta import write_fasta
+from omibio.io.write_fasta import write_fasta, FastaWriter
 from omibio.bio import SeqCollections, SeqEntry
 from omibio.sequence import Sequence
 
@@ -107,3 +107,57 @@ class TestWriteFasta:
             ">test",
             "ACTG"
         ]
+
+
+class TestFastaWriter:
+    def test_matches_write_fasta(self, tmp_path):
+        seqs = {"s1": "A" * 130, "s2": "ATGC", "s3": "", "s4": "G" * 60}
+        expected = tmp_path / "expected.fasta"
+        write_fasta(file_name=expected, seqs=seqs)
+        out = tmp_path / "out.fasta"
+        with FastaWriter(out) as writer:
+            assert writer.write_many(seqs) == 4
+        assert out.read_text() == expected.read_text()
+
+    def test_generator_small_buffer(self, tmp_path):
+        out = tmp_path / "sub" / "out.fasta"
+        records = ((f"s{i}", "AC" * i) for i in range(1, 20))
+        with FastaWriter(out, line_len=7, buffer_size=10) as writer:
+            writer.write_many(records)
+            assert writer.count == 19
+        expected = write_fasta(
+            seqs={f"s{i}": "AC" * i for i in range(1, 20)}, line_len=7
+        )
+        assert out.read_text().splitlines() == expected
+
+    def test_entries_and_collections(self, tmp_path):
+        out = tmp_path / "out.fasta"
+        col = SeqCollections([SeqEntry(Sequence("ATGC"), seq_id="a")])
+        with FastaWriter(out) as writer:
+            writer.write(SeqEntry(Sequence("GG"), seq_id="b"))
+            writer.write_many(col)
+        assert out.read_text() == ">b\nGG\n>a\nATGC\n"
+
+    def test_stream_target(self):
+        import io
+
+        buf = io.StringIO()
+        with FastaWriter(buf, line_len=2) as writer:
+            writer.write(("x", "ACG"))
+        assert not buf.closed
+        assert buf.getvalue() == ">x\nAC\nG\n"
+
+    def test_invalid_input(self, tmp_path):
+        out = tmp_path / "out.fasta"
+        with pytest.raises(ValueError):
+            FastaWriter(out, line_len=0)
+        with pytest.raises(TypeError):
+            FastaWriter(out, buffer_size="1")
+        writer = FastaWriter(out)
+        with pytest.raises(TypeError):
+            writer.write("ACGT")
+        with pytest.raises(TypeError):
+            writer.write((1, "ACGT"))
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write(("a", "ACGT"))
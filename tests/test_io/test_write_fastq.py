@@ -1,6 +1,9 @@
 import pytest
 from omibio.bio import SeqEntry, SeqCollections
-from omibio.io.write_fastq import write_fastq
+from omibio.io.write_fastq import write_fastq, FastqWriter
+from omibio.io.read_fastq import read_fastq_iter, read_fastq_batches
+from omibio.bio import FastqBatch
+import gzip
 from omibio.sequence import Sequence
 
 
@@ -44,3 +47,76 @@ class TestWriteFastq:
         assert file_path.exists()
         content = file_path.read_text().splitlines()
         assert content == lines
+
+
+class TestFastqWriter:
+    make_entry = TestWriteFastq.make_entry
+
+    def entries(self, n=50):
+        return [
+            SeqEntry(
+                seq=Sequence("ACGT"[i % 4] * (i + 1)), seq_id=f"r{i}",
+                qual="I" * (i + 1)
+            )
+            for i in range(n)
+        ]
+
+    def expected_text(self, entries):
+        return "".join(
+            f"@{e.seq_id}\n{e.seq}\n+\n{e.qual}\n" for e in entries
+        )
+
+    def test_write_entries(self, tmp_path):
+        out = tmp_path / "sub" / "out.fastq"
+        entries = self.entries()
+        with FastqWriter(out, buffer_size=64) as writer:
+            assert writer.write_many(iter(entries)) == 50
+        assert out.read_text() == self.expected_text(entries)
+        assert [e.seq_id for e in read_fastq_iter(out)] == [
+            e.seq_id for e in entries
+        ]
+
+    def test_write_batches(self, tmp_path):
+        src = tmp_path / "in.fastq"
+        entries = self.entries()
+        src.write_text(self.expected_text(entries))
+        out = tmp_path / "out.fastq"
+        with FastqWriter(out) as writer:
+            writer.write_many(read_fastq_batches(src, batch_size=7))
+            assert writer.count == 50
+        assert out.read_text() == src.read_text()
+
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_write_gzip(self, tmp_path, threads):
+        out = tmp_path / "out.fastq.gz"
+        entries = self.entries(200)
+        batch = FastqBatch.from_entries(entries[100:])
+        with FastqWriter(out, buffer_size=100, threads=threads) as writer:
+            writer.write_many(entries[:100])
+            writer.write_batch(batch)
+        assert gzip.decompress(out.read_bytes()).decode() == (
+            self.expected_text(entries)
+        )
+        assert len(list(read_fastq_iter(out))) == 200
+
+    def test_stream_target(self):
+        import io
+
+        buf = io.StringIO()
+        with FastqWriter(buf) as writer:
+            writer.write(self.make_entry("AT", "a", "!!"))
+        assert not buf.closed
+        assert buf.getvalue() == "@a\nAT\n+\n!!\n"
+
+    def test_invalid_input(self, tmp_path):
+        with pytest.raises(ValueError):
+            FastqWriter(tmp_path / "a.fastq", buffer_size=0)
+        with FastqWriter(tmp_path / "a.fastq") as writer:
+            with pytest.raises(ValueError):
+                writer.write(self.make_entry(qual=None))
+            with pytest.raises(TypeError):
+                writer.write("ACGT")
+            with pytest.raises(TypeError):
+                writer.write_batch([])
+        with pytest.raises(ValueError):
+            writer.write(self.make_entry())
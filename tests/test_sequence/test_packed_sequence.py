@@ -0,0 +1,112 @@
+import pytest
+import random
+from omibio.sequence import Sequence, PackedSequence
+
+
+class TestPackedSequence:
+    def random_str(self, rng, n, alphabet="ACGTACGTACGTNNRY-"):
+        return "".join(rng.choices(alphabet, k=n))
+
+    def test_round_trip(self):
+        rng = random.Random(0)
+        for n in range(0, 40):
+            s = self.random_str(rng, n)
+            packed = PackedSequence(s)
+            assert len(packed) == n
+            assert str(packed) == s
+            assert packed == s
+            assert packed.to_sequence() == Sequence(s)
+
+    def test_matches_sequence(self):
+        rng = random.Random(1)
+        for n in [0, 1, 3, 4, 5, 17, 100]:
+            s = self.random_str(rng, n)
+            seq, packed = Sequence(s), PackedSequence(s)
+            assert packed.gc_content() == seq.gc_content()
+            assert packed.gc_content(percent=True) == (
+                seq.gc_content(percent=True)
+            )
+            assert packed.at_content() == seq.at_content()
+            assert str(packed.reverse_complement()) == str(
+                seq.reverse_complement()
+            )
+            assert str(packed.complement()) == str(seq.complement())
+            for base in "ACGTN-":
+                assert packed.count(base) == seq.count(base)
+
+    def test_slicing(self):
+        rng = random.Random(2)
+        s = self.random_str(rng, 60)
+        packed = PackedSequence(s)
+        for start in range(-5, 62, 3):
+            for end in range(start, 63, 4):
+                sub = packed[start: end]
+                assert isinstance(sub, PackedSequence)
+                assert str(sub) == s[start: end]
+        assert str(packed[::3]) == s[::3]
+        assert [packed[i] for i in range(len(s))] == list(s)
+        assert packed[-1] == s[-1]
+        assert str(packed.subseq(5, 9)) == s[5:9]
+        with pytest.raises(IndexError):
+            packed[60]
+        with pytest.raises(TypeError):
+            packed["1"]
+
+    def test_rna(self):
+        packed = PackedSequence("acgun")
+        assert packed.is_rna and packed.type == "RNA"
+        assert str(packed) == "ACGUN"
+        assert str(packed.reverse_complement()) == "NACGU"
+        assert PackedSequence(Sequence("ACGU")).is_rna
+
+    def test_empty_slice_in_exception_run(self):
+        packed = PackedSequence("Na-GgTNcYYNCGG-N")
+        assert packed[9:0].exceptions() == []
+        assert packed[9:0] == PackedSequence("")
+        assert packed[9:9] == PackedSequence("")
+
+    def test_at_content_matches_sequence(self):
+        for s in ("AUGC", "AUUNGC", "ATGC", "ATNNGC", "AUGT"):
+            packed = PackedSequence(s)
+            assert packed.at_content() == Sequence(s).at_content()
+
+    def test_complement_with_n_runs(self):
+        packed = PackedSequence("NNNACRRT")
+        for result in (packed.complement(), packed.reverse_complement()):
+            plain = PackedSequence(result.to_str())
+            assert result == plain
+            for base in "ACGTNY":
+                assert result.count(base) == plain.count(base)
+            assert result.at_content() == plain.at_content()
+        rc = PackedSequence("NNNAC").reverse_complement()
+        assert str(rc) == "GTNNN"
+        assert rc.count("T") == 1 and rc.count("A") == 0
+
+    def test_exceptions_and_codes(self):
+        packed = PackedSequence("ACNNNNGTRR")
+        assert packed.exceptions() == [(2, 4, "N"), (8, 2, "R")]
+        assert packed.codes().tolist() == [0, 1, 0, 0, 0, 0, 2, 3, 0, 0]
+        assert packed.codes(5, 8).tolist() == [0, 2, 3]
+        assert packed.mask().tolist() == [
+            True, True, False, False, False, False, True, True, False, False
+        ]
+        assert packed.mask(3, 7).tolist() == [False, False, False, True]
+
+    def test_compact(self):
+        s = "ACGT" * 1000 + "N" * 1000
+        packed = PackedSequence(s)
+        assert packed.packed.nbytes == 1250
+        assert packed.nbytes < len(s) // 3
+
+    def test_sequence_to_packed(self):
+        seq = Sequence("ACGTN")
+        assert seq.to_packed() == seq
+        assert PackedSequence.from_sequence(seq) == PackedSequence("ACGTN")
+
+    def test_invalid_input(self):
+        with pytest.raises(TypeError):
+            PackedSequence(123)
+        with pytest.raises(TypeError):
+            PackedSequence("ACGT", rna="no")
+        with pytest.raises(TypeError):
+            PackedSequence.from_sequence("ACGT")
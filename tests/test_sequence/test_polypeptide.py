@@ -147,3 +147,17 @@ class TestPolypeptide:
         for c in pp:
             chars.append(c)
         assert chars == list(seq_str)
+
+    def test_slots_and_trusted(self):
+        p = Polypeptide._trusted("MKV", strict=True)
+        assert not hasattr(p, "__dict__")
+        assert p == Polypeptide("MKV") and p.strict is True
+        assert (p + Polypeptide("AA", strict=True)).strict is True
+        assert p.subseq(1, 3) == "KV"
+        with pytest.raises(ValueError):
+            Polypeptide("MKB") + Polypeptide("AA", strict=True)
+
+    def test_encoded(self):
+        codes = Polypeptide("ACY").encoded()
+        assert codes.tolist() == [0, 1, 19]
+        assert not codes.flags.writeable
@@ -343,3 +343,109 @@ class TestSequence:
         s = Sequence("ACTG")
         s.sequence = None
         assert s.sequence == ""
+
+    # --------------------------
+    # trusted construction / slots
+    # --------------------------
+    def test_slots(self):
+        s = Sequence("ACTG")
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s.extra = 1
+
+    def test_trusted_constructor(self):
+        s = Sequence._trusted("ACGU")
+        assert s.is_rna is True and s.strict is False
+        assert s == Sequence("ACGU")
+        s = Sequence._trusted("ACGT", rna=False, strict=True)
+        assert s.strict is True and s.is_rna is False
+
+    def test_derived_keep_type_and_mode(self):
+        s = Sequence("ACGU", strict=True)
+        for derived in (
+            s.complement(), s.reverse_complement(), s.subseq(1, 3),
+            s * 2, s + Sequence("AA", rna=True, strict=True)
+        ):
+            assert derived.is_rna is True
+            assert derived.strict is True
+            assert derived == Sequence(str(derived), rna=True, strict=True)
+        dna = Sequence("ACGT", strict=True)
+        assert dna.transcribe().is_rna is True
+        assert dna.transcribe().reverse_transcribe() == dna
+
+    def test_add_mixed_strict_still_validates(self):
+        with pytest.raises(ValueError):
+            Sequence("ACGTX") + Sequence("AC", strict=True)
+
+    # --------------------------
+    # memoization
+    # --------------------------
+    def test_cache_disabled_by_default(self):
+        s = Sequence("ACGT")
+        assert not s.cache_enabled
+        s.gc_content()
+        assert s._cache is None
+
+    def test_cache_results(self):
+        s = Sequence("ATGGCCAAATAG")
+        s.enable_cache()
+        assert s.cache_enabled
+        assert s.gc_content() == Sequence("ATGGCCAAATAG").gc_content()
+        assert s.at_content(percent=True) == (
+            Sequence("ATGGCCAAATAG").at_content(percent=True)
+        )
+        assert ("count", "G") in s._cache
+        rc1, rc2 = s.reverse_complement(), s.reverse_complement()
+        assert rc1 == rc2 == "CTATTTGGCCAT"
+        assert rc1 is not rc2
+        rc1.sequence = "AAAA"
+        assert s.reverse_complement() == "CTATTTGGCCAT"
+        assert s.translate_nt(as_str=True) == "MAK"
+        assert s.translate_nt(frame=1, as_str=True) == "WPN"
+        assert s.translate_nt() == "MAK"
+        assert s.count("A") == 5 and s.count("AA") == 1
+
+    def test_cache_invalidated_by_setter(self):
+        s = Sequence("GGGG")
+        s.enable_cache()
+        assert s.gc_content() == 1.0
+        assert s.reverse_complement() == "CCCC"
+        s.sequence = "ATAT"
+        assert s.gc_content() == 0.0
+        assert s.reverse_complement() == "ATAT"
+        assert s.translate_nt(as_str=True) == "I"
+
+    def test_cache_max_len(self):
+        s = Sequence("ACGTACGT")
+        s.enable_cache(max_len=4)
+        s.reverse_complement()
+        s.translate_nt()
+        s.gc_content()
+        assert list(s._cache) == [("count", "G"), ("count", "C")]
+        s.enable_cache(max_len=None)
+        s.reverse_complement()
+        assert "rev_comp" in s._cache
+
+    def test_cache_clear_and_disable(self):
+        s = Sequence("ACGT")
+        s.enable_cache()
+        s.gc_content()
+        s.clear_cache()
+        assert s._cache == {}
+        s.disable_cache()
+        assert not s.cache_enabled
+        with pytest.raises(TypeError):
+            s.enable_cache(max_len="1")
+        with pytest.raises(ValueError):
+            s.enable_cache(max_len=-1)
+
+    def test_encoded(self):
+        s = Sequence("ACGUN")
+        codes = s.encoded()
+        assert codes.tolist() == [0, 1, 2, 3, 4]
+        assert not codes.flags.writeable
+        assert s.encoded("iupac4").tolist() == [1, 2, 4, 8, 15]
+        s.enable_cache()
+        assert s.encoded() is s.encoded()
+        s.sequence = "TT"
+        assert s.encoded("2bit").tolist() == [3, 3]
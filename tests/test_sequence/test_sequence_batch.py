@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from omibio.sequence import Sequence, SequenceBatch
+from omibio.sequence import complement, reverse_complement, transcribe
+from omibio.analysis import gc, at
+from omibio.bio import SeqCollections, SeqEntry
+
+
+SEQS = {
+    "s1": Sequence("ATGCGTACGTTAGC"),
+    "s2": Sequence(""),
+    "s3": Sequence("AUGCCGUA"),
+    "s4": Sequence("NNRYKMatgc"),
+}
+
+
+class TestSequenceBatch:
+
+    @pytest.fixture
+    def batch(self):
+        return SequenceBatch.from_sequences(SEQS.items())
+
+    def test_from_sequences(self, batch):
+        assert len(batch) == 4
+        assert batch.ids == list(SEQS)
+        assert batch.lengths().tolist() == [14, 0, 8, 10]
+        assert batch.offsets.tolist() == [0, 14, 14, 22, 32]
+        assert batch.rna.tolist() == [False, False, True, False]
+        assert batch.seq_strs() == [s.sequence for s in SEQS.values()]
+
+    def test_from_collection(self):
+        coll = SeqCollections(
+            [SeqEntry(seq, seq_id=k) for k, seq in SEQS.items()],
+            source="test"
+        )
+        batch = SequenceBatch.from_collection(coll)
+        assert batch.ids == list(SEQS)
+        assert batch.source == "test"
+        assert batch.to_collection().seq_dict() == coll.seq_dict()
+
+    def test_from_fasta(self, tmp_path):
+        path = tmp_path / "test.fasta"
+        path.write_text(">a\nACGT\nAC\n>b\nGGGG\n")
+        batch = SequenceBatch.from_fasta(path)
+        assert batch.ids == ["a", "b"]
+        assert batch.seq_strs() == ["ACGTAC", "GGGG"]
+        assert batch.source == str(path)
+
+    def test_gc_at_content(self, batch):
+        for i, seq in enumerate(SEQS.values()):
+            assert round(batch.gc_content()[i], 3) == seq.gc_content()
+            assert round(batch.at_content()[i], 3) == seq.at_content()
+        assert batch.gc_content(percent=True)[1] == "0.00%"
+
+    def test_complement(self, batch):
+        res = batch.complement()
+        assert res.seq_strs() == [
+            s.complement().sequence for s in SEQS.values()
+        ]
+        assert res.rna.tolist() == batch.rna.tolist()
+
+    def test_reverse_complement(self, batch):
+        res = batch.reverse_complement()
+        assert res.seq_strs() == [
+            s.reverse_complement().sequence for s in SEQS.values()
+        ]
+
+    def test_transcribe(self, batch):
+        for strand in ("+", "-"):
+            res = batch.transcribe(strand)
+            assert res.rna.all()
+            for i, seq in enumerate(SEQS.values()):
+                if seq.is_rna:
+                    assert res.get_seq(i) == seq.sequence
+                else:
+                    expected = seq.transcribe(strand).sequence
+                    assert res.get_seq(i) == expected
+        with pytest.raises(ValueError):
+            batch.transcribe("x")
+
+    def test_reverse_transcribe(self, batch):
+        res = batch.reverse_transcribe()
+        assert not res.rna.any()
+        assert res.get_seq(2) == "ATGCCGTA"
+
+    def test_accessors(self, batch):
+        assert batch[0] == SEQS["s1"]
+        assert batch[-2].is_rna
+        assert batch.get_entry(3).seq_id == "s4"
+        assert [str(s) for s in batch] == batch.seq_strs()
+        with pytest.raises(IndexError):
+            batch[4]
+
+    def test_empty(self):
+        batch = SequenceBatch.from_sequences([])
+        assert len(batch) == 0
+        assert batch.gc_content().shape == (0,)
+        assert len(batch.reverse_complement()) == 0
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            SequenceBatch.from_sequences([("a", 1)])
+        with pytest.raises(ValueError):
+            SequenceBatch(
+                ids=["a"], seqs=np.zeros(2, dtype=np.uint8),
+                offsets=np.array([0, 3]), rna=np.zeros(1, dtype=bool)
+            )
+
+    def test_function_dispatch(self, batch):
+        assert np.array_equal(gc(batch), batch.gc_content())
+        assert np.array_equal(at(batch), batch.at_content())
+        assert complement(batch, as_str=True) == (
+            batch.complement().seq_strs()
+        )
+        assert isinstance(reverse_complement(batch), SequenceBatch)
+        assert transcribe(batch, as_str=True)[0] == "AUGCGUACGUUAGC"
@@ -0,0 +1,61 @@
+import pytest
+from omibio.sequence import Sequence, SequenceBuilder
+from omibio.bio import SeqInterval
+
+
+class TestSequenceBuilder:
+    def test_build(self):
+        builder = SequenceBuilder()
+        builder.append(Sequence("ATG")).append("aaa")
+        builder += SeqInterval(0, 3, nt_seq="TAG")
+        builder += Sequence("CCCGGG").subseq(1, 4, view=True)
+        assert len(builder) == 12
+        seq = builder.build()
+        assert isinstance(seq, Sequence)
+        assert seq == "ATGAAATAGCCG"
+        assert seq.is_rna is False
+        assert builder.build() == seq
+
+    def test_same_as_add(self):
+        pieces = [Sequence("AC"), Sequence("GT"), Sequence("NN")]
+        expected = pieces[0] + pieces[1] + pieces[2]
+        assert SequenceBuilder(pieces).build() == expected
+
+    def test_rna_detection(self):
+        assert SequenceBuilder(["ACG", "U"]).build().is_rna is True
+        assert SequenceBuilder([Sequence("AAU")]).build().is_rna is True
+        assert SequenceBuilder(["AC"], rna=True).build().type == "RNA"
+
+    def test_strict_mixing(self):
+        builder = SequenceBuilder([Sequence("ACGT")], strict=True)
+        with pytest.raises(TypeError):
+            builder.append(Sequence("ACGU"))
+        with pytest.raises(TypeError):
+            builder.append("ACU")
+        with pytest.raises(ValueError):
+            SequenceBuilder(strict=True).append("UT")
+        with pytest.raises(TypeError):
+            SequenceBuilder([Sequence("AT")]).append(
+                Sequence("AU", strict=True)
+            )
+        assert SequenceBuilder(["AT", "AU"]).build() == "ATAU"
+
+    def test_strict_validation(self):
+        builder = SequenceBuilder(["ACGT", "XX"], strict=True)
+        with pytest.raises(ValueError):
+            builder.build()
+        seq = SequenceBuilder(["ACGT", "AA"], strict=True).build()
+        assert seq.strict is True
+
+    def test_clear_and_invalid(self):
+        builder = SequenceBuilder(["ACGT"])
+        builder.clear()
+        assert len(builder) == 0 and builder.build() == ""
+        with pytest.raises(TypeError):
+            builder.append(123)
+        with pytest.raises(ValueError):
+            builder.append(SeqInterval(0, 3))
+        with pytest.raises(TypeError):
+            SequenceBuilder(rna="yes")
+        with pytest.raises(TypeError):
+            SequenceBuilder(strict=1)
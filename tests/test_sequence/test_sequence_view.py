@@ -0,0 +1,99 @@
+import pytest
+import random
+from omibio.sequence import Sequence, SequenceView
+from omibio.bio import SeqInterval
+
+
+class TestSequenceView:
+    def test_subseq_view(self):
+        seq = Sequence("ATGCGTACGTTAGC")
+        view = seq.subseq(2, 10, view=True)
+        assert isinstance(view, SequenceView)
+        assert str(view) == "GCGTACGT"
+        assert view == seq.subseq(2, 10)
+        assert view._buf is seq.sequence
+        assert (view.start, view.end, view.strand) == (2, 10, "+")
+        assert isinstance(seq.subseq(2, 10), Sequence)
+
+    def test_matches_sequence(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            s = "".join(rng.choices("ACGTN", k=rng.randint(0, 30)))
+            seq = Sequence(s)
+            start = rng.randint(-5, len(s))
+            end = rng.choice([None, rng.randint(0, len(s) + 3)])
+            view = seq.subseq(start, end, view=True)
+            copy = Sequence(s[start: end])
+            assert len(view) == len(copy)
+            assert view.gc_content() == copy.gc_content()
+            assert view.at_content(percent=True) == (
+                copy.at_content(percent=True)
+            )
+            assert view.count("G") == copy.count("G")
+            assert [view[i] for i in range(len(view))] == list(str(copy))
+            rc = view.reverse_complement()
+            assert str(rc) == str(copy.reverse_complement())
+            assert rc.count("A") == copy.reverse_complement().count("A")
+            assert [rc[i] for i in range(len(rc))] == list(
+                str(copy.reverse_complement())
+            )
+            assert str(rc.reverse_complement()) == str(copy)
+
+    def test_nested_views(self):
+        seq = Sequence("AAACCCGGGTTT")
+        view = seq.subseq(2, 10, view=True)
+        inner = view.subseq(1, 5)
+        assert str(inner) == "CCCG"
+        assert (inner.start, inner.end) == (3, 7)
+        rc_inner = view.reverse_complement().subseq(1, 4)
+        assert str(rc_inner) == str(view.reverse_complement())[1:4]
+        assert rc_inner.strand == "-"
+        assert view[1:4] == "CCC"
+        assert view[::2] == str(view)[::2]
+
+    def test_contains_matches_sequence(self):
+        seq = Sequence("ACGTTT")
+        view = seq.subseq(0, 6, view=True)
+        rc = view.reverse_complement()
+        for item in ("acg", "ACG", "AAA", "aaa"):
+            assert (item in view) == (item in seq)
+            assert (item in rc) == (item in seq.reverse_complement())
+
+    def test_read_only_api(self):
+        seq = Sequence("ATGAAATAG")
+        view = seq.subseq(0, 9, view=True)
+        assert "AAA" in view and "CCC" not in view
+        assert view.translate_nt(as_str=True) == "MK"
+        assert view.complement() == seq.complement()
+        assert view.transcribe() == seq.transcribe()
+        assert view.to_sequence() == seq
+        assert view.is_valid()
+        assert view.type == "DNA" and not view.strict
+        with pytest.raises(IndexError):
+            view[9]
+
+    def test_parent_mutation(self):
+        seq = Sequence("ACGTACGT")
+        view = seq.subseq(0, 4, view=True)
+        seq.sequence = "TTTT"
+        assert str(view) == "ACGT"
+
+    def test_seq_interval_view(self):
+        seq = Sequence("ATGCGTACGTTAGC")
+        plus = SeqInterval(2, 6, strand="+")
+        minus = SeqInterval(2, 6, strand="-")
+        assert str(plus.view(seq)) == "GCGT"
+        assert str(minus.view(seq)) == "ACGC"
+        with pytest.raises(ValueError):
+            SeqInterval(2, 20).view(seq)
+        with pytest.raises(TypeError):
+            plus.view("ATGC")
+
+    def test_invalid_input(self):
+        seq = Sequence("ACGT")
+        with pytest.raises(TypeError):
+            SequenceView("ACGT")
+        with pytest.raises(TypeError):
+            SequenceView(seq, "1")
+        with pytest.raises(ValueError):
+            SequenceView(seq, strand="x")